@@ -265,9 +265,11 @@ class ManimConfig(MutableMapping):
         "dry_run",
         "enable_wireframe",
         "ffmpeg_loglevel",
+        "ffmpeg_threads",
         "format",
         "flush_cache",
         "frame_height",
+        "frame_processes",
         "frame_rate",
         "frame_width",
         "frame_x_radius",
@@ -275,6 +277,7 @@ class ManimConfig(MutableMapping):
         "from_animation_number",
         "images_dir",
         "input_file",
+        "jobs",
         "media_embed",
         "media_width",
         "log_dir",
@@ -291,12 +294,16 @@ class ManimConfig(MutableMapping):
         "preview",
         "progress_bar",
         "quality",
+        "render_cache_dir",
+        "max_render_cache_size",
         "save_as_gif",
         "save_sections",
         "save_last_frame",
         "save_pngs",
         "scene_names",
+        "stream_to_movie",
         "show_in_file_browser",
+        "svg_cache_dir",
         "tex_dir",
         "tex_template",
         "tex_template_file",
@@ -577,6 +584,7 @@ class ManimConfig(MutableMapping):
             "save_pngs",
             "save_as_gif",
             "save_sections",
+            "stream_to_movie",
             "preview",
             "show_in_file_browser",
             "log_to_file",
@@ -599,6 +607,9 @@ class ManimConfig(MutableMapping):
             "from_animation_number",
             "upto_animation_number",
             "max_files_cached",
+            "max_render_cache_size",
+            "frame_processes",
+            "jobs",
             # the next two must be set BEFORE digesting frame_width and frame_height
             "pixel_height",
             "pixel_width",
@@ -618,7 +629,9 @@ class ManimConfig(MutableMapping):
             "images_dir",
             "text_dir",
             "tex_dir",
+            "svg_cache_dir",
             "partial_movie_dir",
+            "render_cache_dir",
             "input_file",
             "output_file",
             "movie_file_extension",
@@ -676,6 +689,8 @@ class ManimConfig(MutableMapping):
         if val:
             self.ffmpeg_loglevel = val
 
+        self.ffmpeg_threads = parser["ffmpeg"].getint("threads", fallback=0)
+
         try:
             val = parser["jupyter"].getboolean("media_embed")
         except ValueError:
@@ -747,8 +762,10 @@ class ManimConfig(MutableMapping):
             "save_pngs",
             "save_as_gif",
             "save_sections",
+            "stream_to_movie",
             "write_all",
             "disable_caching",
+            "render_cache_dir",
             "format",
             "flush_cache",
             "progress_bar",
@@ -762,6 +779,8 @@ class ManimConfig(MutableMapping):
             "use_projection_fill_shaders",
             "use_projection_stroke_shaders",
             "zero_pad",
+            "frame_processes",
+            "jobs",
             "enable_wireframe",
             "force_window",
             "dry_run",
@@ -823,6 +842,7 @@ class ManimConfig(MutableMapping):
                 "images_dir",
                 "text_dir",
                 "tex_dir",
+                "svg_cache_dir",
                 "log_dir",
                 "partial_movie_dir",
             ]:
@@ -986,6 +1006,18 @@ class ManimConfig(MutableMapping):
     def save_sections(self, value: bool) -> None:
         self._set_boolean("save_sections", value)
 
+    @property
+    def stream_to_movie(self) -> bool:
+        """Whether to write the animations straight into the movie file instead
+        of concatenating the partial movie files at the end. Ignored for GIFs
+        and when saving sections.
+        """
+        return self._d["stream_to_movie"]
+
+    @stream_to_movie.setter
+    def stream_to_movie(self, value: bool) -> None:
+        self._set_boolean("stream_to_movie", value)
+
     @property
     def enable_wireframe(self) -> bool:
         """Whether to enable wireframe debugging mode in opengl."""
@@ -1067,6 +1099,15 @@ class ManimConfig(MutableMapping):
         )
         logging.getLogger("libav").setLevel(self.ffmpeg_loglevel)
 
+    @property
+    def ffmpeg_threads(self) -> int:
+        """Number of threads used by the video encoder, 0 lets it decide (no flag)."""
+        return self._d["ffmpeg_threads"]
+
+    @ffmpeg_threads.setter
+    def ffmpeg_threads(self, value: int) -> None:
+        self._set_pos_number("ffmpeg_threads", value, False)
+
     @property
     def media_embed(self) -> bool:
         """Whether to embed videos in Jupyter notebook."""
@@ -1214,6 +1255,40 @@ class ManimConfig(MutableMapping):
     def max_files_cached(self, value: int) -> None:
         self._set_pos_number("max_files_cached", value, True)
 
+    @property
+    def frame_processes(self) -> int:
+        """Number of processes rendering the frames of an animation (--frame_processes).
+
+        Values of 0 or 1 render every frame in the main process.
+        """
+        return self._d["frame_processes"]
+
+    @frame_processes.setter
+    def frame_processes(self, value: int) -> None:
+        self._set_pos_number("frame_processes", value, False)
+
+    @property
+    def jobs(self) -> int:
+        """Number of processes rendering the scenes of a file (-j).
+
+        When a single scene is rendered, the processes are used to render the
+        frames of its animations instead, see :attr:`frame_processes`.
+        """
+        return self._d["jobs"]
+
+    @jobs.setter
+    def jobs(self, value: int) -> None:
+        self._set_pos_number("jobs", value, False)
+
+    @property
+    def max_render_cache_size(self) -> int:
+        """Maximum size of the render cache in megabytes.  Use -1 for infinity (no flag)."""
+        return self._d["max_render_cache_size"]
+
+    @max_render_cache_size.setter
+    def max_render_cache_size(self, value: int) -> None:
+        self._set_pos_number("max_render_cache_size", value, True)
+
     @property
     def window_monitor(self) -> int:
         """The monitor on which the scene will be rendered."""
@@ -1612,10 +1687,12 @@ class ManimConfig(MutableMapping):
             "images_dir",
             "text_dir",
             "tex_dir",
+            "svg_cache_dir",
             "log_dir",
             "input_file",
             "output_file",
             "partial_movie_dir",
+            "render_cache_dir",
         ]
         if key not in dirs:
             raise KeyError(
@@ -1693,6 +1770,19 @@ class ManimConfig(MutableMapping):
     def images_dir(self, value: str | Path) -> None:
         self._set_dir("images_dir", value)
 
+    @property
+    def render_cache_dir(self) -> str:
+        """Directory of the render cache shared between scenes (--render_cache_dir).
+
+        Leave it empty to only cache partial movie files per scene.  See
+        :class:`.RenderCache` and :meth:`ManimConfig.get_dir`.
+        """
+        return self._d["render_cache_dir"]
+
+    @render_cache_dir.setter
+    def render_cache_dir(self, value: str | Path) -> None:
+        self._set_dir("render_cache_dir", value)
+
     @property
     def text_dir(self) -> str:
         """Directory to place text (no flag).  See :meth:`ManimConfig.get_dir`."""
@@ -1711,6 +1801,19 @@ class ManimConfig(MutableMapping):
     def tex_dir(self, value: str | Path) -> None:
         self._set_dir("tex_dir", value)
 
+    @property
+    def svg_cache_dir(self) -> str:
+        """Directory to place the mobjects generated from SVG files (no flag).
+
+        Leave it empty to disable the on-disk cache of :class:`.SVGMobject`.
+        See :meth:`ManimConfig.get_dir`.
+        """
+        return self._d["svg_cache_dir"]
+
+    @svg_cache_dir.setter
+    def svg_cache_dir(self, value: str | Path) -> None:
+        self._set_dir("svg_cache_dir", value)
+
     @property
     def partial_movie_dir(self) -> str:
         """Directory to place partial movie files (no flag).  See :meth:`ManimConfig.get_dir`."""
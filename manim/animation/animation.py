@@ -109,6 +109,11 @@ class Animation:
 
     """
 
+    #: Whether each frame of the animation only depends on its ``alpha``, and
+    #: not on the frames interpolated before it. Only such animations can be
+    #: rendered in parallel, see :meth:`.CairoRenderer.can_render_in_parallel`.
+    is_frame_independent = False
+
     def __new__(
         cls,
         mobject=None,
@@ -591,6 +596,8 @@ class Wait(Animation):
         Keyword arguments to be passed to the parent class, :class:`.Animation`.
     """
 
+    is_frame_independent = True
+
     def __init__(
         self,
         run_time: float = 1,
@@ -157,6 +157,10 @@ class AnimationGroup(Animation):
         self.anims_with_timings["start"][1:] = np.add.accumulate(lags)
         self.anims_with_timings["end"] = self.anims_with_timings["start"] + run_times
 
+    @property
+    def is_frame_independent(self) -> bool:
+        return all(anim.is_frame_independent for anim in self.animations)
+
     def interpolate(self, alpha: float) -> None:
         # Note, if the run_time of AnimationGroup has been
         # set to something other than its default, these
@@ -226,6 +230,8 @@ class Succession(AnimationGroup):
                 ))
     """
 
+    is_frame_independent = False
+
     def __init__(self, *animations: Animation, lag_ratio: float = 1, **kwargs) -> None:
         super().__init__(*animations, lag_ratio=lag_ratio, **kwargs)
 
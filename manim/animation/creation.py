@@ -113,6 +113,8 @@ class ShowPartial(Animation):
 
     """
 
+    is_frame_independent = True
+
     def __init__(
         self,
         mobject: VMobject | OpenGLVMobject | OpenGLSurface | None,
@@ -222,6 +224,8 @@ class DrawBorderThenFill(Animation):
                 self.play(DrawBorderThenFill(Square(fill_opacity=1, fill_color=ORANGE)))
     """
 
+    is_frame_independent = True
+
     def __init__(
         self,
         vmobject: VMobject | OpenGLVMobject,
@@ -452,6 +456,8 @@ class SpiralIn(Animation):
                 self.play(SpiralIn(shapes))
     """
 
+    is_frame_independent = True
+
     def __init__(
         self,
         shapes: Mobject,
@@ -509,6 +515,8 @@ class ShowIncreasingSubsets(Animation):
                 self.wait()
     """
 
+    is_frame_independent = True
+
     def __init__(
         self,
         group: Mobject,
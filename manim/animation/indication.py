@@ -505,6 +505,8 @@ class Wiggle(Animation):
 
     """
 
+    is_frame_independent = True
+
     def __init__(
         self,
         mobject: Mobject,
@@ -539,7 +541,7 @@ class Wiggle(Animation):
         starting_submobject: Mobject,
         alpha: float,
     ) -> None:
-        submobject.points[:, :] = starting_submobject.points
+        submobject.points = np.array(starting_submobject.points)
         submobject.scale(
             interpolate(1, self.scale_value, there_and_back(alpha)),
             about_point=self.get_scale_about_point(),
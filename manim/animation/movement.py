@@ -46,6 +46,8 @@ class Homotopy(Animation):
         Further keyword arguments passed to the parent class.
     """
 
+    is_frame_independent = True
+
     def __init__(
         self,
         homotopy: Callable[[float, float, float, float], tuple[float, float, float]],
@@ -147,6 +149,8 @@ class MoveAlongPath(Animation):
                 self.play(MoveAlongPath(d1, l1), rate_func=linear)
     """
 
+    is_frame_independent = True
+
     def __init__(
         self,
         mobject: Mobject,
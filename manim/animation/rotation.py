@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 
 class Rotating(Animation):
+    is_frame_independent = True
+
     def __init__(
         self,
         mobject: Mobject,
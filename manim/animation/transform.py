@@ -125,6 +125,8 @@ class Transform(Animation):
                 self.wait()
     """
 
+    is_frame_independent = True
+
     def __init__(
         self,
         mobject: Mobject | None,
@@ -8,6 +8,7 @@ import copy
 import itertools as it
 import operator as op
 import pathlib
+import weakref
 from collections.abc import Iterable
 from functools import reduce
 from typing import Any, Callable
@@ -20,6 +21,7 @@ from scipy.spatial.distance import pdist
 from .. import config, logger
 from ..constants import *
 from ..mobject.mobject import Mobject
+from ..mobject.three_d.three_dimensions import MeshSurface
 from ..mobject.types.image_mobject import AbstractImageMobject
 from ..mobject.types.point_cloud_mobject import PMobject
 from ..mobject.types.vectorized_mobject import VMobject
@@ -67,6 +69,33 @@ class Camera:
         to be set.
     """
 
+    #: Whether :meth:`redraw_damaged_region` may only redraw the region of
+    #: the frame covered by the mobjects. Cameras which draw mobjects elsewhere
+    #: than their points, or which keep frames of their own, disable it.
+    track_damaged_regions = True
+
+    #: Whether :meth:`get_mobjects_to_display` may leave out the mobjects
+    #: whose bounding box is outside of the frame. Cameras which draw mobjects
+    #: elsewhere than their points disable it.
+    cull_mobjects_outside_frame = True
+
+    #: Whether the points drawn for a VMobject only depend on its points, so
+    #: that :meth:`set_cairo_context_path` may replay the cached path of a
+    #: VMobject whose points were not assigned since. Cameras which transform
+    #: the points depending on their own state disable it.
+    reuse_cairo_paths_of_unchanged_points = True
+
+    #: Whether :meth:`set_cairo_context_path` may also replay the cached path
+    #: of a VMobject whose points were moved by an affine transformation,
+    #: found by :meth:`get_cairo_path_transformation`. The fit costs about as
+    #: much as building a small path again, and is wasted on morphing
+    #: mobjects, hence it is off by default.
+    fit_cairo_paths_to_moved_points = False
+
+    #: The maximum number of pixels splatted at once by
+    #: :meth:`display_multiple_point_cloud_mobjects`.
+    max_point_cloud_batch_size = 2**22
+
     def __init__(
         self,
         background_image: str | None = None,
@@ -130,6 +159,21 @@ class Camera:
 
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        # The last path drawn for each VMobject, along with the version of
+        # the points of the VMobject and the 2D points it was built from, see
+        # set_cairo_context_path.
+        self.vmobject_to_cairo_path: weakref.WeakKeyDictionary[
+            VMobject, tuple[int, np.ndarray, cairo.Path]
+        ] = weakref.WeakKeyDictionary()
+        # The gradients last used to color each VMobject, keyed by their
+        # color stops, see set_cairo_context_color.
+        self.vmobject_to_cairo_sources: weakref.WeakKeyDictionary[
+            VMobject, dict[bytes, tuple[np.ndarray, cairo.LinearGradient]]
+        ] = weakref.WeakKeyDictionary()
+        # The region of the pixel array drawn over since it was last reset
+        # to damaged_region_background, see redraw_damaged_region.
+        self.damaged_region: tuple[int, int, int, int] | None = None
+        self.damaged_region_background: np.ndarray | None = None
 
         # Contains the correct method to process a list of Mobjects of the
         # corresponding class.  If a Mobject is not an instance of a class in
@@ -196,6 +240,7 @@ class Camera:
             VMobject: self.display_multiple_vectorized_mobjects,
             PMobject: self.display_multiple_point_cloud_mobjects,
             AbstractImageMobject: self.display_multiple_image_mobjects,
+            MeshSurface: self.display_multiple_mesh_surfaces,
             Mobject: lambda batch, pa: batch,  # Do nothing
         }
         # We have to check each type in turn because we are dealing with
@@ -341,6 +386,7 @@ class Camera:
         else:
             # Set in place
             self.pixel_array[:, :, :] = converted_array[:, :, :]
+        self.damaged_region = None
 
     def set_background(
         self, pixel_array: np.ndarray | list | tuple, convert_from_floats: bool = False
@@ -415,6 +461,117 @@ class Camera:
     def set_frame_to_background(self, background):
         self.set_pixel_array(background)
 
+    def get_damaged_region(
+        self, mobjects: Iterable[Mobject]
+    ) -> tuple[int, int, int, int]:
+        """Return the region of the frame the passed mobjects are drawn in.
+
+        Parameters
+        ----------
+        mobjects
+            The mobjects to display, without their submobjects, see
+            :meth:`get_mobjects_to_display`.
+
+        Returns
+        -------
+        tuple[int, int, int, int]
+            The ``(left, top, right, bottom)`` pixel bounds of the region,
+            clipped to the frame. The region is empty if ``right <= left``.
+        """
+        left, top = self.pixel_width, self.pixel_height
+        right, bottom = 0, 0
+        for mobject in mobjects:
+            points = mobject.get_points()
+            if len(points) == 0:
+                continue
+            pixel_coords = self.points_to_pixel_coords(mobject, points)
+            margin = self.get_drawing_margin(mobject)
+            x_min, y_min = pixel_coords.min(axis=0) - margin
+            x_max, y_max = pixel_coords.max(axis=0) + margin
+            left, top = min(left, x_min), min(top, y_min)
+            right, bottom = max(right, x_max), max(bottom, y_max)
+        return (
+            max(int(left), 0),
+            max(int(top), 0),
+            min(int(right), self.pixel_width),
+            min(int(bottom), self.pixel_height),
+        )
+
+    def get_drawing_margin(self, mobject: Mobject) -> float:
+        """Return how far, in pixels, a mobject may be drawn outside of the
+        bounding box of its points.
+
+        Parameters
+        ----------
+        mobject
+            The mobject to display.
+        """
+        # Pixel coordinates are truncated, and edges are antialiased.
+        margin = 2
+        if isinstance(mobject, VMobject):
+            line_width = (
+                max(mobject.get_stroke_width(), mobject.get_stroke_width(True))
+                * self.cairo_line_width_multiple
+                * self.pixel_width
+                / self.frame_width
+            )
+            # Miter joints stick out by up to half the miter limit of cairo,
+            # which is 10, times the line width.
+            margin += 5 * line_width
+        elif isinstance(mobject, PMobject):
+            margin += self.adjusted_thickness(mobject.stroke_width)
+        elif isinstance(mobject, MeshSurface):
+            margin += (
+                mobject.get_stroke_width()
+                * self.cairo_line_width_multiple
+                * self.pixel_width
+                / self.frame_width
+            )
+        return margin
+
+    def redraw_damaged_region(
+        self, background: np.ndarray, mobjects: Iterable[Mobject], **kwargs: Any
+    ) -> None:
+        """Reset the frame to ``background`` and capture ``mobjects``.
+
+        This is equivalent to :meth:`set_frame_to_background` followed by
+        :meth:`capture_mobjects`, except that when the frame was last reset to
+        the same background, only the region where the mobjects of the previous
+        and of the current frame are drawn is reset. When a few small mobjects
+        move over a static image, resetting the whole frame is most of the cost
+        of rendering it.
+
+        Parameters
+        ----------
+        background
+            The pixel array to reset the frame to, for instance the static
+            image of the scene.
+        mobjects
+            Mobjects to capture.
+        kwargs
+            Keyword arguments to be passed to :meth:`get_mobjects_to_display`.
+        """
+        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
+        region = self.get_damaged_region(mobjects)
+        if (
+            self.damaged_region is None
+            or self.damaged_region_background is not background
+            or background.shape != self.pixel_array.shape
+        ):
+            self.set_frame_to_background(background)
+        else:
+            # The union of the regions; an empty region is the identity.
+            left = min(region[0], self.damaged_region[0])
+            top = min(region[1], self.damaged_region[1])
+            right = max(region[2], self.damaged_region[2])
+            bottom = max(region[3], self.damaged_region[3])
+            self.pixel_array[top:bottom, left:right] = background[
+                top:bottom, left:right
+            ]
+        self.capture_mobjects(mobjects, include_submobjects=False)
+        self.damaged_region = region
+        self.damaged_region_background = background
+
     ####
 
     def get_mobjects_to_display(
@@ -441,19 +598,134 @@ class Camera:
             list of mobjects
         """
         if include_submobjects:
-            mobjects = extract_mobject_family_members(
-                mobjects,
-                use_z_index=self.use_z_index,
-                only_those_with_points=True,
+            mobjects = list(mobjects)
+            family_members = self.get_family_members_to_display(
+                mobjects, excluded_mobjects
             )
-            if excluded_mobjects:
-                all_excluded = extract_mobject_family_members(
-                    excluded_mobjects,
-                    use_z_index=self.use_z_index,
-                )
-                mobjects = list_difference_update(mobjects, all_excluded)
+            return self.cull_mobjects(family_members, mobjects)
         return list(mobjects)
 
+    def get_family_members_to_display(
+        self,
+        mobjects: Iterable[Mobject],
+        excluded_mobjects: list | None = None,
+    ) -> list[Mobject]:
+        """Returns the family members with points of the mobjects, in the
+        order they are displayed in, see :meth:`get_mobjects_to_display`.
+
+        Parameters
+        ----------
+        mobjects
+            The Mobjects
+        excluded_mobjects
+            Any mobjects to exclude, by default None
+
+        Returns
+        -------
+        list
+            list of mobjects
+        """
+        mobjects = extract_mobject_family_members(
+            mobjects,
+            use_z_index=self.use_z_index,
+            only_those_with_points=True,
+        )
+        if excluded_mobjects:
+            all_excluded = extract_mobject_family_members(
+                excluded_mobjects,
+                use_z_index=self.use_z_index,
+            )
+            mobjects = list_difference_update(mobjects, all_excluded)
+        return mobjects
+
+    def cull_mobjects(
+        self, mobjects: Iterable[Mobject], roots: Iterable[Mobject]
+    ) -> list[Mobject]:
+        """Leaves out the mobjects outside of the frame, unless
+        :attr:`cull_mobjects_outside_frame` is disabled.
+
+        Parameters
+        ----------
+        mobjects
+            The family members to display.
+        roots
+            The mobjects whose families contain ``mobjects``, see
+            :meth:`add_mobjects_outside_frame`.
+
+        Returns
+        -------
+        list
+            The mobjects which may be drawn in the frame, in the same order.
+        """
+        mobjects = list(mobjects)
+        if not self.cull_mobjects_outside_frame:
+            return mobjects
+        culled = set()
+        for root in roots:
+            self.add_mobjects_outside_frame(root, culled)
+        if not culled:
+            return mobjects
+        num_mobjects = len(mobjects)
+        mobjects = [mob for mob in mobjects if mob not in culled]
+        logger.debug(
+            f"Culled {num_mobjects - len(mobjects)} of {num_mobjects} "
+            "mobjects outside of the frame",
+        )
+        return mobjects
+
+    def add_mobjects_outside_frame(self, mobject: Mobject, culled: set[Mobject]):
+        """Adds the family members of a mobject which are entirely outside of
+        the frame to ``culled``.
+
+        The cached bounding box of the whole family is checked first, so the
+        submobjects of a family outside of the frame are not visited.
+
+        Parameters
+        ----------
+        mobject
+            The mobject whose family should be checked.
+        culled
+            The set of mobjects to leave out.
+        """
+        box = mobject.get_bounding_box()
+        if box is None:
+            return
+        if not self.is_box_in_frame(box, 0):
+            family = mobject.get_family()
+            margin = max(self.get_drawing_margin(mob) for mob in family)
+            if not self.is_box_in_frame(box, margin):
+                culled.update(family)
+                return
+        for submobject in mobject.submobjects:
+            self.add_mobjects_outside_frame(submobject, culled)
+
+    def is_box_in_frame(self, box: np.ndarray, margin: float) -> bool:
+        """Checks whether a bounding box overlaps the frame.
+
+        Parameters
+        ----------
+        box
+            The minimum and maximum coordinates, see
+            :meth:`~.Mobject.get_bounding_box`.
+        margin
+            How far, in pixels, the box may be drawn outside of itself,
+            see :meth:`get_drawing_margin`.
+
+        Returns
+        -------
+        bool
+            True if the box, grown by the margin, overlaps the frame.
+        """
+        fc = self.frame_center
+        margin_x = margin * self.frame_width / self.pixel_width
+        margin_y = margin * self.frame_height / self.pixel_height
+        return not (
+            box[1][0] + margin_x < fc[0] - self.frame_width / 2
+            or box[0][0] - margin_x > fc[0] + self.frame_width / 2
+            or box[1][1] + margin_y < fc[1] - self.frame_height / 2
+            or box[0][1] - margin_y > fc[1] + self.frame_height / 2
+        )
+
     def is_in_frame(self, mobject: Mobject):
         """Checks whether the passed mobject is in
         frame or not.
@@ -523,6 +795,8 @@ class Camera:
         # VMobject], [PMobject, PMobject], and [VMobject].  This must be done
         # without altering their order.  it.groupby computes exactly this
         # partition while at the same time preserving order.
+        # The mobjects may be drawn anywhere, see redraw_damaged_region.
+        self.damaged_region = None
         mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
         for group_type, group in it.groupby(mobjects, self.type_or_raise):
             self.display_funcs[group_type](list(group), self.pixel_array)
@@ -581,9 +855,6 @@ class Camera:
             return cached_ctx
         pw = self.pixel_width
         ph = self.pixel_height
-        fw = self.frame_width
-        fh = self.frame_height
-        fc = self.frame_center
         surface = cairo.ImageSurface.create_for_data(
             pixel_array,
             cairo.FORMAT_ARGB32,
@@ -592,19 +863,33 @@ class Camera:
         )
         ctx = cairo.Context(surface)
         ctx.scale(pw, ph)
-        ctx.set_matrix(
-            cairo.Matrix(
-                (pw / fw),
-                0,
-                0,
-                -(ph / fh),
-                (pw / 2) - fc[0] * (pw / fw),
-                (ph / 2) + fc[1] * (ph / fh),
-            ),
-        )
+        ctx.set_matrix(self.get_cairo_matrix())
         self.cache_cairo_context(pixel_array, ctx)
         return ctx
 
+    def get_cairo_matrix(self) -> cairo.Matrix:
+        """Returns the matrix mapping the frame onto the pixels, for the
+        current frame center and shape.
+
+        Returns
+        -------
+        cairo.Matrix
+            The transformation matrix of the cairo contexts.
+        """
+        pw = self.pixel_width
+        ph = self.pixel_height
+        fw = self.frame_width
+        fh = self.frame_height
+        fc = self.frame_center
+        return cairo.Matrix(
+            (pw / fw),
+            0,
+            0,
+            -(ph / fh),
+            (pw / 2) - fc[0] * (pw / fw),
+            (ph / 2) + fc[1] * (ph / fh),
+        )
+
     def display_multiple_vectorized_mobjects(
         self, vmobjects: list, pixel_array: np.ndarray
     ):
@@ -670,6 +955,13 @@ class Camera:
     def set_cairo_context_path(self, ctx: cairo.Context, vmobject: VMobject):
         """Sets a path for the cairo context with the vmobject passed
 
+        The path drawn last for the vmobject is replayed if its points were
+        not assigned since, or if the points drawn are unchanged, instead of
+        being built curve by curve again. If
+        :attr:`fit_cairo_paths_to_moved_points` is set, it is also replayed
+        if the points were only moved by an affine transformation (e.g.
+        shifted, rotated or scaled).
+
         Parameters
         ----------
         ctx
@@ -682,13 +974,120 @@ class Camera:
         Camera
             Camera object after setting cairo_context_path
         """
-        points = self.transform_points_pre_display(vmobject, vmobject.points)
+        version = vmobject._points_version
+        cached = self.vmobject_to_cairo_path.get(vmobject)
+        if (
+            cached is not None
+            and cached[0] == version
+            and self.reuse_cairo_paths_of_unchanged_points
+        ):
+            ctx.new_path()
+            ctx.append_path(cached[2])
+            return self
+
+        points = self.get_path_points(vmobject)
         # TODO, shouldn't this be handled in transform_points_pre_display?
         # points = points - self.get_frame_center()
         if len(points) == 0:
             return
 
         ctx.new_path()
+        if cached is not None:
+            _, cached_points, path = cached
+            if np.array_equal(cached_points, points[:, :2]):
+                ctx.append_path(path)
+                self.vmobject_to_cairo_path[vmobject] = (version, cached_points, path)
+                return self
+            if self.fit_cairo_paths_to_moved_points:
+                matrix = self.get_cairo_path_transformation(
+                    cached_points, points, vmobject.tolerance_for_point_equality
+                )
+                if matrix is not None:
+                    # The path is kept in device space, so the line widths
+                    # and gradients set afterwards are not affected by the
+                    # matrix. The cached entry still holds the points the
+                    # path was built from.
+                    ctx_matrix = ctx.get_matrix()
+                    ctx.transform(matrix)
+                    ctx.append_path(path)
+                    ctx.set_matrix(ctx_matrix)
+                    return self
+
+        self.build_cairo_context_path(ctx, vmobject, points)
+        self.vmobject_to_cairo_path[vmobject] = (
+            version,
+            points[:, :2].copy(),
+            ctx.copy_path(),
+        )
+        return self
+
+    def get_path_points(self, vmobject: VMobject) -> np.ndarray:
+        """Returns the points of the path drawn for the vmobject, see
+        :meth:`set_cairo_context_path`.
+
+        Parameters
+        ----------
+        vmobject
+            The VMobject
+
+        Returns
+        -------
+        np.ndarray
+            The points of the VMobject, transformed for display.
+        """
+        return self.transform_points_pre_display(vmobject, vmobject.get_points())
+
+    @staticmethod
+    def get_cairo_path_transformation(
+        old_points: np.ndarray, new_points: np.ndarray, tolerance: float
+    ) -> cairo.Matrix | None:
+        """Returns the affine transformation mapping the points a path was
+        built from onto new points, if there is one.
+
+        Parameters
+        ----------
+        old_points
+            The 2D points the path was built from.
+        new_points
+            The points to draw now, only their first two coordinates are used.
+        tolerance
+            How far the transformed points may be from the new ones.
+
+        Returns
+        -------
+        cairo.Matrix | None
+            The transformation, or ``None`` if the path has to be rebuilt.
+        """
+        if len(old_points) != len(new_points):
+            return None
+        new_points = new_points[:, :2]
+        # Solve new_points = [old_points, 1] @ coefficients
+        homogeneous = np.column_stack([old_points, np.ones(len(old_points))])
+        coefficients = np.linalg.lstsq(homogeneous, new_points, rcond=None)[0]
+        (xx, yx), (xy, yy), (x0, y0) = coefficients
+        # A path cannot be drawn under a singular matrix, and points on a
+        # line do not determine the transformation.
+        if abs(xx * yy - xy * yx) < 1e-8:
+            return None
+        transformed_points = homogeneous @ coefficients
+        if not np.allclose(transformed_points, new_points, rtol=0, atol=tolerance):
+            return None
+        return cairo.Matrix(xx, yx, xy, yy, x0, y0)
+
+    def build_cairo_context_path(
+        self, ctx: cairo.Context, vmobject: VMobject, points: np.ndarray
+    ):
+        """Builds the path of the vmobject in the cairo context, curve by curve.
+
+        Parameters
+        ----------
+        ctx
+            The cairo context
+        vmobject
+            The VMobject
+        points
+            The points of the VMobject, as transformed for display.
+        """
         subpaths = vmobject.gen_subpaths_from_points_2d(points)
         for subpath in subpaths:
             quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
@@ -699,13 +1098,16 @@ class Camera:
                 ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
             if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
                 ctx.close_path()
-        return self
 
     def set_cairo_context_color(
         self, ctx: cairo.Context, rgbas: np.ndarray, vmobject: VMobject
     ):
         """Sets the color of the cairo context
 
+        Gradients are reused for as long as the colors and the gradient
+        endpoints of the vmobject stay the same, so that the fill and stroke
+        passes of an unchanged vmobject do not build them again every frame.
+
         Parameters
         ----------
         ctx
@@ -727,11 +1129,24 @@ class Camera:
         else:
             points = vmobject.get_gradient_start_and_end_points()
             points = self.transform_points_pre_display(vmobject, points)
-            pat = cairo.LinearGradient(*it.chain(*(point[:2] for point in points)))
+            endpoints = np.array([point[:2] for point in points])
+            sources = self.vmobject_to_cairo_sources.setdefault(vmobject, {})
+            key = np.ascontiguousarray(rgbas).tobytes()
+            cached = sources.get(key)
+            if cached is not None and np.array_equal(cached[0], endpoints):
+                ctx.set_source(cached[1])
+                return self
+
+            pat = cairo.LinearGradient(*endpoints.flatten())
             step = 1.0 / (len(rgbas) - 1)
             offsets = np.arange(0, 1 + step, step)
             for rgba, offset in zip(rgbas, offsets):
                 pat.add_color_stop_rgba(offset, *rgba[2::-1], rgba[3])
+            # One gradient for each of the fill, stroke and background
+            # stroke is enough, older colors are not drawn again.
+            if len(sources) >= 3 and key not in sources:
+                sources.clear()
+            sources[key] = (endpoints, pat)
             ctx.set_source(pat)
         return self
 
@@ -867,6 +1282,86 @@ class Camera:
         self.overlay_rgba_array(pixel_array, cvmobject_pixel_array)
         return self
 
+    def display_multiple_mesh_surfaces(
+        self, meshes: list[MeshSurface], pixel_array: np.ndarray
+    ):
+        """Displays multiple MeshSurfaces in the pixel_array
+
+        Parameters
+        ----------
+        meshes
+            list of MeshSurfaces to display
+        pixel_array
+            The pixel array
+        """
+        ctx = self.get_cairo_context(pixel_array)
+        for mesh in meshes:
+            self.display_mesh_surface(mesh, ctx)
+
+    def display_mesh_surface(self, mesh: MeshSurface, ctx: cairo.Context):
+        """Displays the faces of a MeshSurface in the cairo context.
+
+        The corners and colors of all faces are computed at once, so only
+        the cairo calls remain per face.
+
+        Parameters
+        ----------
+        mesh
+            The MeshSurface to display
+        ctx
+            The cairo context to use.
+
+        Returns
+        -------
+        Camera
+            The camera object
+        """
+        if mesh.get_num_faces() == 0:
+            return self
+        points = self.transform_points_pre_display(mesh, mesh.get_points())
+        corners = points[mesh.faces][:, :, :2].tolist()
+        # cairo surfaces encode colors in reverse order
+        fill_rgbas = self.get_mesh_fill_rgbas(mesh)[:, [2, 1, 0, 3]].tolist()
+        stroke_rgbas = self.get_mesh_stroke_rgbas(mesh)[:, [2, 1, 0, 3]].tolist()
+        width = mesh.get_stroke_width() * self.cairo_line_width_multiple
+        ctx.set_line_width(width)
+        for index in self.get_mesh_face_order(mesh, points).tolist():
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = corners[index]
+            ctx.new_path()
+            ctx.move_to(x0, y0)
+            ctx.line_to(x1, y1)
+            ctx.line_to(x2, y2)
+            ctx.line_to(x3, y3)
+            ctx.close_path()
+            ctx.set_source_rgba(*fill_rgbas[index])
+            ctx.fill_preserve()
+            if width > 0:
+                ctx.set_source_rgba(*stroke_rgbas[index])
+                ctx.stroke_preserve()
+        ctx.new_path()
+        return self
+
+    def get_mesh_fill_rgbas(self, mesh: MeshSurface) -> np.ndarray:
+        """Returns the RGBA array of the fill of the faces of a MeshSurface."""
+        return mesh.fill_rgbas
+
+    def get_mesh_stroke_rgbas(self, mesh: MeshSurface) -> np.ndarray:
+        """Returns the RGBA array of the stroke of the faces of a MeshSurface."""
+        return mesh.stroke_rgbas
+
+    def get_mesh_face_order(self, mesh: MeshSurface, points: np.ndarray) -> np.ndarray:
+        """Returns the indices of the faces of a MeshSurface in the order
+        in which they are drawn.
+
+        Parameters
+        ----------
+        mesh
+            The MeshSurface
+        points
+            The vertices of the mesh, as transformed for display.
+        """
+        return np.arange(mesh.get_num_faces())
+
     # Methods for other rendering
 
     # NOTE: Out of the following methods, only `transform_points_pre_display` and `points_to_pixel_coords` have been mentioned outside of their definitions.
@@ -877,6 +1372,10 @@ class Camera:
     ):
         """Displays multiple PMobjects by modifying the passed pixel array.
 
+        The points of all the PMobjects are splatted onto the pixel array
+        together, in batches of at most :attr:`max_point_cloud_batch_size`
+        pixels, see :meth:`splat_pixels`.
+
         Parameters
         ----------
         pmobjects
@@ -884,14 +1383,23 @@ class Camera:
         pixel_array
             The pixel array to modify.
         """
+        batch = []
+        batch_size = 0
         for pmobject in pmobjects:
-            self.display_point_cloud(
+            for indices, rgbas in self.get_point_cloud_splats(
                 pmobject,
-                pmobject.points,
+                pmobject.get_points(),
                 pmobject.rgbas,
                 self.adjusted_thickness(pmobject.stroke_width),
-                pixel_array,
-            )
+            ):
+                batch.append((indices, rgbas))
+                batch_size += len(indices)
+                if batch_size >= self.max_point_cloud_batch_size:
+                    self.splat_pixels(pixel_array, batch)
+                    batch = []
+                    batch_size = 0
+        if batch:
+            self.splat_pixels(pixel_array, batch)
 
     def display_point_cloud(
         self,
@@ -903,8 +1411,6 @@ class Camera:
     ):
         """Displays a PMobject by modifying the pixel array suitably.
 
-        TODO: Write a description for the rgbas argument.
-
         Parameters
         ----------
         pmobject
@@ -912,39 +1418,111 @@ class Camera:
         points
             The points to display in the point cloud mobject
         rgbas
-
+            The colors of the points, as RGBA values between 0 and 1.
         thickness
             The thickness of each point of the PMobject
         pixel_array
             The pixel array to modify.
 
         """
+        splats = list(self.get_point_cloud_splats(pmobject, points, rgbas, thickness))
+        if splats:
+            self.splat_pixels(pixel_array, splats)
+
+    def get_point_cloud_splats(
+        self,
+        pmobject: PMobject,
+        points: np.ndarray,
+        rgbas: np.ndarray,
+        thickness: float,
+    ) -> Iterable[tuple[np.ndarray, np.ndarray]]:
+        """Yields the pixels covered by the points of a PMobject, one nudge
+        of :meth:`get_thickening_nudges` at a time, so that the thickened
+        coordinates of all the points are never held at once.
+
+        Parameters
+        ----------
+        pmobject
+            Point Cloud Mobject
+        points
+            The points to display in the point cloud mobject
+        rgbas
+            The colors of the points, as RGBA values between 0 and 1.
+        thickness
+            The thickness of each point of the PMobject
+
+        Yields
+        ------
+        tuple[np.ndarray, np.ndarray]
+            The indices of the on-screen pixels in the flattened pixel array,
+            and the colors of the points drawn onto them.
+        """
         if len(points) == 0:
             return
         pixel_coords = self.points_to_pixel_coords(pmobject, points)
-        pixel_coords = self.thickened_coordinates(pixel_coords, thickness)
-        rgba_len = pixel_array.shape[2]
-
-        rgbas = (self.rgb_max_val * rgbas).astype(self.pixel_array_dtype)
-        target_len = len(pixel_coords)
-        factor = target_len // len(rgbas)
-        rgbas = np.array([rgbas] * factor).reshape((target_len, rgba_len))
-
-        on_screen_indices = self.on_screen_pixels(pixel_coords)
-        pixel_coords = pixel_coords[on_screen_indices]
-        rgbas = rgbas[on_screen_indices]
+        rgbas = np.resize(rgbas, (len(pixel_coords), rgbas.shape[1]))
+        for nudge in self.get_thickening_nudges(thickness):
+            nudged_coords = pixel_coords + nudge
+            on_screen_indices = self.on_screen_pixels(nudged_coords)
+            nudged_coords = nudged_coords[on_screen_indices]
+            indices = nudged_coords[:, 1] * self.pixel_width + nudged_coords[:, 0]
+            yield indices.astype(int), rgbas[on_screen_indices]
+
+    def splat_pixels(
+        self,
+        pixel_array: np.ndarray,
+        splats: list[tuple[np.ndarray, np.ndarray]],
+    ):
+        """Composites colors onto single pixels of the pixel array, in place.
 
-        ph = self.pixel_height
-        pw = self.pixel_width
+        The colors are alpha composited over the pixel array in order, as if
+        they were drawn one after the other, but all at once: the colors
+        drawn onto each pixel are gathered, and each is weighed by its alpha
+        times the transmittance of the colors drawn after it.
 
-        flattener = np.array([1, pw], dtype="int")
-        flattener = flattener.reshape((2, 1))
-        indices = np.dot(pixel_coords, flattener)[:, 0]
-        indices = indices.astype("int")
+        Parameters
+        ----------
+        pixel_array
+            The pixel array to modify.
+        splats
+            Pairs of indices of pixels in the flattened pixel array, and the
+            RGBA colors (between 0 and 1) to draw onto them.
+        """
+        indices = np.concatenate([indices for indices, _ in splats])
+        if len(indices) == 0:
+            return
+        rgbas = np.concatenate([rgbas for _, rgbas in splats])
+
+        order = np.argsort(indices, kind="stable")
+        indices = indices[order]
+        rgbas = rgbas[order]
+        starts = np.flatnonzero(np.r_[True, indices[1:] != indices[:-1]])
+        ends = np.r_[starts[1:], len(indices)] - 1
+        pixels = indices[starts]
+
+        # The transmittance of the colors drawn after each one onto the same
+        # pixel, computed in log space to avoid a loop over the pixels.
+        alphas = rgbas[:, 3]
+        log_transmittances = np.log(np.maximum(1 - alphas, 1e-12))
+        cumulative = np.cumsum(log_transmittances)
+        group_ids = np.repeat(np.arange(len(starts)), ends - starts + 1)
+        weights = alphas * np.exp(cumulative[ends][group_ids] - cumulative)
+        colors = np.add.reduceat(rgbas[:, :3] * weights[:, np.newaxis], starts)
+        transmittances = np.exp(
+            cumulative[ends] - np.r_[0, cumulative[:-1]][starts],
+        )
 
-        new_pa = pixel_array.reshape((ph * pw, rgba_len))
-        new_pa[indices] = rgbas
-        pixel_array[:, :] = new_pa.reshape((ph, pw, rgba_len))
+        rgba_len = pixel_array.shape[2]
+        flat_pixel_array = pixel_array.reshape((-1, rgba_len))
+        old_rgbas = flat_pixel_array[pixels].astype(float) / self.rgb_max_val
+        new_rgbas = np.empty_like(old_rgbas)
+        new_rgbas[:, :3] = old_rgbas[:, :3] * transmittances[:, np.newaxis] + colors
+        new_rgbas[:, 3] = 1 - (1 - old_rgbas[:, 3]) * transmittances
+        flat_pixel_array[pixels] = (self.rgb_max_val * new_rgbas).astype(
+            self.pixel_array_dtype
+        )
+        if not np.shares_memory(flat_pixel_array, pixel_array):
+            pixel_array[:, :] = flat_pixel_array.reshape(pixel_array.shape)
 
     def display_multiple_image_mobjects(
         self, image_mobjects: list, pixel_array: np.ndarray
@@ -973,7 +1551,9 @@ class Camera:
         pixel_array
             The Pixel array to put the imagemobject in.
         """
-        corner_coords = self.points_to_pixel_coords(image_mobject, image_mobject.points)
+        corner_coords = self.points_to_pixel_coords(
+            image_mobject, image_mobject.get_points()
+        )
         ul_coords, ur_coords, dl_coords, _ = corner_coords
         right_vect = ur_coords - ul_coords
         down_vect = dl_coords - ul_coords
@@ -1193,9 +1773,8 @@ class Camera:
             Array of thickened pixel coords.
         """
         nudges = self.get_thickening_nudges(thickness)
-        pixel_coords = np.array([pixel_coords + nudge for nudge in nudges])
-        size = pixel_coords.size
-        return pixel_coords.reshape((size // 2, 2))
+        pixel_coords = pixel_coords[np.newaxis] + nudges[:, np.newaxis]
+        return pixel_coords.reshape((-1, 2))
 
     # TODO, reimplement using cairo matrix
     def get_coords_of_all_pixels(self):
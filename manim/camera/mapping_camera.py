@@ -9,7 +9,6 @@ import math
 import numpy as np
 
 from ..camera.camera import Camera
-from ..mobject.types.vectorized_mobject import VMobject
 from ..utils.config_ops import DictAsObject
 
 # TODO: Add an attribute to mobjects under which they can specify that they should just
@@ -19,43 +18,67 @@ from ..utils.config_ops import DictAsObject
 class MappingCamera(Camera):
     """Camera object that allows mapping
     between objects.
+
+    Parameters
+    ----------
+    mapping_func
+        The function applied to the points before displaying them.
+    min_num_curves
+        VMobjects with fewer curves are drawn with this many more curves,
+        so that their curves follow the mapping.
+    allow_object_intrusion
+        Unused: the mobjects are never modified, their curves are only
+        subdivided for display.
+    vectorized
+        Whether ``mapping_func`` maps a whole ``(N, 3)`` array of points at
+        once, instead of a single point.
     """
 
+    # The mapped curves may leave the bounding box of their mapped points.
+    track_damaged_regions = False
+    # The mobjects are drawn where their points are mapped to.
+    cull_mobjects_outside_frame = False
+    # The points drawn also depend on the camera.
+    reuse_cairo_paths_of_unchanged_points = False
+
     def __init__(
         self,
         mapping_func=lambda p: p,
         min_num_curves=50,
         allow_object_intrusion=False,
+        vectorized=False,
         **kwargs,
     ):
         self.mapping_func = mapping_func
         self.min_num_curves = min_num_curves
         self.allow_object_intrusion = allow_object_intrusion
+        self.vectorized = vectorized
         super().__init__(**kwargs)
 
-    def points_to_pixel_coords(self, mobject, points):
-        return super().points_to_pixel_coords(
-            mobject,
-            np.apply_along_axis(self.mapping_func, 1, points),
-        )
-
-    def capture_mobjects(self, mobjects, **kwargs):
-        mobjects = self.get_mobjects_to_display(mobjects, **kwargs)
-        if self.allow_object_intrusion:
-            mobject_copies = mobjects
-        else:
-            mobject_copies = [mobject.copy() for mobject in mobjects]
-        for mobject in mobject_copies:
-            if (
-                isinstance(mobject, VMobject)
-                and 0 < mobject.get_num_curves() < self.min_num_curves
-            ):
-                mobject.insert_n_curves(self.min_num_curves)
-        super().capture_mobjects(
-            mobject_copies,
-            include_submobjects=False,
-            excluded_mobjects=None,
-        )
+    def map_points(self, points):
+        """Applies :attr:`mapping_func` to an array of points."""
+        if len(points) == 0:
+            return points
+        if self.vectorized:
+            return np.asarray(self.mapping_func(points))
+        return np.apply_along_axis(self.mapping_func, 1, points)
+
+    def transform_points_pre_display(self, mobject, points):
+        return self.map_points(super().transform_points_pre_display(mobject, points))
+
+    def get_path_points(self, vmobject):
+        # Instead of inserting curves into a copy of the vmobject, only the
+        # points drawn are subdivided.
+        points = vmobject.get_points()
+        if 0 < len(points) // vmobject.n_points_per_cubic_curve < self.min_num_curves:
+            new_points = vmobject.insert_n_curves_to_point_list(
+                self.min_num_curves, points
+            )
+            if len(points) % vmobject.n_points_per_cubic_curve == 1:
+                # Keep the point starting a new path, like insert_n_curves.
+                new_points = np.concatenate([new_points, points[-1:]])
+            points = new_points
+        return self.transform_points_pre_display(vmobject, points)
 
 
 # Note: This allows layering of multiple cameras onto the same portion of the pixel array,
@@ -67,6 +90,11 @@ class MappingCamera(Camera):
 
 # TODO, the classes below should likely be deleted
 class OldMultiCamera(Camera):
+    # The shifted cameras keep frames of their own.
+    track_damaged_regions = False
+    # The shifted cameras have frames of their own.
+    cull_mobjects_outside_frame = False
+
     def __init__(self, *cameras_with_start_positions, **kwargs):
         self.shifted_cameras = [
             DictAsObject(
@@ -128,24 +128,36 @@ class MovingCamera(Camera):
         # self.realign_frame_shape()
         super().capture_mobjects(mobjects, **kwargs)
 
-    # Since the frame can be moving around, the cairo
-    # context used for updating should be regenerated
-    # at each frame.  So no caching.
+    # Since the frame can be moving around, the matrix of the cached
+    # cairo contexts is updated at each frame.
     def get_cached_cairo_context(self, pixel_array):
         """
-        Since the frame can be moving around, the cairo
-        context used for updating should be regenerated
-        at each frame.  So no caching.
+        Returns the cached cairo context of the passed pixel array if
+        it exists, with its matrix updated to the current frame, and
+        None if it doesn't.
         """
-        return None
+        cached = self.pixel_array_to_cairo_context.get(id(pixel_array))
+        if cached is None:
+            return None
+        cached_pixel_array, ctx = cached
+        if cached_pixel_array is not pixel_array:
+            return None
+        ctx.set_matrix(self.get_cairo_matrix())
+        return ctx
 
     def cache_cairo_context(self, pixel_array, ctx):
         """
-        Since the frame can be moving around, the cairo
-        context used for updating should be regenerated
-        at each frame.  So no caching.
+        Caches the cairo context of the passed pixel array, along
+        with the array itself, since the pixel arrays are replaced
+        when the shape of the frame changes.
         """
-        pass
+        # Keep the contexts of the pixel arrays of the current shape only.
+        self.pixel_array_to_cairo_context = {
+            key: cached
+            for key, cached in self.pixel_array_to_cairo_context.items()
+            if cached[0].shape == pixel_array.shape
+        }
+        self.pixel_array_to_cairo_context[id(pixel_array)] = (pixel_array, ctx)
 
     # def reset_frame_center(self):
     #     self.frame_center = self.frame.get_center()
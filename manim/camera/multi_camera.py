@@ -8,12 +8,14 @@ __all__ = ["MultiCamera"]
 from manim.mobject.types.image_mobject import ImageMobject
 
 from ..camera.moving_camera import MovingCamera
-from ..utils.iterables import list_difference_update
 
 
 class MultiCamera(MovingCamera):
     """Camera Object that allows for multiple perspectives."""
 
+    # The cameras keep frames of their own, reset with this one.
+    track_damaged_regions = False
+
     def __init__(
         self,
         image_mobjects_from_cameras: ImageMobject | None = None,
@@ -54,17 +56,23 @@ class MultiCamera(MovingCamera):
         self.image_mobjects_from_cameras.append(imfc)
 
     def update_sub_cameras(self):
-        """Reshape sub_camera pixel_arrays"""
+        """Reshape sub_camera pixel_arrays, and reset them to their
+        background.
+        """
+        pixel_height, pixel_width = self.pixel_array.shape[:2]
         for imfc in self.image_mobjects_from_cameras:
-            pixel_height, pixel_width = self.pixel_array.shape[:2]
             imfc.camera.frame_shape = (
                 imfc.camera.frame.height,
                 imfc.camera.frame.width,
             )
-            imfc.camera.reset_pixel_shape(
-                int(pixel_height * imfc.height / self.frame_height),
-                int(pixel_width * imfc.width / self.frame_width),
-            )
+            new_height = int(pixel_height * imfc.height / self.frame_height)
+            new_width = int(pixel_width * imfc.width / self.frame_width)
+            if (new_height, new_width) == imfc.camera.pixel_array.shape[:2]:
+                # Keep the pixel arrays, and the cairo contexts drawing on them.
+                imfc.camera.resize_frame_shape()
+                imfc.camera.reset()
+            else:
+                imfc.camera.reset_pixel_shape(new_height, new_width)
 
     def reset(self):
         """Resets the MultiCamera.
@@ -79,14 +87,35 @@ class MultiCamera(MovingCamera):
         super().reset()
         return self
 
-    def capture_mobjects(self, mobjects, **kwargs):
+    def capture_mobjects(
+        self, mobjects, include_submobjects=True, excluded_mobjects=None
+    ):
         self.update_sub_cameras()
+        # The mobjects to display are gathered once for all the cameras,
+        # each of them only leaves out those outside of its own frame.
+        mobjects = list(mobjects)
+        if include_submobjects:
+            family_members = self.get_family_members_to_display(
+                mobjects, excluded_mobjects
+            )
+        else:
+            family_members = mobjects
         for imfc in self.image_mobjects_from_cameras:
-            to_add = list(mobjects)
+            to_add = family_members
             if not self.allow_cameras_to_capture_their_own_display:
-                to_add = list_difference_update(to_add, imfc.get_family())
-            imfc.camera.capture_mobjects(to_add, **kwargs)
-        super().capture_mobjects(mobjects, **kwargs)
+                own_display = set(imfc.get_family())
+                to_add = [mob for mob in to_add if mob not in own_display]
+            # The paths are in frame coordinates, so the cameras can share
+            # them, see Camera.set_cairo_context_path.
+            imfc.camera.vmobject_to_cairo_path = self.vmobject_to_cairo_path
+            imfc.camera.capture_mobjects(
+                imfc.camera.cull_mobjects(to_add, mobjects),
+                include_submobjects=False,
+            )
+        super().capture_mobjects(
+            self.cull_mobjects(family_members, mobjects),
+            include_submobjects=False,
+        )
 
     def get_mobjects_indicating_movement(self):
         """Returns all mobjects whose movement implies that the camera
@@ -24,10 +24,17 @@ from ..constants import *
 from ..mobject.types.point_cloud_mobject import Point
 from ..utils.color import get_shaded_rgb
 from ..utils.family import extract_mobject_family_members
-from ..utils.space_ops import rotation_about_z, rotation_matrix
+from ..utils.space_ops import normalize_along_axis, rotation_about_z, rotation_matrix
 
 
 class ThreeDCamera(Camera):
+    # The projection is only updated when the mobjects are captured.
+    track_damaged_regions = False
+    # The mobjects are drawn where their points are projected.
+    cull_mobjects_outside_frame = False
+    # The points drawn also depend on the camera.
+    reuse_cairo_paths_of_unchanged_points = False
+
     def __init__(
         self,
         focal_distance=20.0,
@@ -135,6 +142,33 @@ class ThreeDCamera(Camera):
     def get_fill_rgbas(self, vmobject):  # NOTE : DocStrings From parent
         return self.modified_rgbas(vmobject, vmobject.get_fill_rgbas())
 
+    def modified_mesh_rgbas(self, mesh, rgbas):
+        """Shade the faces of a :class:`.MeshSurface` all at once, see
+        :func:`.get_shaded_rgb`.  Each face is shaded at its center.
+        """
+        if not (self.should_apply_shading and mesh.shade_in_3d):
+            return rgbas
+        to_sun = normalize_along_axis(
+            self.light_source.points[0] - mesh.get_face_centers(), 1
+        )
+        factors = 0.5 * np.sum(mesh.get_face_unit_normals() * to_sun, axis=1) ** 3
+        factors[factors < 0] *= 0.5
+        shaded_rgbas = np.array(rgbas)
+        shaded_rgbas[:, :3] += factors[:, np.newaxis]
+        return shaded_rgbas
+
+    def get_mesh_fill_rgbas(self, mesh):  # NOTE : DocStrings From parent
+        return self.modified_mesh_rgbas(mesh, mesh.fill_rgbas)
+
+    def get_mesh_stroke_rgbas(self, mesh):  # NOTE : DocStrings From parent
+        return self.modified_mesh_rgbas(mesh, mesh.stroke_rgbas)
+
+    def get_mesh_face_order(self, mesh, points):  # NOTE : DocStrings From parent
+        # Draw the faces from back to front, like the mobjects in
+        # get_mobjects_to_display.
+        depths = points[mesh.faces][:, :, 2].mean(axis=1)
+        return np.argsort(depths, kind="stable")
+
     def get_mobjects_to_display(self, *args, **kwargs):  # NOTE : DocStrings From parent
         mobjects = super().get_mobjects_to_display(*args, **kwargs)
         rot_matrix = self.get_rotation_matrix()
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import http.client
 import json
+import multiprocessing
 import sys
 import urllib.error
 import urllib.request
@@ -29,6 +30,50 @@ from .render_options import render_options
 
 __all__ = ["render"]
 
+# The scene classes rendered by the worker processes of
+# :func:`_render_scenes_in_parallel`, inherited by forking.
+_scene_classes_to_render: list[type] = []
+
+
+def _render_scene_in_process(index: int) -> bool:
+    """Render a single scene in a worker process.
+
+    Returns whether the scene was rendered without raising.
+    """
+    try:
+        # daemonic pool workers cannot spawn processes of their own
+        with tempconfig({"frame_processes": 1}):
+            scene = _scene_classes_to_render[index]()
+            scene.render()
+    except Exception:
+        error_console.print_exception()
+        return False
+    return True
+
+
+def _render_scenes_in_parallel(scene_classes: list[type], jobs: int) -> bool:
+    """Render independent scenes in a pool of ``jobs`` forked processes.
+
+    Returns whether all scenes were rendered successfully.
+    """
+    global _scene_classes_to_render
+
+    _scene_classes_to_render = scene_classes
+    processes = min(jobs, len(scene_classes))
+    logger.info(
+        f"Rendering {len(scene_classes)} scenes with {processes} processes.",
+    )
+    try:
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            results = pool.map(
+                _render_scene_in_process,
+                range(len(scene_classes)),
+                chunksize=1,
+            )
+    finally:
+        _scene_classes_to_render = []
+    return all(results)
+
 
 @cloup.command(
     context_settings=None,
@@ -112,14 +157,26 @@ def render(
             error_console.print_exception()
             sys.exit(1)
     else:
-        for SceneClass in scene_classes_from_file(file):
-            try:
-                with tempconfig({}):
-                    scene = SceneClass()
-                    scene.render()
-            except Exception:
-                error_console.print_exception()
+        scene_classes = scene_classes_from_file(file)
+        if (
+            config.jobs > 1
+            and len(scene_classes) > 1
+            and "fork" in multiprocessing.get_all_start_methods()
+        ):
+            if not _render_scenes_in_parallel(scene_classes, config.jobs):
                 sys.exit(1)
+        else:
+            frame_processes = config.frame_processes
+            if config.jobs > 1 and frame_processes <= 1:
+                frame_processes = config.jobs
+            for SceneClass in scene_classes:
+                try:
+                    with tempconfig({"frame_processes": frame_processes}):
+                        scene = SceneClass()
+                        scene.render()
+                except Exception:
+                    error_console.print_exception()
+                    sys.exit(1)
 
     if config.notify_outdated_version:
         manim_info_url = "https://pypi.org/pypi/manim/json"
@@ -41,6 +41,11 @@ global_options = option_group(
         default=None,
         help="Disable the use of the cache (still generates cache files).",
     ),
+    option(
+        "--render_cache_dir",
+        default=None,
+        help="Share cached partial movie files between scenes through this directory.",
+    ),
     option(
         "--flush_cache",
         is_flag=True,
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import re
 
-from cloup import Choice, option, option_group
+from cloup import Choice, IntRange, option, option_group
 
 from manim.constants import QUALITIES, RendererType
 
@@ -110,6 +110,22 @@ render_options = option_group(
         help="Select a renderer for your Scene.",
         default="cairo",
     ),
+    option(
+        "-j",
+        "--jobs",
+        type=IntRange(1),
+        default=None,
+        help="Render independent scenes in this many processes. When a single "
+        "scene is rendered, its frames are rendered in parallel instead "
+        "(cairo renderer only).",
+    ),
+    option(
+        "--frame_processes",
+        type=IntRange(1),
+        default=None,
+        help="Render the frames of each animation in this many processes "
+        "(cairo renderer only).",
+    ),
     option(
         "-g",
         "--save_pngs",
@@ -130,6 +146,13 @@ render_options = option_group(
         is_flag=True,
         help="Save section videos in addition to movie file.",
     ),
+    option(
+        "--stream_to_movie",
+        default=None,
+        is_flag=True,
+        help="Write animations straight into the movie file instead of "
+        "concatenating partial movie files at the end.",
+    ),
     option(
         "-t",
         "--transparent",
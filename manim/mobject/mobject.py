@@ -14,6 +14,7 @@ import random
 import sys
 import types
 import warnings
+import weakref
 from collections.abc import Iterable
 from functools import partialmethod, reduce
 from pathlib import Path
@@ -40,6 +41,7 @@ from ..utils.paths import straight_path
 from ..utils.space_ops import angle_between_vectors, normalize, rotation_matrix
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from typing_extensions import Self, TypeAlias
 
     from manim.typing import (
@@ -59,6 +61,97 @@ if TYPE_CHECKING:
     TimeBasedUpdater: TypeAlias = Callable[["Mobject", float], object]
     NonTimeBasedUpdater: TypeAlias = Callable[["Mobject"], object]
     Updater: TypeAlias = NonTimeBasedUpdater | TimeBasedUpdater
+    # The minimum and maximum coordinates of a set of points, if any.
+    _BoundingBox: TypeAlias = npt.NDArray[ManimFloat] | None
+    _BoundingBoxes: TypeAlias = tuple[_BoundingBox, _BoundingBox, bool]
+
+
+class _SubmobjectList(list):
+    """The list of submobjects of a mobject, which resets the cached family
+    of the mobject whenever it is modified in place.
+    """
+
+    __slots__ = ("mobject",)
+
+    def __init__(self, mobject: Mobject, submobjects: Iterable[Mobject] = ()):
+        super().__init__(submobjects)
+        self.mobject = mobject
+
+    def __reduce_ex__(self, protocol):
+        return type(self), (self.mobject, list(self))
+
+
+def _invalidating_family(method: Callable) -> Callable:
+    def wrapper(self: _SubmobjectList, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.mobject.invalidate_family()
+        return result
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_SubmobjectList, _name, _invalidating_family(getattr(list, _name)))
+del _name
+
+
+# Whether each updater takes a ``dt`` parameter, see _is_time_based().
+_UPDATER_IS_TIME_BASED: weakref.WeakKeyDictionary[Updater, bool] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _is_time_based(updater: Updater) -> bool:
+    """Return whether an updater takes a ``dt`` parameter.
+
+    The signature of an updater is only inspected the first time, since this
+    is called for every updater on every frame.
+    """
+    try:
+        return _UPDATER_IS_TIME_BASED[updater]
+    except (KeyError, TypeError):
+        pass
+    is_time_based = "dt" in inspect.signature(updater).parameters
+    try:
+        _UPDATER_IS_TIME_BASED[updater] = is_time_based
+    except TypeError:
+        # The updater is not hashable, or cannot be weakly referenced.
+        pass
+    return is_time_based
+
+
+def _get_bounding_box(points: Point3D_Array) -> _BoundingBox:
+    """Return the ``(2, dim)`` array of the minimum and maximum coordinates
+    of the points, or ``None`` if there are no points.
+    """
+    if len(points) == 0:
+        return None
+    return np.array([points.min(axis=0), points.max(axis=0)])
+
+
+def _merge_bounding_boxes(boxes: Iterable[_BoundingBox]) -> _BoundingBox:
+    """Return the box bounding all the given boxes, or ``None`` if all of
+    them are empty.
+    """
+    boxes = [box for box in boxes if box is not None]
+    if len(boxes) <= 1:
+        return boxes[0] if boxes else None
+    stacked = np.array(boxes)
+    return np.array([stacked[:, 0].min(axis=0), stacked[:, 1].max(axis=0)])
 
 
 class Mobject:
@@ -83,6 +176,16 @@ class Mobject:
 
     animation_overrides = {}
 
+    # The family of the mobject, see get_family(), and the mobjects whose
+    # cached family includes it.
+    _family: list[Mobject] | None = None
+    _parents: weakref.WeakSet[Mobject] | None = None
+    # The boxes bounding the family of the mobject, see _get_bounding_boxes().
+    _bounding_boxes: _BoundingBoxes | None = None
+    # Incremented whenever points is assigned, so that data derived from the
+    # (read-only) points can be kept until they change.
+    _points_version: int = 0
+
     @classmethod
     def __init_subclass__(cls, **kwargs) -> None:
         super().__init_subclass__(**kwargs)
@@ -395,13 +498,56 @@ class Mobject:
         result = cls.__new__(cls)
         clone_from_id[id(self)] = result
         for k, v in self.__dict__.items():
+            if k in ("_family", "_parents", "_bounding_boxes"):
+                continue
             setattr(result, k, copy.deepcopy(v, clone_from_id))
         result.original_id = str(id(self))
         return result
 
+    def __getstate__(self) -> dict:
+        # The cached family and bounding boxes are rebuilt on demand, see
+        # get_family() and _get_bounding_boxes().
+        state = self.__dict__.copy()
+        state.pop("_family", None)
+        state.pop("_parents", None)
+        state.pop("_bounding_boxes", None)
+        return state
+
     def __repr__(self) -> str:
         return str(self.name)
 
+    @property
+    def submobjects(self) -> list[Mobject]:
+        """The contained objects."""
+        return self._submobjects
+
+    @submobjects.setter
+    def submobjects(self, submobjects: Iterable[Mobject]) -> None:
+        self._submobjects = _SubmobjectList(self, submobjects)
+        self.invalidate_family()
+
+    @property
+    def points(self) -> Point3D_Array:
+        """The points of the object.
+
+        The array is read-only: the points are changed by assigning a new
+        array, which resets the cached bounding box of the mobject, e.g.
+        ``mob.points = mob.points + RIGHT`` rather than ``mob.points[:] += RIGHT``.
+        """
+        points = self._points
+        points.flags.writeable = False
+        return points
+
+    @points.setter
+    def points(self, points: Point3D_Array) -> None:
+        self._points = points
+        self._points_version += 1
+        self.invalidate_bounding_box()
+
+    def get_points(self) -> Point3D_Array:
+        """Return the read-only array of :attr:`points`."""
+        return self.points
+
     def reset_points(self) -> None:
         """Sets :attr:`points` to be an empty array."""
         self.points = np.zeros((0, self.dim))
@@ -892,7 +1038,7 @@ class Mobject:
         if self.updating_suspended:
             return self
         for updater in self.updaters:
-            if "dt" in inspect.signature(updater).parameters:
+            if _is_time_based(updater):
                 updater(self, dt)
             else:
                 updater(self)
@@ -917,11 +1063,7 @@ class Mobject:
         :meth:`has_time_based_updater`
 
         """
-        return [
-            updater
-            for updater in self.updaters
-            if "dt" in inspect.signature(updater).parameters
-        ]
+        return [updater for updater in self.updaters if _is_time_based(updater)]
 
     def has_time_based_updater(self) -> bool:
         """Test if ``self`` has a time based updater.
@@ -937,9 +1079,7 @@ class Mobject:
         :meth:`get_time_based_updaters`
 
         """
-        return any(
-            "dt" in inspect.signature(updater).parameters for updater in self.updaters
-        )
+        return any(_is_time_based(updater) for updater in self.updaters)
 
     def get_updaters(self) -> list[Updater]:
         """Return all updaters.
@@ -1026,13 +1166,14 @@ class Mobject:
         :meth:`remove_updater`
         :class:`~.UpdateFromFunc`
         """
+        # Resolves the calling convention of the updater once and for all.
+        is_time_based = _is_time_based(update_function)
         if index is None:
             self.updaters.append(update_function)
         else:
             self.updaters.insert(index, update_function)
         if call_updater:
-            parameters = inspect.signature(update_function).parameters
-            if "dt" in parameters:
+            if is_time_based:
                 update_function(self, 0)
             else:
                 update_function(self)
@@ -1216,8 +1357,7 @@ class Mobject:
         """
         total_vector = reduce(op.add, vectors)
         for mob in self.family_members_with_points():
-            mob.points = mob.points.astype("float")
-            mob.points += total_vector
+            mob.points = mob.points.astype("float") + total_vector
 
         return self
 
@@ -1408,9 +1548,7 @@ class Mobject:
                 about_edge = ORIGIN
             about_point = self.get_critical_point(about_edge)
         for mob in self.family_members_with_points():
-            mob.points -= about_point
-            mob.points = func(mob.points)
-            mob.points += about_point
+            mob.points = func(mob.points - about_point) + about_point
         return self
 
     def pose_at_angle(self, **kwargs):
@@ -2005,10 +2143,15 @@ class Mobject:
         May contain duplicates; the order is in a depth-first (pre-order)
         traversal of the submobjects.
         """
-        result = getattr(self, array_attr)
-        for submob in self.submobjects:
-            result = np.append(result, submob.get_merged_array(array_attr), axis=0)
-        return result
+        arrays = []
+        stack = [self]
+        while stack:
+            mob = stack.pop()
+            arrays.append(getattr(mob, array_attr))
+            stack.extend(reversed(mob.submobjects))
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.concatenate(arrays, axis=0)
 
     def get_all_points(self) -> Point3D_Array:
         """Return all points from this mobject and all submobjects.
@@ -2024,12 +2167,15 @@ class Mobject:
         return self.get_all_points()
 
     def get_num_points(self) -> int:
-        return len(self.points)
+        return len(self._points)
 
     def get_extremum_along_dim(
         self, points: Point3D_Array | None = None, dim: int = 0, key: int = 0
     ) -> np.ndarray | float:
         if points is None:
+            box = self._get_boundary_box()
+            if box is not None:
+                return self._get_critical_coords(box, key)[dim]
             points = self.get_points_defining_boundary()
         values = points[:, dim]
         if key < 0:
@@ -2054,17 +2200,86 @@ class Mobject:
             max_y_3 = sample.get_extremum_along_dim(dim=1, key=1)
 
         """
-        result = np.zeros(self.dim)
-        all_points = self.get_points_defining_boundary()
-        if len(all_points) == 0:
-            return result
-        for dim in range(self.dim):
-            result[dim] = self.get_extremum_along_dim(
-                all_points,
-                dim=dim,
-                key=direction[dim],
+        box = self._get_boundary_box()
+        if box is None:
+            return np.zeros(self.dim)
+        return self._get_critical_coords(box, np.asarray(direction)[: self.dim])
+
+    @staticmethod
+    def _get_critical_coords(
+        box: npt.NDArray[ManimFloat], key: Vector3D | float
+    ) -> Point3D:
+        """Pick the minimum, the middle or the maximum of the ``box``
+        depending on whether ``key`` is negative, zero or positive.
+        """
+        return np.where(
+            key < 0, box[0], np.where(key > 0, box[1], (box[0] + box[1]) / 2)
+        )
+
+    def _get_bounding_boxes(self) -> _BoundingBoxes:
+        """Return the boxes bounding the family of the mobject.
+
+        These are the box bounding all points, the box bounding the points
+        returned by :meth:`_get_own_boundary_points` and whether any family
+        member has neither points nor submobjects.  They are merged from the
+        cached boxes of the submobjects, and cached until :attr:`points` of a
+        family member is assigned or the family changes.
+        """
+        if self._bounding_boxes is None:
+            self._adopt_submobjects()
+            sub_boxes = [submob._get_bounding_boxes() for submob in self.submobjects]
+            self._bounding_boxes = (
+                _merge_bounding_boxes(
+                    [_get_bounding_box(self._points)] + [b[0] for b in sub_boxes]
+                ),
+                _merge_bounding_boxes(
+                    [_get_bounding_box(self._get_own_boundary_points())]
+                    + [b[1] for b in sub_boxes]
+                ),
+                (len(self._points) == 0 and len(self.submobjects) == 0)
+                or any(b[2] for b in sub_boxes),
             )
-        return result
+        return self._bounding_boxes
+
+    def _get_own_boundary_points(self) -> Point3D_Array:
+        """Return the points of this mobject alone which define the boundary
+        of the boxes of its parents, see :meth:`get_points_defining_boundary`.
+        """
+        return self._points
+
+    def get_bounding_box(self) -> npt.NDArray[ManimFloat] | None:
+        """Return the box bounding the points of the mobject and of all its
+        submobjects.
+
+        The box is cached until the points or the family of a family member
+        change, and must not be modified.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` | None
+            The ``(2, dim)`` array of the minimum and maximum coordinates, or
+            ``None`` if no family member has points.
+        """
+        return self._get_bounding_boxes()[0]
+
+    def _get_boundary_box(self) -> _BoundingBox:
+        """Return the box bounding :meth:`get_points_defining_boundary`."""
+        return self._get_bounding_boxes()[0]
+
+    def invalidate_bounding_box(self) -> None:
+        """Reset the cached bounding box of the mobject and of the mobjects
+        containing it, see :meth:`get_critical_point`.
+
+        This is called whenever :attr:`points` is assigned or the family of
+        the mobject changes.
+        """
+        if self._bounding_boxes is None:
+            # The boxes containing this one were reset along with it.
+            return
+        self._bounding_boxes = None
+        if self._parents is not None:
+            for parent in list(self._parents):
+                parent.invalidate_bounding_box()
 
     # Pseudonyms for more general get_critical_point method
 
@@ -2137,10 +2352,15 @@ class Mobject:
 
     def length_over_dim(self, dim: int) -> float:
         """Measure the length of an :class:`~.Mobject` in a certain direction."""
-        return self.reduce_across_dimension(
-            max,
-            dim,
-        ) - self.reduce_across_dimension(min, dim)
+        box, _, has_empty_members = self._get_bounding_boxes()
+        if box is None:
+            return 0
+        low, high = box[0][dim], box[1][dim]
+        if has_empty_members:
+            # Like in reduce_across_dimension(), mobjects without points
+            # and submobjects count as being at the origin.
+            low, high = min(low, 0), max(high, 0)
+        return high - low
 
     def get_coord(self, dim: int, direction: Vector3D = ORIGIN):
         """Meant to generalize ``get_x``, ``get_y`` and ``get_z``"""
@@ -2295,9 +2515,42 @@ class Mobject:
         return result + self.submobjects
 
     def get_family(self, recurse: bool = True) -> list[Self]:
-        sub_families = [x.get_family() for x in self.submobjects]
-        all_mobjects = [self] + list(it.chain(*sub_families))
-        return remove_list_redundancies(all_mobjects)
+        """Return the mobject, its submobjects, their submobjects, and so on.
+
+        The list is cached until :attr:`submobjects` of a family member is
+        changed, and must not be modified.
+        """
+        if self._family is None:
+            self._adopt_submobjects()
+            sub_families = [x.get_family() for x in self.submobjects]
+            all_mobjects = [self] + list(it.chain(*sub_families))
+            self._family = remove_list_redundancies(all_mobjects)
+        return self._family
+
+    def invalidate_family(self) -> None:
+        """Reset the cached family of the mobject and of the mobjects
+        containing it, see :meth:`get_family`.
+
+        This is called whenever :attr:`submobjects` is changed, and also
+        resets the cached bounding boxes.
+        """
+        if self._family is None and self._bounding_boxes is None:
+            # The families containing this one were reset along with it.
+            return
+        self._family = None
+        self._bounding_boxes = None
+        if self._parents is not None:
+            for parent in list(self._parents):
+                parent.invalidate_family()
+
+    def _adopt_submobjects(self) -> None:
+        """Register the mobject as a parent of its submobjects, so that
+        changes to them reset the caches of the mobject.
+        """
+        for submobject in self.submobjects:
+            if submobject._parents is None:
+                submobject._parents = weakref.WeakSet()
+            submobject._parents.add(self)
 
     def family_members_with_points(self) -> list[Self]:
         return [m for m in self.get_family() if m.get_num_points() > 0]
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import tempfile
+import zipfile
+from collections import OrderedDict
 from pathlib import Path
 from xml.etree import ElementTree as ET
 
 import numpy as np
 import svgelements as se
 
-from manim import config, logger
+from manim import __version__, config, logger
 
 from ...constants import RIGHT
 from ...utils.bezier import get_quadratic_approximation_of_cubic
+from ...utils.color import ManimColor
 from ...utils.images import get_full_vector_image_path
 from ...utils.iterables import hash_obj
 from ..geometry.arc import Circle
@@ -24,7 +29,28 @@ from ..types.vectorized_mobject import VMobject
 __all__ = ["SVGMobject", "VMobjectFromSVGPath"]
 
 
-SVG_HASH_TO_MOB_MAP: dict[int, VMobject] = {}
+SVG_HASH_TO_MOB_MAP: OrderedDict[int, VMobject] = OrderedDict()
+"""The mobjects generated from SVG files in this process, by the hash of their
+:attr:`~.SVGMobject.hash_seed`, in order of last use."""
+
+MAX_SVG_HASH_TO_MOB_MAP_SIZE = 1024
+"""Number of mobjects kept in :data:`SVG_HASH_TO_MOB_MAP`; the least recently
+used ones are evicted first."""
+
+# Bump this whenever the conversion of SVG elements to mobjects changes, to
+# invalidate the mobjects cached on disk.
+_SVG_CACHE_VERSION = 3
+
+# The style attributes of the mobjects cached on disk.
+_SVG_CACHE_RGBAS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+_SVG_CACHE_STYLE = (
+    "fill_opacity",
+    "stroke_opacity",
+    "stroke_width",
+    "background_stroke_opacity",
+    "background_stroke_width",
+    "sheen_factor",
+)
 
 
 def _convert_point_to_3d(x: float, y: float) -> np.ndarray:
@@ -86,7 +112,9 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         If True (default), the svg inputs (e.g. file_name, settings)
         will be used as a key and a copy of the created mobject will
         be saved using that key to be quickly retrieved if the same
-        inputs need be processed later. For large SVGs which are used
+        inputs need be processed later. The submobjects are also stored
+        in ``config.svg_cache_dir``, so that later runs do not need to
+        parse the SVG file again. For large SVGs which are used
         only once, this can be omitted to improve performance.
     kwargs
         Further arguments passed to the parent class.
@@ -164,13 +192,22 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
         if use_svg_cache:
             hash_val = hash_obj(self.hash_seed)
             if hash_val in SVG_HASH_TO_MOB_MAP:
+                SVG_HASH_TO_MOB_MAP.move_to_end(hash_val)
                 mob = SVG_HASH_TO_MOB_MAP[hash_val].copy()
                 self.add(*mob)
                 return
+            cache_file = self.get_svg_cache_file()
+            if cache_file is None:
+                self.generate_mobject()
+            elif not self.load_svg_cache(cache_file):
+                self.generate_mobject()
+                self.save_svg_cache(cache_file)
+            SVG_HASH_TO_MOB_MAP[hash_val] = self.copy()
+            while len(SVG_HASH_TO_MOB_MAP) > MAX_SVG_HASH_TO_MOB_MAP_SIZE:
+                SVG_HASH_TO_MOB_MAP.popitem(last=False)
+            return
 
         self.generate_mobject()
-        if use_svg_cache:
-            SVG_HASH_TO_MOB_MAP[hash_val] = self.copy()
 
     @property
     def hash_seed(self) -> tuple:
@@ -187,6 +224,127 @@ class SVGMobject(VMobject, metaclass=ConvertToOpenGL):
             config.renderer,
         )
 
+    def get_svg_cache_file(self) -> Path | None:
+        """The file storing the submobjects generated from the SVG on disk,
+        or ``None`` if ``config.svg_cache_dir`` is empty.
+
+        Its name depends on the :attr:`hash_seed`, on the version of Manim and
+        on the content of the SVG file, so that editing the file invalidates it.
+        """
+        cache_dir = config.get_dir("svg_cache_dir")
+        if cache_dir is None:
+            return None
+        hasher = hashlib.sha256()
+        hasher.update(
+            repr((_SVG_CACHE_VERSION, __version__, self.hash_seed)).encode(),
+        )
+        hasher.update(self.get_file_path().read_bytes())
+        return cache_dir / f"{hasher.hexdigest()[:32]}.npz"
+
+    def load_svg_cache(self, cache_file: Path) -> bool:
+        """Add the submobjects stored by :meth:`save_svg_cache`, without
+        parsing the SVG.
+
+        Returns whether the file could be loaded.
+        """
+        try:
+            with np.load(cache_file) as data:
+                data = dict(data)
+            point_counts = data["point_counts"]
+            points = np.split(data["points"], np.cumsum(point_counts)[:-1])
+            rgbas = {
+                key: np.split(data[key], np.cumsum(data[f"{key}_counts"])[:-1])
+                for key in _SVG_CACHE_RGBAS
+            }
+            mobjects = []
+            for i, path_data in enumerate(data["path_data"]):
+                mob = VMobjectFromSVGPath(se.Path(), **self.path_string_config)
+                mob.path_obj = se.Path(str(path_data))
+                mob.set_points(points[i])
+                for key in _SVG_CACHE_RGBAS:
+                    setattr(mob, key, rgbas[key][i])
+                for key, value in zip(_SVG_CACHE_STYLE, data["style"][i]):
+                    setattr(mob, key, None if np.isnan(value) else float(value))
+                mob.sheen_direction = data["sheen_direction"][i]
+                background_stroke_color = data["background_stroke_color"][i]
+                if not np.isnan(background_stroke_color).any():
+                    mob.background_stroke_color = ManimColor(background_stroke_color)
+                mobjects.append(mob)
+        except (OSError, KeyError, IndexError, ValueError, zipfile.BadZipFile):
+            # unreadable, or written by a version storing other arrays
+            return False
+        self.add(*mobjects)
+        return True
+
+    def save_svg_cache(self, cache_file: Path) -> bool:
+        """Store the points and the style of the submobjects generated from
+        the SVG in a ``.npz`` file.
+
+        Only plain arrays are stored, so loading the file never unpickles
+        anything. Submobjects are only stored if they are
+        :class:`VMobjectFromSVGPath` without submobjects of their own, which
+        :meth:`load_svg_cache` rebuilds exactly.
+
+        Returns whether the file was written.
+        """
+        mobjects = self.submobjects
+        if not all(
+            type(mob) is VMobjectFromSVGPath and not mob.submobjects
+            for mob in mobjects
+        ):
+            return False
+
+        data = {
+            "point_counts": np.array(
+                [len(mob.points) for mob in mobjects], dtype=int
+            ),
+            "points": np.zeros((0, 3)),
+            "path_data": np.array(
+                [str(mob.path_obj.d()) for mob in mobjects], dtype=str
+            ),
+            "style": np.array(
+                [
+                    [
+                        np.nan if getattr(mob, key) is None else getattr(mob, key)
+                        for key in _SVG_CACHE_STYLE
+                    ]
+                    for mob in mobjects
+                ],
+                dtype=float,
+            ).reshape(-1, len(_SVG_CACHE_STYLE)),
+            "sheen_direction": np.array(
+                [mob.sheen_direction for mob in mobjects], dtype=float
+            ).reshape(-1, 3),
+            "background_stroke_color": np.array(
+                [
+                    mob.background_stroke_color.to_rgba()
+                    if hasattr(mob, "background_stroke_color")
+                    else np.full(4, np.nan)
+                    for mob in mobjects
+                ],
+                dtype=float,
+            ).reshape(-1, 4),
+        }
+        if mobjects:
+            data["points"] = np.concatenate([mob.points for mob in mobjects])
+        for key in _SVG_CACHE_RGBAS:
+            data[f"{key}_counts"] = np.array(
+                [len(getattr(mob, key)) for mob in mobjects], dtype=int
+            )
+            data[key] = np.concatenate(
+                [np.zeros((0, 4))] + [getattr(mob, key) for mob in mobjects]
+            )
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, as other processes may read the
+        # cache at the same time
+        with tempfile.NamedTemporaryFile(
+            dir=cache_file.parent, suffix=".npz", delete=False
+        ) as file:
+            np.savez(file, **data)
+        os.replace(file.name, cache_file)
+        return True
+
     def generate_mobject(self) -> None:
         """Parse the SVG and translate its elements to submobjects."""
         file_path = self.get_file_path()
@@ -16,8 +16,24 @@ from manim.mobject.text.text_mobject import Text
 from manim.mobject.types.vectorized_mobject import VMobject
 from manim.mobject.value_tracker import ValueTracker
 
+# The glyphs of numbers, by the class of mobject used to render them, their
+# string and the remaining keyword arguments. They are never modified, only
+# copied, or used as templates by :meth:`DecimalNumber.set_value`.
 string_to_mob_map = {}
 
+# The attributes telling what a glyph, or a member of its family, shows. They
+# are copied along with the points when :meth:`DecimalNumber.set_value` reuses
+# the submobjects of a number for other glyphs.
+_GLYPH_ATTRIBUTES = (
+    "tex_string",
+    "tex_strings",
+    "text",
+    "original_text",
+    "path_obj",
+    "_font_size",
+    "initial_height",
+)
+
 __all__ = ["DecimalNumber", "Integer", "Variable"]
 
 
@@ -164,14 +180,24 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
             self.add(
                 self._string_to_mob("\\dots", SingleStringMathTex, color=self.color),
             )
+        if self.unit is not None:
+            self.unit_sign = self._string_to_mob(self.unit, SingleStringMathTex)
+
+        self._arrange_submobjects(num_string)
 
+        if self.include_background_rectangle:
+            self.add_background_rectangle()
+
+    def _arrange_submobjects(self, num_string):
+        """Arrange the glyphs of the number and of the ellipsis, then add
+        the unit sign next to them.
+        """
         self.arrange(
             buff=self.digit_buff_per_font_unit * self._font_size,
             aligned_edge=DOWN,
         )
 
         if self.unit is not None:
-            self.unit_sign = self._string_to_mob(self.unit, SingleStringMathTex)
             self.add(
                 self.unit_sign.next_to(
                     self,
@@ -198,8 +224,61 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
         # track the initial height to enable scaling via font_size
         self.initial_height = self.height
 
+    def _update_submobjects_from_number(self, number) -> bool:
+        """Show ``number`` by copying the points of the cached glyphs into the
+        current submobjects, without creating any mobject.
+
+        This is only possible if the new number has as many glyphs as the
+        current one, each with family members of the same classes. The
+        attributes identifying the glyphs, such as their ``tex_string``, are
+        copied as well. Returns whether the submobjects could be updated.
+        """
         if self.include_background_rectangle:
-            self.add_background_rectangle()
+            return False
+        num_string = self._get_num_string(number)
+        glyphs = [self._get_glyph(char) for char in num_string]
+        if self.show_ellipsis:
+            glyphs.append(
+                self._get_glyph("\\dots", SingleStringMathTex, color=self.color)
+            )
+        if self.unit is not None:
+            glyphs.append(self._get_glyph(self.unit, SingleStringMathTex))
+        if len(glyphs) != len(self.submobjects):
+            return False
+        families = [
+            (submob.get_family(), glyph.get_family())
+            for submob, glyph in zip(self.submobjects, glyphs)
+        ]
+        if any(
+            len(family) != len(glyph_family)
+            or any(
+                type(mob) is not type(glyph_mob)
+                for mob, glyph_mob in zip(family, glyph_family)
+            )
+            for family, glyph_family in families
+        ):
+            return False
+
+        for (family, glyph_family), glyph in zip(families, glyphs):
+            # the same scaling as setting the font size of a copy of the glyph
+            factor = self._font_size / glyph.font_size
+            center = glyph.get_center()
+            for mob, glyph_mob in zip(family, glyph_family):
+                mob.set_points(center + factor * (glyph_mob.points - center))
+                glyph_attributes = vars(glyph_mob)
+                for attr in _GLYPH_ATTRIBUTES:
+                    if attr in glyph_attributes:
+                        value = glyph_attributes[attr]
+                        # the cached glyph must not change along with the copy
+                        if isinstance(value, list):
+                            value = list(value)
+                        setattr(mob, attr, value)
+
+        self.number = number
+        if self.unit is not None:
+            self.remove(self.unit_sign)
+        self._arrange_submobjects(num_string)
+        return True
 
     def _get_num_string(self, number):
         if isinstance(number, complex):
@@ -214,13 +293,18 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
 
         return num_string
 
-    def _string_to_mob(self, string: str, mob_class: VMobject | None = None, **kwargs):
+    def _get_glyph(self, string: str, mob_class: VMobject | None = None, **kwargs):
+        """Return the cached mobject rendering ``string``, which must not be modified."""
         if mob_class is None:
             mob_class = self.mob_class
 
-        if string not in string_to_mob_map:
-            string_to_mob_map[string] = mob_class(string, **kwargs)
-        mob = string_to_mob_map[string].copy()
+        key = (mob_class, string, repr(sorted(kwargs.items())))
+        if key not in string_to_mob_map:
+            string_to_mob_map[key] = mob_class(string, **kwargs)
+        return string_to_mob_map[key]
+
+    def _string_to_mob(self, string: str, mob_class: VMobject | None = None, **kwargs):
+        mob = self._get_glyph(string, mob_class, **kwargs).copy()
         mob.font_size = self._font_size
         return mob
 
@@ -275,15 +359,23 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
             The value that will overwrite the current number of the :class:`~.DecimalNumber`.
 
         """
+        old_font_size = self.font_size
+        move_to_point = self.get_edge_center(self.edge_to_fix)
+
+        # reuses the current submobjects when the new number has as many
+        # glyphs as the old one, as is mostly the case for counters
+        if self._update_submobjects_from_number(number):
+            self.font_size = old_font_size
+            self.move_to(move_to_point, self.edge_to_fix)
+            self.init_colors()
+            return self
+
         # creates a new number mob via `set_submobjects_from_number`
         # then matches the properties (color, font_size, etc...)
         # of the previous mobject to the new one
 
         # old_family needed with cairo
         old_family = self.get_family()
-
-        old_font_size = self.font_size
-        move_to_point = self.get_edge_center(self.edge_to_fix)
         old_submobjects = self.submobjects
 
         self._set_submobjects_from_number(number)
@@ -298,7 +390,7 @@ class DecimalNumber(VMobject, metaclass=ConvertToOpenGL):
                 # of animated mobjects
                 # for compatibility with updaters to not leave first number in place while updating,
                 # not needed with opengl renderer
-                mob.points[:] = 0
+                mob.points = np.zeros_like(mob.points)
 
         self.init_colors()
         return self
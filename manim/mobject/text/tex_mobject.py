@@ -20,6 +20,7 @@ __all__ = [
     "Tex",
     "BulletedList",
     "Title",
+    "prefetch_tex",
 ]
 
 
@@ -36,7 +37,7 @@ from manim.mobject.geometry.line import Line
 from manim.mobject.svg.svg_mobject import SVGMobject
 from manim.mobject.types.vectorized_mobject import VGroup, VMobject
 from manim.utils.tex import TexTemplate
-from manim.utils.tex_file_writing import tex_to_svg_file
+from manim.utils.tex_file_writing import tex_to_svg_file, tex_to_svg_files
 
 tex_string_to_mob_map = {}
 
@@ -131,7 +132,8 @@ class SingleStringMathTex(SVGMobject):
         result = self._modify_special_strings(result)
         return result
 
-    def _modify_special_strings(self, tex):
+    @staticmethod
+    def _modify_special_strings(tex):
         tex = tex.strip()
         should_add_filler = reduce(
             op.or_,
@@ -172,7 +174,7 @@ class SingleStringMathTex(SVGMobject):
             tex = tex.replace("\\left", "\\big")
             tex = tex.replace("\\right", "\\big")
 
-        tex = self._remove_stray_braces(tex)
+        tex = SingleStringMathTex._remove_stray_braces(tex)
 
         for context in ["array"]:
             begin_in = ("\\begin{%s}" % context) in tex  # noqa: UP031
@@ -184,7 +186,8 @@ class SingleStringMathTex(SVGMobject):
                 tex = ""
         return tex
 
-    def _remove_stray_braces(self, tex):
+    @staticmethod
+    def _remove_stray_braces(tex):
         r"""
         Makes :class:`~.MathTex` resilient to unmatched braces.
 
@@ -274,6 +277,12 @@ class MathTex(SingleStringMathTex):
         self.brace_notation_split_occurred = False
         self.tex_strings = self._break_up_tex_strings(tex_strings)
         try:
+            # typeset the whole string and all of its parts at once
+            tex_to_svg_files(
+                _get_tex_expressions(self.tex_strings, self.arg_separator),
+                environment=self.tex_environment,
+                tex_template=self.tex_template,
+            )
             super().__init__(
                 self.arg_separator.join(self.tex_strings),
                 tex_environment=self.tex_environment,
@@ -302,33 +311,11 @@ class MathTex(SingleStringMathTex):
             self._organize_submobjects_left_to_right()
 
     def _break_up_tex_strings(self, tex_strings):
-        # Separate out anything surrounded in double braces
-        pre_split_length = len(tex_strings)
-        tex_strings = [re.split("{{(.*?)}}", str(t)) for t in tex_strings]
-        tex_strings = sum(tex_strings, [])
-        if len(tex_strings) > pre_split_length:
-            self.brace_notation_split_occurred = True
-
-        # Separate out any strings specified in the isolate
-        # or tex_to_color_map lists.
-        patterns = []
-        patterns.extend(
-            [
-                f"({re.escape(ss)})"
-                for ss in it.chain(
-                    self.substrings_to_isolate,
-                    self.tex_to_color_map.keys(),
-                )
-            ],
+        pieces, self.brace_notation_split_occurred = _split_tex_strings(
+            tex_strings,
+            it.chain(self.substrings_to_isolate, self.tex_to_color_map.keys()),
         )
-        pattern = "|".join(patterns)
-        if pattern:
-            pieces = []
-            for s in tex_strings:
-                pieces.extend(re.split(pattern, s))
-        else:
-            pieces = tex_strings
-        return [p for p in pieces if p]
+        return pieces
 
     def _break_up_by_substrings(self):
         """
@@ -552,3 +539,96 @@ class Title(Tex):
                 underline.width = underline_width
             self.add(underline)
             self.underline = underline
+
+
+def _split_tex_strings(
+    tex_strings: Iterable[str], substrings_to_isolate: Iterable[str] = ()
+) -> tuple[list[str], bool]:
+    """Split TeX strings into the parts of a :class:`~.MathTex`.
+
+    Returns the parts, and whether any string contained a group of double braces.
+    """
+    # Separate out anything surrounded in double braces
+    tex_strings = list(tex_strings)
+    pre_split_length = len(tex_strings)
+    tex_strings = [re.split("{{(.*?)}}", str(t)) for t in tex_strings]
+    tex_strings = sum(tex_strings, [])
+    brace_notation_split_occurred = len(tex_strings) > pre_split_length
+
+    # Separate out any strings specified in the isolate
+    # or tex_to_color_map lists.
+    patterns = [f"({re.escape(ss)})" for ss in substrings_to_isolate]
+    pattern = "|".join(patterns)
+    if pattern:
+        pieces = []
+        for s in tex_strings:
+            pieces.extend(re.split(pattern, s))
+    else:
+        pieces = tex_strings
+    return [p for p in pieces if p], brace_notation_split_occurred
+
+
+def _get_tex_expressions(tex_strings: list[str], arg_separator: str) -> list[str]:
+    """The expressions typeset for a :class:`~.MathTex` with the given parts:
+    the whole string followed by each part.
+    """
+    return [
+        SingleStringMathTex._modify_special_strings(tex_string)
+        for tex_string in [arg_separator.join(tex_strings), *tex_strings]
+    ]
+
+
+def prefetch_tex(
+    *tex_strings: str | Iterable[str],
+    arg_separator: str = " ",
+    substrings_to_isolate: Iterable[str] = (),
+    tex_environment: str = "align*",
+    tex_template: TexTemplate | None = None,
+) -> None:
+    r"""Typeset the TeX of several :class:`~.MathTex` at once, ahead of time.
+
+    All the expressions which are not cached yet are compiled as a single
+    document (see :func:`~.tex_to_svg_files`), so that creating the mobjects
+    afterwards only reads the cached SVG files. This is typically called in
+    :meth:`.Scene.setup`, before :meth:`.Scene.construct` builds the mobjects.
+
+    Parameters
+    ----------
+    tex_strings
+        The ``tex_strings`` of each :class:`~.MathTex`, either as a single string
+        or as an iterable of strings.
+    arg_separator
+        The ``arg_separator`` of the mobjects; pass ``""`` for :class:`~.Tex`.
+    substrings_to_isolate
+        The ``substrings_to_isolate`` of the mobjects, including the keys of
+        their ``tex_to_color_map``.
+    tex_environment
+        The ``tex_environment`` of the mobjects; pass ``"center"`` for :class:`~.Tex`.
+    tex_template
+        The ``tex_template`` of the mobjects. If not set, use the default template
+        set via ``config["tex_template"]``.
+
+    Examples
+    --------
+    ::
+
+        class PrefetchedFormulas(Scene):
+            def setup(self):
+                prefetch_tex(*(f"x^{{{n}}}" for n in range(10)))
+
+            def construct(self):
+                powers = VGroup(*(MathTex(f"x^{{{n}}}") for n in range(10)))
+                self.add(powers.arrange(RIGHT))
+    """
+    substrings_to_isolate = list(substrings_to_isolate)
+    expressions = []
+    for strings in tex_strings:
+        if isinstance(strings, str):
+            strings = [strings]
+        pieces, _ = _split_tex_strings(strings, substrings_to_isolate)
+        expressions.extend(_get_tex_expressions(pieces, arg_separator))
+    tex_to_svg_files(
+        dict.fromkeys(expressions),
+        environment=tex_environment,
+        tex_template=tex_template,
+    )
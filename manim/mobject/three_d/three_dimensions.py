@@ -8,6 +8,7 @@ from manim.utils.color import BLUE, BLUE_D, BLUE_E, LIGHT_GREY, WHITE, interpola
 __all__ = [
     "ThreeDVMobject",
     "Surface",
+    "MeshSurface",
     "Sphere",
     "Dot3D",
     "Cube",
@@ -33,14 +34,78 @@ from manim.mobject.mobject import *
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
 from manim.mobject.opengl.opengl_mobject import OpenGLMobject
 from manim.mobject.types.vectorized_mobject import VectorizedPoint, VGroup, VMobject
+from manim.utils.bezier import interpolate
 from manim.utils.color import (
+    YELLOW_C,
     ManimColor,
     ParsableManimColor,
+    color_to_rgba,
 )
 from manim.utils.iterables import tuplify
 from manim.utils.space_ops import normalize, perpendicular_bisector, z_to_vector
 
 
+def _get_u_values_and_v_values(
+    u_range: Sequence[float],
+    v_range: Sequence[float],
+    resolution: Sequence[int] | int,
+) -> tuple[np.ndarray, np.ndarray]:
+    res = tuplify(resolution)
+    if len(res) == 1:
+        u_res = v_res = res[0]
+    else:
+        u_res, v_res = res
+
+    u_values = np.linspace(*u_range, u_res + 1)
+    v_values = np.linspace(*v_range, v_res + 1)
+
+    return u_values, v_values
+
+
+def _get_colorscale(
+    axes: Mobject,
+    colorscale: list[ParsableManimColor] | ParsableManimColor | None,
+    axis: int,
+    kwargs: dict[str, Any],
+) -> tuple[list[ParsableManimColor], Sequence[float]] | None:
+    """Return the colors and pivots of the ``colorscale`` passed to
+    ``set_fill_by_value``, or ``None`` if there is no colorscale.
+    """
+    if "colors" in kwargs and colorscale is None:
+        colorscale = kwargs.pop("colors")
+        if kwargs:
+            raise ValueError(
+                "Unsupported keyword argument(s): "
+                f"{', '.join(str(key) for key in kwargs)}"
+            )
+    if colorscale is None:
+        logger.warning(
+            "The value passed to the colorscale keyword argument was None, "
+            "the surface fill color has not been changed"
+        )
+        return None
+
+    ranges = [axes.x_range, axes.y_range, axes.z_range]
+
+    if type(colorscale[0]) is tuple:
+        new_colors, pivots = [
+            [i for i, j in colorscale],
+            [j for i, j in colorscale],
+        ]
+    else:
+        new_colors = colorscale
+
+        pivot_min = ranges[axis][0]
+        pivot_max = ranges[axis][1]
+        pivot_frequency = (pivot_max - pivot_min) / (len(new_colors) - 1)
+        pivots = np.arange(
+            start=pivot_min,
+            stop=pivot_max + pivot_frequency,
+            step=pivot_frequency,
+        )
+    return new_colors, pivots
+
+
 class ThreeDVMobject(VMobject, metaclass=ConvertToOpenGL):
     def __init__(self, shade_in_3d: bool = True, **kwargs):
         super().__init__(shade_in_3d=shade_in_3d, **kwargs)
@@ -143,16 +208,7 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
         return self._func(u, v)
 
     def _get_u_values_and_v_values(self) -> tuple[np.ndarray, np.ndarray]:
-        res = tuplify(self.resolution)
-        if len(res) == 1:
-            u_res = v_res = res[0]
-        else:
-            u_res, v_res = res
-
-        u_values = np.linspace(*self.u_range, u_res + 1)
-        v_values = np.linspace(*self.v_range, v_res + 1)
-
-        return u_values, v_values
+        return _get_u_values_and_v_values(self.u_range, self.v_range, self.resolution)
 
     def _setup_in_uv_space(self) -> None:
         u_values, v_values = self._get_u_values_and_v_values()
@@ -265,38 +321,10 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
                     surface_plane.set_fill_by_value(axes=axes, colorscale=[(RED, -0.5), (YELLOW, 0), (GREEN, 0.5)], axis=2)
                     self.add(axes, surface_plane)
         """
-        if "colors" in kwargs and colorscale is None:
-            colorscale = kwargs.pop("colors")
-            if kwargs:
-                raise ValueError(
-                    "Unsupported keyword argument(s): "
-                    f"{', '.join(str(key) for key in kwargs)}"
-                )
+        colorscale = _get_colorscale(axes, colorscale, axis, kwargs)
         if colorscale is None:
-            logger.warning(
-                "The value passed to the colorscale keyword argument was None, "
-                "the surface fill color has not been changed"
-            )
             return self
-
-        ranges = [axes.x_range, axes.y_range, axes.z_range]
-
-        if type(colorscale[0]) is tuple:
-            new_colors, pivots = [
-                [i for i, j in colorscale],
-                [j for i, j in colorscale],
-            ]
-        else:
-            new_colors = colorscale
-
-            pivot_min = ranges[axis][0]
-            pivot_max = ranges[axis][1]
-            pivot_frequency = (pivot_max - pivot_min) / (len(new_colors) - 1)
-            pivots = np.arange(
-                start=pivot_min,
-                stop=pivot_max + pivot_frequency,
-                step=pivot_frequency,
-            )
+        new_colors, pivots = colorscale
 
         for mob in self.family_members_with_points():
             axis_value = axes.point_to_coords(mob.get_midpoint())[axis]
@@ -325,6 +353,313 @@ class Surface(VGroup, metaclass=ConvertToOpenGL):
         return self
 
 
+class MeshSurface(Mobject):
+    """A parametric surface stored as a single mesh of quadrilateral faces.
+
+    Unlike :class:`Surface`, which creates one :class:`ThreeDVMobject` per
+    face, the vertices of all faces are kept in :attr:`points`, and the
+    faces, as well as their colors, in arrays with one row per face.  The
+    faces are drawn in bulk by the Cairo camera, which makes meshes of a
+    high resolution much cheaper to create, copy, transform and render.
+    Only the Cairo renderer can display a :class:`MeshSurface`.
+
+    Parameters
+    ----------
+    func
+        The function defining the :class:`MeshSurface`.
+    u_range
+        The range of the ``u`` variable: ``(u_min, u_max)``.
+    v_range
+        The range of the ``v`` variable: ``(v_min, v_max)``.
+    resolution
+        The number of faces along ``u`` and ``v``. A tuple can be used to
+        define different resolutions for ``u`` and ``v`` respectively.
+    fill_color
+        The color of the faces. Ignored if ``checkerboard_colors`` is set.
+    fill_opacity
+        The opacity of the faces, from 0 being fully transparent to 1 being
+        fully opaque.
+    checkerboard_colors
+        The colors alternating between adjacent faces. Overrides
+        ``fill_color``.
+    stroke_color
+        Color of the stroke surrounding each face.
+    stroke_width
+        Width of the stroke surrounding each face.
+    stroke_opacity
+        Opacity of the stroke surrounding each face.
+    vectorized
+        Whether ``func`` can evaluate the whole grid at once.  It is then
+        called with two arrays of ``u`` and ``v`` values and has to return
+        an ``(N, 3)`` array of points.
+    shade_in_3d
+        Whether the faces are shaded by the :class:`.ThreeDCamera`.
+
+    Examples
+    --------
+    .. manim:: MeshSurfaceExample
+        :save_last_frame:
+
+        class MeshSurfaceExample(ThreeDScene):
+            def construct(self):
+                def func(u, v):
+                    return np.stack([u, v, np.sin(u) * np.cos(v)], axis=1)
+
+                surface = MeshSurface(
+                    func,
+                    u_range=[-PI, PI],
+                    v_range=[-PI, PI],
+                    resolution=64,
+                    stroke_width=0,
+                    vectorized=True,
+                )
+                self.set_camera_orientation(phi=70 * DEGREES, theta=30 * DEGREES)
+                self.add(surface)
+    """
+
+    def __init__(
+        self,
+        func: Callable[[float, float], np.ndarray],
+        u_range: Sequence[float] = [0, 1],
+        v_range: Sequence[float] = [0, 1],
+        resolution: Sequence[int] | int = 32,
+        fill_color: ParsableManimColor = BLUE_D,
+        fill_opacity: float = 1.0,
+        checkerboard_colors: Sequence[ParsableManimColor] | bool = [BLUE_D, BLUE_E],
+        stroke_color: ParsableManimColor = LIGHT_GREY,
+        stroke_width: float = 0.5,
+        stroke_opacity: float = 1.0,
+        vectorized: bool = False,
+        shade_in_3d: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        self.u_range = u_range
+        self.v_range = v_range
+        self.resolution = resolution
+        self.fill_color: ManimColor = ManimColor(fill_color)
+        self.fill_opacity = fill_opacity
+        self.checkerboard_colors = checkerboard_colors
+        self.stroke_color: ManimColor = ManimColor(stroke_color)
+        self.stroke_width = stroke_width
+        self.stroke_opacity = stroke_opacity
+        self.vectorized = vectorized
+        self.shade_in_3d = shade_in_3d
+        self._func = func
+        super().__init__(**kwargs)
+
+    def func(self, u: float, v: float) -> np.ndarray:
+        return self._func(u, v)
+
+    def reset_points(self) -> None:
+        super().reset_points()
+        self.faces = np.zeros((0, 4), dtype=int)
+        self.face_uv_indices = np.zeros((0, 2), dtype=int)
+        self.fill_rgbas = np.zeros((0, 4))
+        self.stroke_rgbas = np.zeros((0, 4))
+
+    def generate_points(self) -> None:
+        u_values, v_values = _get_u_values_and_v_values(
+            self.u_range, self.v_range, self.resolution
+        )
+        u_grid, v_grid = np.meshgrid(u_values, v_values, indexing="ij")
+        if self.vectorized:
+            points = self.func(u_grid.ravel(), v_grid.ravel())
+        else:
+            points = [self.func(u, v) for u, v in zip(u_grid.flat, v_grid.flat)]
+        self.set_points(np.asarray(points, dtype=float).reshape((-1, self.dim)))
+
+        # The vertices are stored row by row, the corners of each face go
+        # around it in the same order as the corners of the faces of Surface.
+        n_u, n_v = len(u_values) - 1, len(v_values) - 1
+        u_indices, v_indices = np.meshgrid(
+            np.arange(n_u), np.arange(n_v), indexing="ij"
+        )
+        self.face_uv_indices = np.stack([u_indices.ravel(), v_indices.ravel()], axis=1)
+        corners = self.face_uv_indices[:, 0] * (n_v + 1) + self.face_uv_indices[:, 1]
+        self.faces = np.stack(
+            [corners, corners + n_v + 1, corners + n_v + 2, corners + 1], axis=1
+        )
+
+    def init_colors(self) -> None:
+        n_faces = self.get_num_faces()
+        self.fill_rgbas = np.repeat(
+            [color_to_rgba(self.fill_color, self.fill_opacity)], n_faces, axis=0
+        )
+        self.stroke_rgbas = np.repeat(
+            [color_to_rgba(self.stroke_color, self.stroke_opacity)], n_faces, axis=0
+        )
+        if self.checkerboard_colors:
+            self.set_fill_by_checkerboard(*self.checkerboard_colors)
+
+    def get_num_faces(self) -> int:
+        return len(self.faces)
+
+    def get_face_corners(self) -> np.ndarray:
+        """Return the corners of all faces as an array of shape
+        ``(n_faces, 4, 3)``.
+        """
+        return self.points[self.faces]
+
+    def get_face_centers(self) -> np.ndarray:
+        return self.get_face_corners().mean(axis=1)
+
+    def get_face_unit_normals(self) -> np.ndarray:
+        """Return the unit normal of each face, computed from its diagonals.
+
+        Faces without a normal, such as faces collapsed to a point, get
+        ``UP``, like the faces of :class:`Surface`.
+        """
+        corners = self.get_face_corners()
+        normals = np.cross(
+            corners[:, 2] - corners[:, 0],
+            corners[:, 3] - corners[:, 1],
+        )
+        norms = np.linalg.norm(normals, axis=1)
+        degenerate = norms == 0
+        normals[degenerate] = UP
+        norms[degenerate] = 1
+        return normals / norms[:, np.newaxis]
+
+    def set_fill(
+        self,
+        color: ParsableManimColor | None = None,
+        opacity: float | None = None,
+        family: bool = True,
+    ) -> Self:
+        if color is not None:
+            self.fill_rgbas[:, :3] = color_to_rgba(color)[:3]
+        if opacity is not None:
+            self.fill_rgbas[:, 3] = opacity
+        return self
+
+    def set_stroke(
+        self,
+        color: ParsableManimColor | None = None,
+        width: float | None = None,
+        opacity: float | None = None,
+        family: bool = True,
+    ) -> Self:
+        if color is not None:
+            self.stroke_rgbas[:, :3] = color_to_rgba(color)[:3]
+        if width is not None:
+            self.stroke_width = width
+        if opacity is not None:
+            self.stroke_rgbas[:, 3] = opacity
+        return self
+
+    def set_color(
+        self, color: ParsableManimColor = YELLOW_C, family: bool = True
+    ) -> Self:
+        self.set_fill(color)
+        self.set_stroke(color)
+        self.color = ManimColor.parse(color)
+        return self
+
+    def set_opacity(self, opacity: float, family: bool = True) -> Self:
+        self.set_fill(opacity=opacity)
+        self.set_stroke(opacity=opacity)
+        return self
+
+    def fade(self, darkness: float = 0.5, family: bool = True) -> Self:
+        self.fill_rgbas[:, 3] *= 1.0 - darkness
+        self.stroke_rgbas[:, 3] *= 1.0 - darkness
+        return super().fade(darkness, family)
+
+    def get_color(self) -> ManimColor:
+        return ManimColor(self.fill_rgbas[0])
+
+    def get_stroke_width(self) -> float:
+        return self.stroke_width
+
+    def set_fill_by_checkerboard(
+        self, *colors: Iterable[ParsableManimColor], opacity: float | None = None
+    ) -> Self:
+        """Sets the fill_color of the faces in an alternating pattern.
+
+        Parameters
+        ----------
+        colors
+            List of colors for alternating pattern.
+        opacity
+            The fill_opacity of the faces, from 0 being fully transparent
+            to 1 being fully opaque.
+
+        Returns
+        -------
+        :class:`~.MeshSurface`
+            The mesh with an alternating pattern.
+        """
+        rgbs = np.array([color_to_rgba(color)[:3] for color in colors])
+        color_indices = self.face_uv_indices.sum(axis=1) % len(colors)
+        self.fill_rgbas[:, :3] = rgbs[color_indices]
+        if opacity is not None:
+            self.fill_rgbas[:, 3] = opacity
+        return self
+
+    def set_fill_by_value(
+        self,
+        axes: Mobject,
+        colorscale: list[ParsableManimColor] | ParsableManimColor | None = None,
+        axis: int = 2,
+        **kwargs,
+    ) -> Self:
+        """Sets the color of each face to a color relative to the axis-value
+        of its center, see :meth:`.Surface.set_fill_by_value`.
+
+        Parameters
+        ----------
+        axes
+            The axes for the surface, which will be used to map axis-values
+            to colors.
+        colorscale
+            A list of colors, ordered from lower axis-values to higher axis-values.
+            If a list of tuples is passed containing colors paired with numbers,
+            then those numbers will be used as the pivots.
+        axis
+            The chosen axis to use for the color mapping. (0 = x, 1 = y, 2 = z)
+
+        Returns
+        -------
+        :class:`~.MeshSurface`
+            The mesh with a gradient applied by value. For chaining.
+        """
+        colorscale = _get_colorscale(axes, colorscale, axis, kwargs)
+        if colorscale is None:
+            return self
+        new_colors, pivots = colorscale
+        rgbs = np.array([color_to_rgba(color)[:3] for color in new_colors])
+        pivots = np.asarray(pivots[: len(rgbs)], dtype=float)
+
+        axis_values = axes.point_to_coords(self.get_face_centers())[:, axis]
+        face_rgbs = np.stack(
+            [np.interp(axis_values, pivots, rgbs[:, i]) for i in range(3)], axis=1
+        )
+        self.fill_rgbas[:, :3] = face_rgbs
+        self.stroke_rgbas[:, :3] = face_rgbs
+        return self
+
+    def align_points(self, mobject: Mobject) -> Self:
+        if not isinstance(mobject, MeshSurface) or not np.array_equal(
+            self.faces, mobject.faces
+        ):
+            raise ValueError(
+                "A MeshSurface can only be aligned with a MeshSurface of the same resolution"
+            )
+        return self
+
+    def interpolate_color(
+        self, mobject1: MeshSurface, mobject2: MeshSurface, alpha: float
+    ) -> Self:
+        self.fill_rgbas = interpolate(mobject1.fill_rgbas, mobject2.fill_rgbas, alpha)
+        self.stroke_rgbas = interpolate(
+            mobject1.stroke_rgbas, mobject2.stroke_rgbas, alpha
+        )
+        self.stroke_width = interpolate(
+            mobject1.stroke_width, mobject2.stroke_width, alpha
+        )
+        return self
+
+
 # Specific shapes
 
 
@@ -14,6 +14,7 @@ __all__ = [
 
 import itertools as it
 import sys
+from collections import OrderedDict
 from collections.abc import Generator, Hashable, Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING, Callable, Literal
 
@@ -29,6 +30,7 @@ from manim.mobject.three_d.three_d_utils import (
     get_3d_vmob_gradient_start_and_end_points,
 )
 from manim.utils.bezier import (
+    _get_bernstein_matrix,
     bezier,
     bezier_remap,
     get_smooth_cubic_bezier_handle_points,
@@ -83,6 +85,14 @@ __all__ = [
 ]
 
 
+# The points computed by VMobject.align_points, by the points they were
+# computed from, in order of last use.
+_ALIGNED_POINTS_CACHE: OrderedDict[
+    tuple, tuple[Point3D_Array, Point3D_Array, Point3D_Array, Point3D_Array]
+] = OrderedDict()
+_MAX_ALIGNED_POINTS_CACHE_SIZE = 256
+
+
 class VMobject(Mobject):
     """A vectorized mobject.
 
@@ -110,6 +120,10 @@ class VMobject(Mobject):
 
     sheen_factor = 0.0
 
+    # The cumulative lengths of the curves, see get_arc_length_table(), along
+    # with the number of sample points and the points they were computed from.
+    _arc_length_table: tuple[int, Point3D_Array, npt.NDArray[ManimFloat]] | None = None
+
     def __init__(
         self,
         fill_color: ParsableManimColor | None = None,
@@ -754,7 +768,7 @@ class VMobject(Mobject):
         assert len(anchors1) == len(handles1) == len(handles2) == len(anchors2)
         nppcc = self.n_points_per_cubic_curve  # 4
         total_len = nppcc * len(anchors1)
-        self.points = np.empty((total_len, self.dim))
+        points = np.empty((total_len, self.dim))
         # the following will, from the four sets, dispatch them in points such that
         # self.points = [
         #     anchors1[0], handles1[0], handles2[0], anchors1[0], anchors1[1],
@@ -762,7 +776,8 @@ class VMobject(Mobject):
         # ]
         arrays = [anchors1, handles1, handles2, anchors2]
         for index, array in enumerate(arrays):
-            self.points[index::nppcc] = array
+            points[index::nppcc] = array
+        self.points = points
         return self
 
     def clear_points(self) -> None:
@@ -1270,12 +1285,19 @@ class VMobject(Mobject):
         )
 
     def get_subpaths_from_points(self, points: Point3D_Array) -> list[Point3D_Array]:
-        return list(
-            self._gen_subpaths_from_points(
-                points,
-                lambda n: not self.consider_points_equals(points[n - 1], points[n]),
-            ),
-        )
+        # Like _gen_subpaths_from_points() with consider_points_equals(), but
+        # comparing all the anchors at once.
+        nppcc = self.n_points_per_cubic_curve
+        indices = np.arange(nppcc, len(points), nppcc)
+        is_split = ~np.isclose(
+            points[indices - 1], points[indices], atol=self.tolerance_for_point_equality
+        ).all(axis=1)
+        split_indices = [0, *indices[is_split], len(points)]
+        return [
+            points[i1:i2]
+            for i1, i2 in zip(split_indices, split_indices[1:])
+            if (i2 - i1) >= nppcc
+        ]
 
     def gen_subpaths_from_points_2d(
         self, points: Point3D_Array
@@ -1416,7 +1438,7 @@ class VMobject(Mobject):
             number of curves of the vmobject.
         """
         nppcc = self.n_points_per_cubic_curve
-        return len(self.points) // nppcc
+        return len(self.get_points()) // nppcc
 
     def get_curve_functions(
         self,
@@ -1492,28 +1514,64 @@ class VMobject(Mobject):
         if alpha < 0 or alpha > 1:
             raise ValueError(f"Alpha {alpha} not between 0 and 1.")
 
-        self.throw_error_if_no_points()
-        if alpha == 1:
-            return self.points[-1]
+        return self.points_from_proportions([alpha])[0]
 
-        curves_and_lengths = tuple(self.get_curve_functions_with_lengths())
+    def points_from_proportions(
+        self, alphas: Iterable[float] | npt.NDArray[float]
+    ) -> Point3D_Array:
+        """Gets the points at several proportions along the path of the
+        :class:`VMobject`, see :meth:`point_from_proportion`.
 
-        target_length = alpha * sum(length for _, length in curves_and_lengths)
-        current_length = 0
+        The proportions are looked up in the cached table of
+        :meth:`get_arc_length_table`, and all points are computed at once.
+
+        Parameters
+        ----------
+        alphas
+            The proportions along the the path of the :class:`VMobject`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The points on the :class:`VMobject`, one per proportion.
 
-        for curve, length in curves_and_lengths:
-            if current_length + length >= target_length:
-                if length != 0:
-                    residue = (target_length - current_length) / length
-                else:
-                    residue = 0
+        Raises
+        ------
+        :exc:`ValueError`
+            If any of the ``alphas`` is not between 0 and 1.
+        :exc:`Exception`
+            If the :class:`VMobject` has no points.
+        """
+        alphas = np.asarray(alphas, dtype=float).reshape(-1)
+        out_of_range = (alphas < 0) | (alphas > 1)
+        if out_of_range.any():
+            raise ValueError(f"Alpha {alphas[out_of_range][0]} not between 0 and 1.")
 
-                return curve(residue)
+        self.throw_error_if_no_points()
+        num_curves = self.get_num_curves()
+        if num_curves == 0:
+            return np.repeat(self.points[:1], len(alphas), axis=0)
+
+        table = self.get_arc_length_table()
+        target_lengths = alphas * table[-1]
+        # The first curve ending at or after each target length.
+        indices = np.searchsorted(table[1:], target_lengths)
+        indices = np.minimum(indices, num_curves - 1)
+        lengths = table[indices + 1] - table[indices]
+        residues = np.divide(
+            target_lengths - table[indices],
+            lengths,
+            out=np.zeros_like(lengths),
+            where=lengths != 0,
+        )
 
-            current_length += length
-        raise Exception(
-            "Not sure how you reached here, please file a bug report at https://github.com/ManimCommunity/manim/issues/new/choose"
+        nppcc = self.n_points_per_cubic_curve
+        curves = self.points[: nppcc * num_curves].reshape((num_curves, nppcc, -1))
+        points = np.einsum(
+            "ik,ikd->id", _get_bernstein_matrix(nppcc, residues), curves[indices]
         )
+        points[alphas == 1] = self.points[-1]
+        return points
 
     def proportion_from_point(
         self,
@@ -1550,11 +1608,12 @@ class VMobject(Mobject):
         # the proportion along the ``VMobject`` the point is at.
 
         num_curves = self.get_num_curves()
-        total_length = self.get_arc_length()
+        table = self.get_arc_length_table()
+        total_length = table[-1]
         target_length = 0
         for n in range(num_curves):
             control_points = self.get_nth_curve_points(n)
-            length = self.get_nth_curve_length(n)
+            length = table[n + 1] - table[n]
             proportions_along_bezier = proportions_along_bezier_curve_for_point(
                 point,
                 control_points,
@@ -1627,6 +1686,18 @@ class VMobject(Mobject):
             tuple(it.chain(*(sm.get_anchors() for sm in self.get_family())))
         )
 
+    def _get_own_boundary_points(self) -> Point3D_Array:
+        # The anchors, like in get_anchors(), in a different order.
+        points = self._points
+        if len(points) == 1:
+            return points
+        nppcc = self.n_points_per_cubic_curve
+        end_anchors = points[nppcc - 1 :: nppcc]
+        return np.concatenate([points[: len(end_anchors) * nppcc : nppcc], end_anchors])
+
+    def _get_boundary_box(self) -> npt.NDArray[ManimFloat] | None:
+        return self._get_bounding_boxes()[1]
+
     def get_arc_length(self, sample_points_per_curve: int | None = None) -> float:
         """Return the approximated length of the whole curve.
 
@@ -1640,12 +1711,49 @@ class VMobject(Mobject):
         float
             The length of the :class:`VMobject`.
         """
-        return sum(
-            length
-            for _, length in self.get_curve_functions_with_lengths(
-                sample_points=sample_points_per_curve,
-            )
-        )
+        return self.get_arc_length_table(sample_points_per_curve)[-1]
+
+    def get_arc_length_table(
+        self, sample_points_per_curve: int | None = None
+    ) -> npt.NDArray[ManimFloat]:
+        """Return the cumulative (approximated) lengths of the curves.
+
+        The ``n``-th entry is the length of the path up to the start of the
+        ``n``-th curve, so the table starts with 0 and ends with the arc length
+        of the whole :class:`VMobject`.  Each curve is measured like in
+        :meth:`get_nth_curve_length`, but all at once.  The table is cached
+        until the points of the :class:`VMobject` change.
+
+        Parameters
+        ----------
+        sample_points_per_curve
+            Number of sample points per curve used to approximate the length. More points result in a better approximation.
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The ``num_curves + 1`` cumulative lengths.
+        """
+        if sample_points_per_curve is None:
+            sample_points_per_curve = 10
+        cached = self._arc_length_table
+        # The points can be modified in place, so they have to be compared.
+        if (
+            cached is not None
+            and cached[0] == sample_points_per_curve
+            and np.array_equal(cached[1], self.points)
+        ):
+            return cached[2]
+
+        nppcc = self.n_points_per_cubic_curve
+        num_curves = self.get_num_curves()
+        curves = self.points[: nppcc * num_curves].reshape((num_curves, nppcc, -1))
+        basis = _get_bernstein_matrix(nppcc, np.linspace(0, 1, sample_points_per_curve))
+        samples = np.einsum("sk,ckd->csd", basis, curves)
+        lengths = np.linalg.norm(np.diff(samples, axis=1), axis=2).sum(axis=1)
+        table = np.concatenate([[0.0], np.cumsum(lengths)])
+        self._arc_length_table = (sample_points_per_curve, self.points.copy(), table)
+        return table
 
     # Alignment
     def align_points(self, vmobject: VMobject) -> Self:
@@ -1680,30 +1788,72 @@ class VMobject(Mobject):
             if mob.has_new_path_started():
                 mob.add_line_to(mob.get_last_point())
 
+        # Transforming between the same shapes again reuses the alignment.
+        points1, points2 = self.points, vmobject.points
+        cache_key = (
+            self.n_points_per_cubic_curve,
+            self.tolerance_for_point_equality,
+            vmobject.tolerance_for_point_equality,
+            points1.shape,
+            hash(points1.tobytes()),
+            points2.shape,
+            hash(points2.tobytes()),
+        )
+        cached = _ALIGNED_POINTS_CACHE.get(cache_key)
+        if (
+            cached is not None
+            and np.array_equal(cached[0], points1)
+            and np.array_equal(cached[1], points2)
+        ):
+            _ALIGNED_POINTS_CACHE.move_to_end(cache_key)
+            new_path1, new_path2 = cached[2], cached[3]
+        else:
+            new_path1, new_path2 = self._get_aligned_points(vmobject)
+            _ALIGNED_POINTS_CACHE[cache_key] = (
+                points1.copy(),
+                points2.copy(),
+                new_path1,
+                new_path2,
+            )
+            while len(_ALIGNED_POINTS_CACHE) > _MAX_ALIGNED_POINTS_CACHE_SIZE:
+                _ALIGNED_POINTS_CACHE.popitem(last=False)
+        self.set_points(new_path1.copy())
+        vmobject.set_points(new_path2.copy())
+        return self
+
+    def _get_aligned_points(
+        self, vmobject: VMobject
+    ) -> tuple[Point3D_Array, Point3D_Array]:
+        """Compute the points of ``self`` and ``vmobject`` after
+        :meth:`align_points`, without changing them.
+        """
         # Figure out what the subpaths are
         subpaths1 = self.get_subpaths()
         subpaths2 = vmobject.get_subpaths()
         n_subpaths = max(len(subpaths1), len(subpaths2))
         # Start building new ones
-        new_path1 = np.zeros((0, self.dim))
-        new_path2 = np.zeros((0, self.dim))
+        new_subpaths1 = []
+        new_subpaths2 = []
 
         nppcc = self.n_points_per_cubic_curve
+        atol = self.tolerance_for_point_equality
 
         def get_nth_subpath(path_list, n):
             if n >= len(path_list):
                 # Create a null path at the very end
-                return [path_list[-1][-1]] * nppcc
+                return np.repeat(path_list[-1][-1:], nppcc, axis=0)
             path = path_list[n]
-            # Check for useless points at the end of the path and remove them
+            path = path[: len(path) - len(path) % nppcc]
+            # Check for useless points at the end of the path and remove them,
+            # that is curves whose points are all equal to the preceding point
             # https://github.com/ManimCommunity/manim/issues/1959
-            while len(path) > nppcc:
-                # If the last nppc points are all equal to the preceding point
-                if self.consider_points_equals(path[-nppcc:], path[-nppcc - 1]):
-                    path = path[:-nppcc]
-                else:
-                    break
-            return path
+            curves = path.reshape(-1, nppcc, path.shape[1])
+            is_null = np.isclose(curves[1:], curves[:-1, -1:], atol=atol).all(
+                axis=(1, 2)
+            )
+            (not_null,) = np.nonzero(~is_null)
+            n_curves = not_null[-1] + 2 if len(not_null) > 0 else 1
+            return path[: n_curves * nppcc]
 
         for n in range(n_subpaths):
             # For each pair of subpaths, add points until they are the same length
@@ -1711,13 +1861,13 @@ class VMobject(Mobject):
             sp2 = get_nth_subpath(subpaths2, n)
             diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
             diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_path1 = np.append(new_path1, sp1, axis=0)
-            new_path2 = np.append(new_path2, sp2, axis=0)
-        self.set_points(new_path1)
-        vmobject.set_points(new_path2)
-        return self
+            if diff1 > 0:
+                sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
+            if diff2 > 0:
+                sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
+            new_subpaths1.append(sp1)
+            new_subpaths2.append(sp2)
+        return np.concatenate(new_subpaths1), np.concatenate(new_subpaths2)
 
     def insert_n_curves(self, n: int) -> Self:
         """Inserts n curves to the bezier curves of the vmobject.
@@ -1883,26 +2033,27 @@ class VMobject(Mobject):
             )
         else:
             # Allocate space for (upper_index-lower_index+1) Bézier curves.
-            self.points = np.empty((nppc * (upper_index - lower_index + 1), self.dim))
+            points = np.empty((nppc * (upper_index - lower_index + 1), self.dim))
             # Look at the "lower_index"-th Bezier curve and select its part from
             # t=lower_residue to t=1. This is the first curve in self.points.
-            self.points[:nppc] = partial_bezier_points(
+            points[:nppc] = partial_bezier_points(
                 vmobject.points[nppc * lower_index : nppc * (lower_index + 1)],
                 lower_residue,
                 1,
             )
             # If there are more curves between the "lower_index"-th and the
             # "upper_index"-th Béziers, add them all to self.points.
-            self.points[nppc:-nppc] = vmobject.points[
+            points[nppc:-nppc] = vmobject.points[
                 nppc * (lower_index + 1) : nppc * upper_index
             ]
             # Look at the "upper_index"-th Bézier curve and select its part from
             # t=0 to t=upper_residue. This is the last curve in self.points.
-            self.points[-nppc:] = partial_bezier_points(
+            points[-nppc:] = partial_bezier_points(
                 vmobject.points[nppc * upper_index : nppc * (upper_index + 1)],
                 0,
                 upper_residue,
             )
+            self.points = points
 
         return self
 
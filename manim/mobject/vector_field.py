@@ -67,6 +67,11 @@ class VectorField(VGroup):
         The value of the color_scheme function to be mapped to the last color in `colors`. Higher values also result in the last color of the gradient.
     colors
         The colors defining the color gradient of the vector field.
+    vectorized
+        Whether `func` takes an array of positions of shape ``(N, 3)`` and returns
+        the array of the ``N`` vectors at these positions. Such a function lets the
+        whole field be evaluated at once, e.g. when creating :class:`StreamLines`
+        or when nudging mobjects pointwise, which is much faster.
     kwargs
         Additional arguments to be passed to the :class:`~.VGroup` constructor
 
@@ -80,10 +85,12 @@ class VectorField(VGroup):
         min_color_scheme_value: float = 0,
         max_color_scheme_value: float = 2,
         colors: Sequence[ParsableManimColor] = DEFAULT_SCALAR_FIELD_COLORS,
+        vectorized: bool = False,
         **kwargs,
     ):
         super().__init__(**kwargs)
         self.func = func
+        self.vectorized = vectorized
         if color is None:
             self.single_color = False
             if color_scheme is None:
@@ -94,8 +101,7 @@ class VectorField(VGroup):
             self.color_scheme = color_scheme  # TODO maybe other default for direction?
             self.rgbs = np.array(list(map(color_to_rgb, colors)))
 
-            def pos_to_rgb(pos: np.ndarray) -> tuple[float, float, float, float]:
-                vec = self.func(pos)
+            def vec_to_rgb(vec: np.ndarray) -> tuple[float, float, float, float]:
                 color_value = np.clip(
                     self.color_scheme(vec),
                     min_color_scheme_value,
@@ -112,6 +118,10 @@ class VectorField(VGroup):
                 alpha %= 1
                 return interpolate(c1, c2, alpha)
 
+            def pos_to_rgb(pos: np.ndarray) -> tuple[float, float, float, float]:
+                return vec_to_rgb(self.get_vectors([pos])[0])
+
+            self.vec_to_rgb = vec_to_rgb
             self.pos_to_rgb = pos_to_rgb
             self.pos_to_color = lambda pos: rgb_to_color(self.pos_to_rgb(pos))
         else:
@@ -119,6 +129,26 @@ class VectorField(VGroup):
             self.color = ManimColor.parse(color)
         self.submob_movement_updater = None
 
+    def get_vectors(self, points: Sequence[np.ndarray]) -> np.ndarray:
+        """Evaluate the function of the vector field at several positions.
+
+        Parameters
+        ----------
+        points
+            The positions, as an array of shape ``(N, 3)``.
+
+        Returns
+        -------
+        np.ndarray
+            The vectors at these positions, as an array of shape ``(N, 3)``.
+        """
+        points = np.asarray(points, dtype=float)
+        if self.vectorized:
+            return np.asarray(self.func(points), dtype=float).reshape(points.shape)
+        return np.array([self.func(p) for p in points], dtype=float).reshape(
+            points.shape
+        )
+
     @staticmethod
     def shift_func(
         func: Callable[[np.ndarray], np.ndarray],
@@ -251,32 +281,37 @@ class VectorField(VGroup):
 
         """
 
-        def runge_kutta(self, p: Sequence[float], step_size: float) -> float:
-            """Returns the change in position of a point along a vector field.
+        def runge_kutta(self, p: np.ndarray, step_size: float) -> np.ndarray:
+            """Returns the change in position of points along a vector field.
             Parameters
             ----------
             p
-               The position of each point being moved along the vector field.
+               The positions of the points being moved along the vector field,
+               as an array of shape ``(N, 3)``.
             step_size
                A scalar that is used to determine how much a point is shifted in a single step.
 
             Returns
             -------
-            float
-               How much the point is shifted.
+            np.ndarray
+               How much each point is shifted.
             """
-            k_1 = self.func(p)
-            k_2 = self.func(p + step_size * (k_1 * 0.5))
-            k_3 = self.func(p + step_size * (k_2 * 0.5))
-            k_4 = self.func(p + step_size * k_3)
+            k_1 = self.get_vectors(p)
+            k_2 = self.get_vectors(p + step_size * (k_1 * 0.5))
+            k_3 = self.get_vectors(p + step_size * (k_2 * 0.5))
+            k_4 = self.get_vectors(p + step_size * k_3)
             return step_size / 6.0 * (k_1 + 2.0 * k_2 + 2.0 * k_3 + k_4)
 
         step_size = dt / substeps
         for _ in range(substeps):
             if pointwise:
-                mob.apply_function(lambda p: p + runge_kutta(self, p, step_size))
+                # all points of a family member are moved in a single step
+                for submob in mob.family_members_with_points():
+                    submob.set_points(
+                        submob.points + runge_kutta(self, submob.points, step_size)
+                    )
             else:
-                mob.shift(runge_kutta(self, mob.get_center(), step_size))
+                mob.shift(runge_kutta(self, [mob.get_center()], step_size)[0])
         return self
 
     def nudge_submobjects(
@@ -410,7 +445,8 @@ class VectorField(VGroup):
         y_array.repeat(pw, axis=1)  # TODO why not y_array = y_array.repeat(...)?
         points_array[:, :, 0] = x_array
         points_array[:, :, 1] = y_array
-        rgbs = np.apply_along_axis(self.pos_to_rgb, 2, points_array)
+        vectors = self.get_vectors(points_array.reshape(-1, 3))
+        rgbs = np.array([self.vec_to_rgb(vec) for vec in vectors]).reshape(ph, pw, 3)
         return Image.fromarray((rgbs * 255).astype("uint8"))
 
     def get_vectorized_rgba_gradient_function(
@@ -483,6 +519,9 @@ class ArrowVectorField(VectorField):
         A sequence of y_min, y_max, delta_y
     z_range
         A sequence of z_min, z_max, delta_z
+    vectorized
+        Whether `func` evaluates an array of positions of shape ``(N, 3)`` at once,
+        see :class:`VectorField`.
     three_dimensions
         Enables three_dimensions. Default set to False, automatically turns True if
         z_range is not None.
@@ -621,7 +660,7 @@ class ArrowVectorField(VectorField):
             The root point of the vector.
 
         """
-        output = np.array(self.func(point))
+        output = self.get_vectors([point])[0]
         norm = np.linalg.norm(output)
         if norm != 0:
             output *= self.length_func(norm) / norm
@@ -661,6 +700,9 @@ class StreamLines(VectorField):
         A sequence of y_min, y_max, delta_y
     z_range
         A sequence of z_min, z_max, delta_z
+    vectorized
+        Whether `func` evaluates an array of positions of shape ``(N, 3)`` at once,
+        see :class:`VectorField`.
     three_dimensions
         Enables three_dimensions. Default set to False, automatically turns True if
         z_range is not None.
@@ -794,15 +836,11 @@ class StreamLines(VectorField):
             ],
         )
 
+        box_min = np.array([r[0] - self.padding for r in self.ranges])
+        box_max = np.array([r[1] + self.padding - r[2] for r in self.ranges])
+
         def outside_box(p):
-            return (
-                p[0] < self.x_range[0] - self.padding
-                or p[0] > self.x_range[1] + self.padding - self.x_range[2]
-                or p[1] < self.y_range[0] - self.padding
-                or p[1] > self.y_range[1] + self.padding - self.y_range[2]
-                or p[2] < self.z_range[0] - self.padding
-                or p[2] > self.z_range[1] + self.padding - self.z_range[2]
-            )
+            return np.any((p < box_min) | (p > box_max), axis=-1)
 
         max_steps = ceil(virtual_time / dt) + 1
         if not self.single_color:
@@ -813,14 +851,24 @@ class StreamLines(VectorField):
                     max_color_scheme_value,
                     colors,
                 )
-        for point in start_points:
-            points = [point]
-            for _ in range(max_steps):
-                last_point = points[-1]
-                new_point = last_point + dt * func(last_point)
-                if outside_box(new_point):
-                    break
-                points.append(new_point)
+        # All agents move at once; an agent stops at its first step out of the box.
+        start_points = start_points.reshape(-1, 3)
+        trajectories = np.empty((max_steps + 1, *start_points.shape))
+        trajectories[0] = start_points
+        lengths = np.ones(len(start_points), dtype=int)
+        moving = np.arange(len(start_points))
+        for i in range(max_steps):
+            if not len(moving):
+                break
+            last_points = trajectories[i, moving]
+            new_points = last_points + dt * self.get_vectors(last_points)
+            inside = ~outside_box(new_points)
+            moving = moving[inside]
+            trajectories[i + 1, moving] = new_points[inside]
+            lengths[moving] += 1
+
+        for index, length in enumerate(lengths):
+            points = trajectories[:length, index]
             step = max_steps
             if not step:
                 continue
@@ -836,9 +884,7 @@ class StreamLines(VectorField):
                 if config.renderer == RendererType.OPENGL:
                     # scaled for compatibility with cairo
                     line.set_stroke(width=self.stroke_width / 4.0)
-                    norms = np.array(
-                        [np.linalg.norm(self.func(point)) for point in line.points],
-                    )
+                    norms = np.linalg.norm(self.get_vectors(line.points), axis=1)
                     line.set_rgba_array_direct(
                         self.values_to_rgbas(norms, opacity),
                         name="stroke_rgba",
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import math
+import multiprocessing
 import typing
+from collections import deque
 
 import numpy as np
 
@@ -16,6 +19,7 @@ from ..utils.iterables import list_update
 if typing.TYPE_CHECKING:
     import types
     from collections.abc import Iterable
+    from multiprocessing.pool import AsyncResult, Pool
     from typing import Any
 
     from manim.animation.animation import Animation
@@ -23,6 +27,26 @@ if typing.TYPE_CHECKING:
 
 __all__ = ["CairoRenderer"]
 
+# The scene rendered by the worker processes of :meth:`CairoRenderer.render_in_parallel`.
+# Workers are forked, so they inherit it (and the state of all its mobjects and
+# animations) without any pickling.
+_parallel_scene: Scene | None = None
+
+
+def _render_frame_chunk(times: Iterable[float]) -> list[np.ndarray]:
+    """Render the frames at the given times of the current animation.
+
+    This runs in a worker process; it only uses the forked copy of the scene
+    and its camera, never the file writer of the parent process.
+    """
+    scene = _parallel_scene
+    frames = []
+    for t in times:
+        scene.update_to_time(t)
+        scene.renderer.update_frame(scene, scene.moving_mobjects)
+        frames.append(scene.renderer.get_frame())
+    return frames
+
 
 class CairoRenderer:
     """A renderer using Cairo.
@@ -31,6 +55,11 @@ class CairoRenderer:
     time: time elapsed since initialisation of scene.
     """
 
+    #: The largest size in bytes of the frames rendered at once by a worker
+    #: process of :meth:`render_in_parallel`. All the frames of the rendered
+    #: chunks are kept in memory until they are written.
+    max_frame_chunk_bytes = 64 * 1024**2
+
     def __init__(
         self,
         file_writer_class=SceneFileWriter,
@@ -50,6 +79,7 @@ class CairoRenderer:
         self.num_plays = 0
         self.time = 0
         self.static_image = None
+        self.frame_pool: Pool | None = None
 
     def init_scene(self, scene):
         self.file_writer: Any = self._file_writer_class(
@@ -100,23 +130,158 @@ class CairoRenderer:
             {"h": str(self.animations_hashes[:5])},
         )
 
-        self.file_writer.begin_animation(not self.skip_animations)
         scene.begin_animations()
 
         # Save a static image, to avoid rendering non moving objects.
         self.save_static_frame_data(scene, scene.static_mobjects)
 
-        if scene.is_current_animation_frozen_frame():
-            self.update_frame(scene, mobjects=scene.moving_mobjects)
-            # self.duration stands for the total run time of all the animations.
-            # In this case, as there is only a wait, it will be the length of the wait.
-            self.freeze_current_frame(scene.duration)
-        else:
-            scene.play_internal()
+        is_frozen_frame = scene.is_current_animation_frozen_frame()
+        # The worker processes are forked before the file writer starts its
+        # thread, which could otherwise hold a lock (of the logger or of its
+        # queue for instance) that stays locked forever in the workers.
+        if not is_frozen_frame and self.can_render_in_parallel(scene):
+            self.start_frame_processes(scene)
+        try:
+            self.file_writer.begin_animation(not self.skip_animations)
+            if is_frozen_frame:
+                self.update_frame(scene, mobjects=scene.moving_mobjects)
+                # self.duration stands for the total run time of all the animations.
+                # In this case, as there is only a wait, it will be the length of the wait.
+                self.freeze_current_frame(scene.duration)
+            else:
+                scene.play_internal()
+        finally:
+            self.stop_frame_processes()
         self.file_writer.end_animation(not self.skip_animations)
 
         self.num_plays += 1
 
+    def can_render_in_parallel(self, scene: Scene) -> bool:
+        """Whether the frames of the current animation can be rendered
+        by several processes, see :meth:`render_in_parallel`.
+
+        This requires ``config.frame_processes > 1``, the ``fork`` start method
+        and the absence of anything that makes a frame depend on the frames
+        rendered before it: the animations must all be
+        :attr:`~.Animation.is_frame_independent`, and there may be no updaters
+        (of the scene or of any of its mobjects) and no stop condition.
+        Otherwise, the frames are rendered one after the other.
+        """
+        if (
+            config.frame_processes <= 1
+            or self.skip_animations
+            or scene.skip_animation_preview
+        ):
+            return False
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return False
+        if scene.stop_condition is not None or scene.updaters:
+            return False
+        if not all(animation.is_frame_independent for animation in scene.animations):
+            return False
+        animation_mobjects = [
+            mob
+            for animation in scene.animations
+            for mob in animation.get_all_mobjects()
+            if mob is not None
+        ]
+        return not any(
+            mob.get_family_updaters()
+            for mob in [
+                *scene.mobjects,
+                *scene.foreground_mobjects,
+                *animation_mobjects,
+            ]
+        )
+
+    def start_frame_processes(self, scene: Scene) -> None:
+        """Fork the ``config.frame_processes`` worker processes used by
+        :meth:`render_in_parallel` for the current animation.
+
+        Every worker owns a copy of the scene in the state reached after
+        :meth:`.Scene.begin_animations`, including the camera and the static
+        background frame.
+        """
+        global _parallel_scene
+
+        _parallel_scene = scene
+        self.frame_pool = multiprocessing.get_context("fork").Pool(
+            config.frame_processes
+        )
+
+    def stop_frame_processes(self) -> None:
+        """Stop the worker processes started by :meth:`start_frame_processes`,
+        if any.
+        """
+        global _parallel_scene
+
+        if self.frame_pool is not None:
+            self.frame_pool.terminate()
+            self.frame_pool.join()
+            self.frame_pool = None
+        _parallel_scene = None
+
+    def render_in_parallel(
+        self,
+        scene: Scene,
+        times: typing.Sequence[float],
+        progress: typing.Any | None = None,
+    ) -> None:
+        """Render the frames at the given times in the worker processes
+        started by :meth:`start_frame_processes` and add them to the movie in
+        order.
+
+        The time range is split into chunks of consecutive frames, of at most
+        :attr:`max_frame_chunk_bytes`.  Since the animations are
+        :attr:`~.Animation.is_frame_independent`, each worker can jump to the
+        start of its chunk directly.  At most two chunks per worker are
+        rendered or waiting to be written at any time, so that the memory used
+        by the frames does not grow when the encoder is slower than the
+        workers.
+
+        Parameters
+        ----------
+        scene
+            The scene being played.
+        times
+            The times of the frames to render.
+        progress
+            An optional progress bar, updated once per rendered chunk.
+        """
+        processes = min(config.frame_processes, len(times))
+        # a few chunks per process keep the workers busy when some chunks
+        # are more expensive than others
+        chunk_size = max(
+            1,
+            min(
+                math.ceil(len(times) / (4 * processes)),
+                self.max_frame_chunk_bytes // self.camera.pixel_array.nbytes,
+            ),
+        )
+        chunks = [times[i : i + chunk_size] for i in range(0, len(times), chunk_size)]
+        logger.debug(
+            "Rendering %(frames)s frames in %(chunks)s chunks with %(processes)s processes",
+            {"frames": len(times), "chunks": len(chunks), "processes": processes},
+        )
+
+        pending: deque[AsyncResult[list[np.ndarray]]] = deque()
+        next_chunks = iter(chunks)
+        for chunk in next_chunks:
+            pending.append(self.frame_pool.apply_async(_render_frame_chunk, (chunk,)))
+            if len(pending) == 2 * processes:
+                break
+        while pending:
+            frames = pending.popleft().get()
+            chunk = next(next_chunks, None)
+            if chunk is not None:
+                pending.append(
+                    self.frame_pool.apply_async(_render_frame_chunk, (chunk,))
+                )
+            for frame in frames:
+                self.add_frame(frame)
+            if progress is not None:
+                progress.update(len(frames))
+
     def update_frame(  # TODO Description in Docstring
         self,
         scene,
@@ -148,17 +313,28 @@ class CairoRenderer:
                 scene.mobjects,
                 scene.foreground_mobjects,
             )
+        kwargs["include_submobjects"] = include_submobjects
+        if self.camera.track_damaged_regions:
+            background = (
+                self.static_image
+                if self.static_image is not None
+                else self.camera.background
+            )
+            self.camera.redraw_damaged_region(background, mobjects, **kwargs)
+            return
+
         if self.static_image is not None:
             self.camera.set_frame_to_background(self.static_image)
         else:
             self.camera.reset()
 
-        kwargs["include_submobjects"] = include_submobjects
         self.camera.capture_mobjects(mobjects, **kwargs)
 
     def render(self, scene, time, moving_mobjects):
         self.update_frame(scene, moving_mobjects)
-        self.add_frame(self.get_frame())
+        # No need for a copy of the frame, the file writer copies it to its own
+        # frame buffers.
+        self.add_frame(self.camera.pixel_array)
 
     def get_frame(self):
         """
@@ -199,7 +375,7 @@ class CairoRenderer:
         """
         dt = 1 / self.camera.frame_rate
         self.add_frame(
-            self.get_frame(),
+            self.camera.pixel_array,
             num_frames=int(duration / dt),
         )
 
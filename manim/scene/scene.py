@@ -9,11 +9,13 @@ __all__ = ["Scene"]
 import copy
 import datetime
 import inspect
+import itertools as it
 import platform
 import random
 import threading
 import time
 import types
+from collections import Counter
 from queue import Queue
 
 import srt
@@ -86,6 +88,10 @@ class Scene:
     It is not recommended to override the ``__init__`` method in user Scenes.  For code
     that should be ran before a Scene is rendered, use :meth:`Scene.setup` instead.
 
+    Scenes with many mobjects that all have updaters can set
+    :attr:`flat_updater_schedule` to ``True``, for instance in :meth:`Scene.setup`,
+    see :meth:`Scene.update_mobjects`.
+
     Examples
     --------
     Override the :meth:`Scene.construct` method with your code.
@@ -105,9 +111,11 @@ class Scene:
         always_update_mobjects=False,
         random_seed=None,
         skip_animations=False,
+        flat_updater_schedule=False,
     ):
         self.camera_class = camera_class
         self.always_update_mobjects = always_update_mobjects
+        self.flat_updater_schedule = flat_updater_schedule
         self.random_seed = random_seed
         self.skip_animations = skip_animations
 
@@ -344,7 +352,28 @@ class Scene:
         ----------
         dt
             Change in time between updates. Defaults (mostly) to 1/frames_per_second
-        """
+
+        Notes
+        -----
+        By default, each mobject of the scene updates its submobjects recursively.
+        If :attr:`flat_updater_schedule` is ``True``, the updaters of the whole
+        scene are instead called in a single loop over the (cached) families of
+        the mobjects, skipping the members without updaters. This is faster
+        when there are many mobjects, but the submobjects of a mobject whose
+        updating is suspended non-recursively are still updated. The family
+        of each mobject of the scene is gathered after its own updaters ran,
+        as in the recursive update, but changes made by the updaters of its
+        submobjects to the family only take effect on the next frame. It only
+        applies to the Cairo renderer.
+        """
+        if self.flat_updater_schedule and config.renderer == RendererType.CAIRO:
+            for mob in self.mobjects:
+                if mob.updaters:
+                    mob.update(dt, recursive=False)
+                for mobject in mob.get_family()[1:]:
+                    if mobject.updaters:
+                        mobject.update(dt, recursive=False)
+            return
         for mobject in self.mobjects:
             mobject.update(dt)
 
@@ -410,13 +439,10 @@ class Scene:
         """
         # Return only those which are not in the family
         # of another mobject from the scene
-        families = [m.get_family() for m in self.mobjects]
-
-        def is_top_level(mobject):
-            num_families = sum((mobject in family) for family in families)
-            return num_families == 1
-
-        return list(filter(is_top_level, self.mobjects))
+        num_families = Counter(
+            it.chain.from_iterable(m.get_family() for m in self.mobjects)
+        )
+        return [m for m in self.mobjects if num_families[m] == 1]
 
     def get_mobject_family_members(self):
         """
@@ -482,7 +508,7 @@ class Scene:
         return self
 
     def add_mobjects_from_animations(self, animations):
-        curr_mobjects = self.get_mobject_family_members()
+        curr_mobjects = set(self.get_mobject_family_members())
         for animation in animations:
             if animation.is_introducer():
                 continue
@@ -491,7 +517,7 @@ class Scene:
             mob = animation.mobject
             if mob is not None and mob not in curr_mobjects:
                 self.add(mob)
-                curr_mobjects += mob.get_family()
+                curr_mobjects.update(mob.get_family())
 
     def remove(self, *mobjects: Mobject):
         """
@@ -841,15 +867,26 @@ class Scene:
         # as soon as there's one that needs updating of
         # some kind per frame, return the list from that
         # point forward.
-        animation_mobjects = [anim.mobject for anim in animations]
+        animation_mobjects = {anim.mobject for anim in animations}
+        foreground_mobjects = set(self.foreground_mobjects)
         mobjects = self.get_mobject_family_members()
+        # Whether a mobject or one of its submobjects has updaters, computed
+        # once per mobject instead of once per ancestor.
+        has_family_updaters: dict[Mobject, bool] = {}
+
+        def check_family_updaters(mob: Mobject) -> bool:
+            if mob not in has_family_updaters:
+                has_family_updaters[mob] = len(mob.get_updaters()) > 0 or any(
+                    check_family_updaters(sm) for sm in mob.submobjects
+                )
+            return has_family_updaters[mob]
+
         for i, mob in enumerate(mobjects):
-            update_possibilities = [
-                mob in animation_mobjects,
-                len(mob.get_family_updaters()) > 0,
-                mob in self.foreground_mobjects,
-            ]
-            if any(update_possibilities):
+            if (
+                mob in animation_mobjects
+                or check_family_updaters(mob)
+                or mob in foreground_mobjects
+            ):
                 return mobjects[i:]
         return []
 
@@ -1271,13 +1308,24 @@ class Scene:
             self.animations,
             self.duration,
         )
-        for t in self.time_progression:
-            self.update_to_time(t)
-            if not skip_rendering and not self.skip_animation_preview:
-                self.renderer.render(self, t, self.moving_mobjects)
-            if self.stop_condition is not None and self.stop_condition():
-                self.time_progression.close()
-                break
+        if (
+            config.renderer == RendererType.CAIRO
+            and not skip_rendering
+            and not self.skip_animation_preview
+            and self.renderer.frame_pool is not None
+        ):
+            times = self.time_progression.iterable
+            self.renderer.render_in_parallel(self, times, self.time_progression)
+            # Bring the mobjects of this process to the state of the last frame.
+            self.update_to_time(times[-1])
+        else:
+            for t in self.time_progression:
+                self.update_to_time(t)
+                if not skip_rendering and not self.skip_animation_preview:
+                    self.renderer.render(self, t, self.moving_mobjects)
+                if self.stop_condition is not None and self.stop_condition():
+                    self.time_progression.close()
+                    break
 
         for animation in self.animations:
             animation.finish()
@@ -6,6 +6,7 @@ __all__ = ["SceneFileWriter"]
 
 import json
 import shutil
+from fractions import Fraction
 from pathlib import Path
 from queue import Queue
 from tempfile import NamedTemporaryFile
@@ -33,6 +34,7 @@ from ..utils.file_ops import (
     modify_atime,
     write_to_movie,
 )
+from ..utils.render_cache import RenderCache
 from ..utils.sounds import get_full_sound_file_path
 from .section import DefaultSectionType, Section
 
@@ -71,8 +73,18 @@ class SceneFileWriter:
 
     force_output_as_scene_name = False
 
+    #: The number of frames that can wait for the encoder. When they are all
+    #: taken, :meth:`write_frame` blocks until the encoder catches up.
+    frame_buffer_count = 8
+
     def __init__(self, renderer, scene_name, **kwargs):
         self.renderer = renderer
+        self.render_cache: RenderCache | None = None
+        self.frame_buffers: Queue[np.ndarray] | None = None
+        self.writer_exception: Exception | None = None
+        self.movie_container: av.container.OutputContainer | None = None
+        self.movie_stream: av.video.stream.VideoStream | None = None
+        self.movie_duration = Fraction(0)
         self.init_output_directories(scene_name)
         self.init_audio()
         self.frame_count = 0
@@ -155,6 +167,7 @@ class SceneFileWriter:
                     module_name=module_name,
                 ),
             )
+            self.render_cache = RenderCache.from_config()
 
             if config["log_to_file"]:
                 log_dir = guarantee_existence(config.get_dir("log_dir"))
@@ -369,7 +382,10 @@ class SceneFileWriter:
             Whether or not to write to a video file.
         """
         if write_to_movie() and allow_write:
-            self.open_partial_movie_stream(file_path=file_path)
+            if self.encodes_into_movie():
+                self.open_movie_stream()
+            else:
+                self.open_partial_movie_stream(file_path=file_path)
 
     def end_animation(self, allow_write: bool = False):
         """
@@ -382,7 +398,16 @@ class SceneFileWriter:
             Whether or not to write to a video file.
         """
         if write_to_movie() and allow_write:
-            self.close_partial_movie_stream()
+            if self.encodes_into_movie():
+                self.close_movie_stream()
+            else:
+                self.close_partial_movie_stream()
+        if self.is_streaming_to_movie() and not self.encodes_into_movie():
+            # New animations were just written to a partial movie file, which
+            # the cache needs, and cached ones are already there.
+            file_path = self.partial_movie_files[self.renderer.num_plays]
+            if file_path is not None:
+                self.splice_partial_movie_file(file_path)
 
     def listen_and_write(self):
         """For internal use only: blocks until new frame is available on the queue."""
@@ -391,13 +416,33 @@ class SceneFileWriter:
             if frame_data is None:
                 break
 
-            self.encode_and_write_frame(frame_data, num_frames)
+            try:
+                if self.writer_exception is None:
+                    self.encode_and_write_frame(frame_data, num_frames)
+            except Exception as exception:
+                # Raised again by the main thread. The remaining frames are
+                # still taken from the queue, so that write_frame never waits
+                # for a frame buffer forever.
+                self.writer_exception = exception
+            finally:
+                # The frame buffer can now be reused by write_frame.
+                self.frame_buffers.put(frame_data)
 
     def encode_and_write_frame(self, frame: PixelArray, num_frames: int) -> None:
         """
         For internal use only: takes a given frame in ``np.ndarray`` format and
         write it to the stream
         """
+        frame_format = "rgba"
+        if num_frames > 1 and self.video_stream.pix_fmt in ("yuv420p", "argb"):
+            # Frozen frames are converted to the pixel format of the stream
+            # only once; each repetition is then a plain copy of its planes.
+            frame_format = self.video_stream.pix_fmt
+            frame = (
+                av.VideoFrame.from_ndarray(frame, format="rgba")
+                .reformat(format=frame_format)
+                .to_ndarray()
+            )
         for _ in range(num_frames):
             # Notes: precomputing reusing packets does not work!
             # I.e., you cannot do `packets = encode(...)`
@@ -405,7 +450,7 @@ class SceneFileWriter:
             # consumes the packet.
             # The same issue applies for `av_frame`,
             # reusing it renders weird-looking frames.
-            av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+            av_frame = av.VideoFrame.from_ndarray(frame, format=frame_format)
             for packet in self.video_stream.encode(av_frame):
                 self.video_container.mux(packet)
 
@@ -416,6 +461,12 @@ class SceneFileWriter:
         Used internally by Manim to write a frame to
         the FFMPEG input buffer.
 
+        The frame is copied to one of the :attr:`frame_buffer_count` reusable
+        buffers of the writer, hence the caller may modify it right after this
+        call. If all buffers are waiting for the encoder, this blocks until
+        one of them is free. If encoding a previous frame failed, the writer
+        thread is stopped and its exception is raised here.
+
         Parameters
         ----------
         frame_or_renderer
@@ -430,7 +481,11 @@ class SceneFileWriter:
                 else frame_or_renderer
             )
 
-            msg = (num_frames, frame)
+            if self.writer_exception is not None:
+                self.stop_writer_thread()
+            frame_buffer = self.get_frame_buffer(frame)
+            np.copyto(frame_buffer, frame)
+            msg = (num_frames, frame_buffer)
             self.queue.put(msg)
 
         if is_png_format() and not config["dry_run"]:
@@ -448,6 +503,23 @@ class SceneFileWriter:
                 config["zero_pad"],
             )
 
+    def get_frame_buffer(self, frame: np.ndarray) -> np.ndarray:
+        """For internal use only: waits for a free frame buffer matching
+        the shape and type of ``frame``.
+
+        The buffers are allocated with the first frame, and again whenever the
+        size of the frames changes.
+        """
+        if self.frame_buffers is None:
+            self.frame_buffers = Queue()
+            for _ in range(self.frame_buffer_count):
+                self.frame_buffers.put(np.empty_like(frame))
+        frame_buffer = self.frame_buffers.get()
+        if frame_buffer.shape != frame.shape or frame_buffer.dtype != frame.dtype:
+            # The other buffers are replaced as they get taken.
+            frame_buffer = np.empty_like(frame)
+        return frame_buffer
+
     def output_image(self, image: Image.Image, target_dir, ext, zero_pad: bool):
         if zero_pad:
             image.save(f"{target_dir}{str(self.frame_count).zfill(zero_pad)}{ext}")
@@ -490,6 +562,12 @@ class SceneFileWriter:
                 self.flush_cache_directory()
             else:
                 self.clean_cache()
+            if self.render_cache is not None:
+                self.render_cache.evict()
+                logger.debug(
+                    "Render cache statistics: %(stats)s",
+                    {"stats": self.render_cache.get_stats()},
+                )
         elif is_png_format() and not config["dry_run"]:
             target_dir = self.image_file_path.parent / self.image_file_path.stem
             logger.info("\n%i images ready at %s\n", self.frame_count, str(target_dir))
@@ -506,43 +584,70 @@ class SceneFileWriter:
             file_path = self.partial_movie_files[self.renderer.num_plays]
         self.partial_movie_file_path = file_path
 
-        fps = config["frame_rate"]
-        if fps == int(fps):  # fps is integer
-            fps = int(fps)
-
-        partial_movie_file_codec = "libx264"
-        partial_movie_file_pix_fmt = "yuv420p"
+        with av.open(file_path, mode="w") as video_container:
+            self.video_container = video_container
+            self.video_stream = self.add_video_stream(video_container)
+            self.start_writer_thread()
+
+    def add_video_stream(
+        self, container: av.container.OutputContainer
+    ) -> av.video.stream.VideoStream:
+        """Add a video stream encoding frames with the codec and pixel format
+        matching ``config.format`` and ``config.transparent`` to ``container``.
+        """
+        codec = "libx264"
+        pix_fmt = "yuv420p"
         av_options = {
             "an": "1",  # ffmpeg: -an, no audio
             "crf": "23",  # ffmpeg: -crf, constant rate factor (improved bitrate)
         }
 
         if config.format == "webm":
-            partial_movie_file_codec = "libvpx-vp9"
+            codec = "libvpx-vp9"
             av_options["-auto-alt-ref"] = "1"
             if config.transparent:
-                partial_movie_file_pix_fmt = "yuva420p"
+                pix_fmt = "yuva420p"
 
         elif config.transparent:
-            partial_movie_file_codec = "qtrle"
-            partial_movie_file_pix_fmt = "argb"
-
-        with av.open(file_path, mode="w") as video_container:
-            stream = video_container.add_stream(
-                partial_movie_file_codec,
-                rate=config.frame_rate,
-                options=av_options,
-            )
-            stream.pix_fmt = partial_movie_file_pix_fmt
-            stream.width = config.pixel_width
-            stream.height = config.pixel_height
-
-            self.video_container = video_container
-            self.video_stream = stream
+            codec = "qtrle"
+            pix_fmt = "argb"
 
-            self.queue: Queue[tuple[int, PixelArray | None]] = Queue()
-            self.writer_thread = Thread(target=self.listen_and_write, args=())
-            self.writer_thread.start()
+        stream = container.add_stream(
+            codec,
+            rate=config.frame_rate,
+            options=av_options,
+        )
+        stream.pix_fmt = pix_fmt
+        stream.width = config.pixel_width
+        stream.height = config.pixel_height
+        stream.thread_type = "AUTO"
+        stream.thread_count = config.ffmpeg_threads
+        return stream
+
+    def start_writer_thread(self) -> None:
+        """Start the thread encoding the frames sent to :meth:`write_frame`
+        into :attr:`video_stream`.
+        """
+        self.queue: Queue[tuple[int, PixelArray | None]] = Queue()
+        self.writer_exception = None
+        self.writer_thread = Thread(target=self.listen_and_write, args=())
+        self.writer_thread.start()
+
+    def stop_writer_thread(self) -> None:
+        """Wait until the writer thread has encoded all the frames sent to it,
+        and stop it.
+
+        Raises
+        ------
+        Exception
+            The exception raised by the writer thread while encoding a frame,
+            if any.
+        """
+        self.queue.put((-1, None))
+        self.writer_thread.join()
+        if self.writer_exception is not None:
+            exception, self.writer_exception = self.writer_exception, None
+            raise exception
 
     def close_partial_movie_stream(self) -> None:
         """Close the currently opened video container.
@@ -551,8 +656,7 @@ class SceneFileWriter:
         in the video stream holding a partial file, and then close
         the corresponding container.
         """
-        self.queue.put((-1, None))
-        self.writer_thread.join()
+        self.stop_writer_thread()
 
         for packet in self.video_stream.encode():
             self.video_container.mux(packet)
@@ -563,10 +667,122 @@ class SceneFileWriter:
             f"Animation {self.renderer.num_plays} : Partial movie file written in %(path)s",
             {"path": f"'{self.partial_movie_file_path}'"},
         )
+        if self.render_cache is not None and not config.disable_caching:
+            partial_movie_file_path = Path(self.partial_movie_file_path)
+            self.render_cache.store(
+                self.render_cache.get_key(partial_movie_file_path.stem),
+                partial_movie_file_path,
+            )
+
+    def is_streaming_to_movie(self) -> bool:
+        """Whether the animations are written straight into the movie file,
+        see :attr:`.ManimConfig.stream_to_movie`.
+
+        Sections and GIFs are always made by concatenating partial movie files.
+        """
+        return (
+            config.stream_to_movie
+            and write_to_movie()
+            and not is_gif_format()
+            and not config.save_sections
+        )
+
+    def encodes_into_movie(self) -> bool:
+        """Whether the frames are encoded by a single stream of the movie file.
+
+        Otherwise, the partial movie files are still written, since the cache
+        needs them, and each is appended to the movie file once its animation
+        is played.
+        """
+        return self.is_streaming_to_movie() and config.disable_caching
+
+    def get_streamed_movie_file_path(self) -> Path:
+        """Return the path of the movie file while it is being written."""
+        return self.movie_file_path.with_name(
+            f"{self.movie_file_path.stem}_streamed{self.movie_file_path.suffix}"
+        )
+
+    def open_movie_container(self) -> None:
+        """Open the container of the streamed movie file."""
+        self.movie_container = av.open(
+            str(self.get_streamed_movie_file_path()), mode="w"
+        )
+        self.movie_container.metadata["comment"] = (
+            f"Rendered with Manim Community v{__version__}"
+        )
+
+    def open_movie_stream(self) -> None:
+        """Start encoding the frames of an animation into the movie file.
+
+        The stream is opened with the first animation and encodes all the
+        following ones, until :meth:`close_movie_container`.
+        """
+        if self.movie_container is None:
+            self.open_movie_container()
+            self.movie_stream = self.add_video_stream(self.movie_container)
+        self.video_container = self.movie_container
+        self.video_stream = self.movie_stream
+        self.start_writer_thread()
+
+    def close_movie_stream(self) -> None:
+        """Wait until the frames of an animation are encoded into the movie
+        file. The stream itself stays open for the next animations.
+        """
+        self.stop_writer_thread()
+        logger.info(
+            f"Animation {self.renderer.num_plays} : Written in %(path)s",
+            {"path": f"'{self.get_streamed_movie_file_path()}'"},
+        )
+
+    def splice_partial_movie_file(self, file_path: str) -> None:
+        """Append the packets of a partial movie file to the movie file,
+        without decoding them.
+
+        Parameters
+        ----------
+        file_path
+            The partial movie file of the animation that was just played.
+        """
+        with av.open(str(file_path)) as partial_movie_input:
+            partial_movie_stream = partial_movie_input.streams.video[0]
+            if self.movie_container is None:
+                self.open_movie_container()
+                self.movie_stream = self.movie_container.add_stream(
+                    template=partial_movie_stream
+                )
+                if config.transparent and config.format == "webm":
+                    self.movie_stream.pix_fmt = "yuva420p"
+
+            end = 0
+            for packet in partial_movie_input.demux(partial_movie_stream):
+                # We need to skip the "flushing" packets that `demux` generates.
+                if packet.dts is None:
+                    continue
+                end = max(end, packet.pts + packet.duration)
+                # Shift the packet after the animations already in the movie,
+                # and let libav compute the dts.
+                packet.pts += round(self.movie_duration / packet.time_base)
+                packet.dts = None
+                packet.stream = self.movie_stream
+                self.movie_container.mux(packet)
+            self.movie_duration += end * partial_movie_stream.time_base
+
+    def close_movie_container(self, movie_file_path: Path) -> None:
+        """Flush the streamed movie file and move it to ``movie_file_path``."""
+        if self.encodes_into_movie():
+            for packet in self.movie_stream.encode():
+                self.movie_container.mux(packet)
+        self.movie_container.close()
+        self.movie_container = None
+        self.movie_stream = None
+        shutil.move(str(self.get_streamed_movie_file_path()), str(movie_file_path))
 
     def is_already_cached(self, hash_invocation: str):
         """Will check if a file named with `hash_invocation` exists.
 
+        If it does not, but the shared render cache (see :class:`.RenderCache`)
+        holds the file, it is copied to the partial movie directory.
+
         Parameters
         ----------
         hash_invocation
@@ -583,7 +799,13 @@ class SceneFileWriter:
             self.partial_movie_directory
             / f"{hash_invocation}{config['movie_file_extension']}"
         )
-        return path.exists()
+        if path.exists():
+            return True
+        if self.render_cache is not None:
+            return self.render_cache.fetch(
+                self.render_cache.get_key(hash_invocation), path
+            )
+        return False
 
     def combine_files(
         self,
@@ -708,13 +930,16 @@ class SceneFileWriter:
             logger.info("No animations are contained in this scene.")
             return
 
-        logger.info("Combining to Movie file.")
-        self.combine_files(
-            partial_movie_files,
-            movie_file_path,
-            is_gif_format(),
-            self.includes_sound,
-        )
+        if self.movie_container is not None:
+            self.close_movie_container(movie_file_path)
+        else:
+            logger.info("Combining to Movie file.")
+            self.combine_files(
+                partial_movie_files,
+                movie_file_path,
+                is_gif_format(),
+                self.includes_sound,
+            )
 
         # handle sound
         if self.includes_sound and config.format != "gif":
@@ -794,6 +1019,10 @@ class SceneFileWriter:
         self.print_file_ready_message(str(movie_file_path))
         if write_to_movie():
             for file_path in partial_movie_files:
+                # No partial movie files are written when encoding straight
+                # into the movie file.
+                if not Path(file_path).exists():
+                    continue
                 # We have to modify the accessed time so if we have to clean the cache we remove the one used the longest.
                 modify_atime(file_path)
 
@@ -619,6 +619,20 @@ def split_bezier(points: BezierPoints, t: float) -> Point3D_Array:
     return arr.reshape(2 * N, dim)
 
 
+def _get_bernstein_matrix(n_points: int, t: npt.NDArray[float]) -> MatrixMN:
+    """Gets the matrix whose product with the ``n_points`` control points
+    of a Bézier curve are the points of the curve at the parameters ``t``.
+
+    Row ``i`` holds the Bernstein basis polynomials of degree ``n_points - 1``
+    evaluated at ``t[i]``, so the same matrix evaluates many curves at once.
+    """
+    t = np.asarray(t, dtype=float)[:, np.newaxis]
+    n = n_points - 1
+    k = np.arange(n_points)
+    coefficients = np.array([choose(n, i) for i in k])
+    return coefficients * t**k * (1 - t) ** (n - k)
+
+
 # Memos explained in subdivide_bezier docstring
 SUBDIVISION_MATRICES = [{} for i in range(4)]
 
@@ -909,12 +923,28 @@ def bezier_remap(
     np.add.at(split_factors, repeat_indices, 1)
 
     new_tuples = np.empty((new_number_of_curves, nppc, dim))
-    index = 0
-    for curve, sf in zip(bezier_tuples, split_factors):
-        new_tuples[index : index + sf] = subdivide_bezier(curve, sf).reshape(
-            sf, nppc, dim
-        )
-        index += sf
+    if nppc > 4:
+        index = 0
+        for curve, sf in zip(bezier_tuples, split_factors):
+            new_tuples[index : index + sf] = subdivide_bezier(curve, sf).reshape(
+                sf, nppc, dim
+            )
+            index += sf
+        return new_tuples
+
+    # There are at most two different split factors, so all the curves
+    # sharing one are subdivided at once with the same matrix.
+    start_indices = np.cumsum(split_factors) - split_factors
+    for sf in np.unique(split_factors):
+        if sf == 0:
+            continue
+        curve_indices = np.flatnonzero(split_factors == sf)
+        curves = bezier_tuples[curve_indices]
+        if sf > 1:
+            subdivision_matrix = _get_subdivision_matrix(nppc, int(sf))
+            curves = np.einsum("ij,cjd->cid", subdivision_matrix, curves)
+        new_indices = start_indices[curve_indices, np.newaxis] + np.arange(sf)
+        new_tuples[new_indices] = curves.reshape(len(curve_indices), sf, nppc, dim)
 
     return new_tuples
 
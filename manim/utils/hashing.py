@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import collections
 import copy
+import functools
 import inspect
 import json
 import typing
 import zlib
 from time import perf_counter
-from types import FunctionType, MappingProxyType, MethodType, ModuleType
+from types import CodeType, FunctionType, MappingProxyType, MethodType, ModuleType
 from typing import Any
 
 import numpy as np
@@ -32,6 +33,15 @@ KEYS_TO_FILTER_OUT = {
     "background",
     "pixel_array",
     "pixel_array_to_cairo_context",
+    "damaged_region",
+    "damaged_region_background",
+    "_family",
+    "_parents",
+    "_arc_length_table",
+    "_bounding_boxes",
+    "_points_version",
+    "vmobject_to_cairo_path",
+    "vmobject_to_cairo_sources",
 }
 
 
@@ -322,6 +332,130 @@ def get_json(obj: dict):
     return json.dumps(obj, cls=_CustomEncoder)
 
 
+@functools.cache
+def _get_source(code: CodeType) -> str:
+    """Return the source code of a function, cached by its code object.
+
+    This way, the source file of an updater or rate function is read only
+    once per process instead of once per ``play()`` call.
+    """
+    try:
+        return inspect.getsource(code)
+    except (OSError, TypeError):
+        # See _CustomEncoder.default
+        return ""
+
+
+class _StructuralHasher:
+    """Computes the hashes of the objects involved in a ``play()`` call.
+
+    Instead of serializing everything to JSON, the hasher walks the
+    attributes of the objects and feeds them to a running CRC32 checksum.
+    NumPy arrays (points, colors, ...) are hashed from their raw buffer, which
+    is both faster and more exact than their (truncated) ``repr``.
+
+    Every object with attributes -- in particular every mobject -- is hashed
+    only once per hasher: its hash is stored and reused in every other place
+    it is referenced from, e.g. a submobject shared by several families, or
+    the mobject of an animation that is also on screen.  The source code of
+    functions (updaters, rate functions, ...) is cached for the whole process.
+
+    A hasher is meant to be used for a single ``play()`` call, as mobjects can
+    be mutated between two calls.
+    """
+
+    ALREADY_PROCESSED_HASH = zlib.crc32(
+        _Memoizer.ALREADY_PROCESSED_PLACEHOLDER.encode()
+    )
+
+    def __init__(self) -> None:
+        self._hashes: dict[int, int] = {}
+
+    def mark_as_processed(self, obj: Any) -> None:
+        """Prevent the attributes of ``obj`` from being hashed.
+
+        Parameters
+        ----------
+        obj
+            The object to ignore, for instance the scene.
+        """
+        self._hashes[id(obj)] = self.ALREADY_PROCESSED_HASH
+
+    def hash(self, obj: Any) -> int:
+        """Compute the hash of an object and of everything it references.
+
+        Parameters
+        ----------
+        obj
+            The object to hash.
+
+        Returns
+        -------
+        :class:`int`
+            The CRC32 checksum of the object.
+        """
+        return self._update(obj, 0)
+
+    def _update(self, obj: Any, crc: int) -> int:
+        if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+            return zlib.crc32(repr(obj).encode(), crc)
+        if isinstance(obj, np.ndarray):
+            crc = zlib.crc32(f"{obj.dtype}{obj.shape}".encode(), crc)
+            if obj.dtype.hasobject:
+                return self._update(obj.tolist(), crc)
+            return zlib.crc32(np.ascontiguousarray(obj), crc)
+        if isinstance(obj, np.generic):
+            return zlib.crc32(repr(obj.item()).encode(), crc)
+        if isinstance(obj, (list, tuple)):
+            crc = zlib.crc32(b"[", crc)
+            for element in obj:
+                crc = self._update(element, crc)
+            return zlib.crc32(b"]", crc)
+        if isinstance(obj, dict):
+            crc = zlib.crc32(b"{", crc)
+            for key, value in obj.items():
+                if key in KEYS_TO_FILTER_OUT:
+                    continue
+                crc = self._update(value, self._update(key, crc))
+            return zlib.crc32(b"}", crc)
+        return zlib.crc32(self._hash_object(obj).to_bytes(4, "little"), crc)
+
+    def _hash_object(self, obj: Any) -> int:
+        key = id(obj)
+        obj_hash = self._hashes.get(key)
+        if obj_hash is not None:
+            return obj_hash
+        # Circular references hash to the placeholder.
+        self._hashes[key] = self.ALREADY_PROCESSED_HASH
+        if isinstance(obj, (MethodType, FunctionType)):
+            obj_hash = self._hash_function(obj)
+        elif isinstance(obj, ModuleType) or not hasattr(obj, "__dict__"):
+            # Same as _CustomEncoder: only the type of the object is used.
+            obj_hash = zlib.crc32(str(type(obj)).encode())
+        elif isinstance(obj.__dict__, MappingProxyType):
+            obj_hash = zlib.crc32(b"MappingProxy")
+        else:
+            obj_hash = self._update(
+                obj.__dict__,
+                zlib.crc32(type(obj).__qualname__.encode()),
+            )
+        self._hashes[key] = obj_hash
+        return obj_hash
+
+    def _hash_function(self, func: MethodType | FunctionType) -> int:
+        code = getattr(getattr(func, "__func__", func), "__code__", None)
+        if code is None:
+            return zlib.crc32(str(type(func)).encode())
+        crc = zlib.crc32(_get_source(code).encode())
+        cvars = inspect.getclosurevars(func)
+        for name, value in {**cvars.globals, **cvars.nonlocals}.items():
+            # Module objects are skipped, see _CustomEncoder.default.
+            if isinstance(value, ModuleType):
+                continue
+            crc = self._update(value, self._update(name, crc))
+        return crc
+
+
 def get_hash_from_play_call(
     scene_object: Scene,
     camera_object: Camera,
@@ -351,18 +485,15 @@ def get_hash_from_play_call(
     """
     logger.debug("Hashing ...")
     t_start = perf_counter()
-    _Memoizer.mark_as_processed(scene_object)
-    camera_json = get_json(camera_object)
-    animations_list_json = [get_json(x) for x in sorted(animations_list, key=str)]
-    current_mobjects_list_json = [get_json(x) for x in current_mobjects_list]
-    hash_camera, hash_animations, hash_current_mobjects = (
-        zlib.crc32(repr(json_val).encode())
-        for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
-    )
+    hasher = _StructuralHasher()
+    hasher.mark_as_processed(scene_object)
+    hash_camera = hasher.hash(camera_object)
+    hash_animations = hasher.hash(sorted(animations_list, key=str))
+    hash_current_mobjects = hasher.hash(list(current_mobjects_list))
     hash_complete = f"{hash_camera}_{hash_animations}_{hash_current_mobjects}"
     t_end = perf_counter()
     logger.debug("Hashing done in %(time)s s.", {"time": str(t_end - t_start)[:8]})
-    # End of the hashing for the animation, reset all the memoize.
+    # Functions are serialized with get_json, which memoizes what it has processed.
     _Memoizer.reset_already_processed()
     logger.debug("Hash generated :  %(h)s", {"h": hash_complete})
     return hash_complete
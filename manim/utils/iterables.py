@@ -142,7 +142,13 @@ def list_difference_update(l1: Iterable[T], l2: Iterable[T]) -> list[T]:
         >>> list_difference_update([1, 2, 3, 4], [2, 4])
         [1, 3]
     """
-    return [e for e in l1 if e not in l2]
+    l1, l2 = list(l1), list(l2)
+    try:
+        excluded = set(l2)
+        return [e for e in l1 if e not in excluded]
+    except TypeError:
+        # Unhashable elements can only be compared one by one.
+        return [e for e in l1 if e not in l2]
 
 
 def list_update(l1: Iterable[T], l2: Iterable[T]) -> list[T]:
@@ -157,7 +163,8 @@ def list_update(l1: Iterable[T], l2: Iterable[T]) -> list[T]:
         >>> list_update([1, 2, 3], [2, 4, 4])
         [1, 3, 2, 4, 4]
     """
-    return [e for e in l1 if e not in l2] + list(l2)
+    l2 = list(l2)
+    return list_difference_update(l1, l2) + l2
 
 
 @overload
@@ -0,0 +1,226 @@
+"""A content-addressed store of partial movie files, shared between scenes."""
+
+from __future__ import annotations
+
+__all__ = ["RenderCache"]
+
+import os
+import shutil
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from pathlib import Path
+
+from .. import config, logger
+
+
+class RenderCache:
+    """A store of rendered partial movie files, indexed by the hash of the
+    ``play()`` call that produced them.
+
+    Contrary to the partial movie directory of a scene, the store can be shared
+    by any number of scenes and projects: an animation that has been rendered
+    once, in any scene, is never encoded again as long as it stays in the store.
+
+    The files are kept in a single directory, next to an SQLite index that
+    records the size, the last access time and the number of hits of every
+    entry, as well as the total number of hits and misses.  When the total size
+    of the entries exceeds the byte budget, the least recently used entries are
+    evicted.  SQLite transactions make the index safe to use from several
+    render processes at once, and files are only ever published with an atomic
+    rename.
+
+    Parameters
+    ----------
+    directory
+        The directory holding the cached files and the index.
+    max_size
+        The maximum total size of the cached files, in bytes.
+    """
+
+    INDEX_FILE_NAME = "index.sqlite"
+
+    def __init__(self, directory: Path, max_size: float = float("inf")) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.index_path = self.directory / self.INDEX_FILE_NAME
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, size INTEGER, last_access REAL, hits INTEGER)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER)"
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO stats VALUES (?, 0)",
+                [("hits",), ("misses",)],
+            )
+
+    @classmethod
+    def from_config(cls) -> RenderCache | None:
+        """Return the render cache configured by ``config.render_cache_dir``
+        and ``config.max_render_cache_size`` (in megabytes, -1 for no limit),
+        or ``None`` if no directory is set.
+        """
+        directory = config.get_dir("render_cache_dir")
+        if directory is None:
+            return None
+        return cls(directory, config.max_render_cache_size * 1024**2)
+
+    @staticmethod
+    def get_key(hash_invocation: str) -> str:
+        """Return the key of the cached file rendered by a ``play()`` call.
+
+        The hash of a ``play()`` call does not depend on the output settings,
+        which are only encoded in the path of the partial movie directory.
+        They are part of the key instead, since the cache is shared between
+        qualities.
+
+        Parameters
+        ----------
+        hash_invocation
+            The hash of the ``play()`` call, see
+            :func:`~.hashing.get_hash_from_play_call`.
+        """
+        settings = (
+            f"{config.pixel_width}x{config.pixel_height}@{config.frame_rate:g}"
+            f"_{config.format}_{config.transparent}"
+        )
+        return (
+            f"{hash_invocation}_{zlib.crc32(settings.encode())}"
+            f"{config.movie_file_extension}"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        # Waits for the locks held by other render processes.
+        return sqlite3.connect(self.index_path, timeout=60)
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        with closing(self._connect()) as connection, connection:
+            return connection.execute(sql, parameters).fetchall()
+
+    def _count(self, stat: str) -> None:
+        self._execute("UPDATE stats SET value = value + 1 WHERE name = ?", (stat,))
+
+    def fetch(self, key: str, destination: Path) -> bool:
+        """Copy a cached file to ``destination``.
+
+        Parameters
+        ----------
+        key
+            The key of the entry, see :meth:`get_key`.
+        destination
+            Where to put the file.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the entry was in the cache.
+        """
+        rows = self._execute("SELECT key FROM entries WHERE key = ?", (key,))
+        if rows:
+            try:
+                self._publish(self.directory / key, Path(destination))
+            except FileNotFoundError:
+                # Evicted by another process in the meantime.
+                self._execute("DELETE FROM entries WHERE key = ?", (key,))
+            else:
+                self._execute(
+                    "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?",
+                    (time.time(), key),
+                )
+                self._count("hits")
+                return True
+        self._count("misses")
+        return False
+
+    def store(self, key: str, source: Path) -> None:
+        """Add a rendered file to the cache.
+
+        Parameters
+        ----------
+        key
+            The key of the entry, see :meth:`get_key`.
+        source
+            The file to add. It is left in place.
+        """
+        path = self.directory / key
+        self._publish(Path(source), path)
+        self._execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, "
+            "COALESCE((SELECT hits FROM entries WHERE key = ?), 0))",
+            (key, path.stat().st_size, time.time(), key),
+        )
+
+    @staticmethod
+    def _publish(source: Path, destination: Path) -> None:
+        """Atomically copy ``source`` to ``destination``, with a hard link if
+        possible.
+        """
+        temporary = destination.with_name(
+            f".{destination.name}.{os.getpid()}.tmp",
+        )
+        temporary.unlink(missing_ok=True)
+        try:
+            os.link(source, temporary)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            # Hard links are not supported, or the cache is on another device.
+            shutil.copyfile(source, temporary)
+        os.replace(temporary, destination)
+
+    def get_size(self) -> int:
+        """Return the total size of the cached files, in bytes."""
+        return self._execute("SELECT COALESCE(SUM(size), 0) FROM entries")[0][0]
+
+    def get_stats(self) -> dict[str, int]:
+        """Return the number of entries, their total size in bytes and the
+        number of hits and misses of the cache.
+        """
+        stats = dict(self._execute("SELECT name, value FROM stats"))
+        stats["entries"] = self._execute("SELECT COUNT(*) FROM entries")[0][0]
+        stats["size"] = self.get_size()
+        return stats
+
+    def evict(self) -> int:
+        """Remove the least recently used entries until the cache fits in
+        its byte budget.
+
+        Returns
+        -------
+        :class:`int`
+            The number of evicted entries.
+        """
+        with closing(self._connect()) as connection, connection:
+            # Take the write lock right away, so that two processes never
+            # evict the same entries.
+            connection.execute("BEGIN IMMEDIATE")
+            excess = (
+                connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()[0]
+                - self.max_size
+            )
+            evicted = []
+            for key, size in connection.execute(
+                "SELECT key, size FROM entries ORDER BY last_access"
+            ).fetchall():
+                if excess <= 0:
+                    break
+                evicted.append(key)
+                excess -= size
+            connection.executemany(
+                "DELETE FROM entries WHERE key = ?", [(key,) for key in evicted]
+            )
+        for key in evicted:
+            (self.directory / key).unlink(missing_ok=True)
+        if evicted:
+            logger.info(
+                f"The render cache is full (> {self.max_size} bytes). Therefore, "
+                f"manim has removed the {len(evicted)} least recently used file(s).",
+            )
+        return len(evicted)
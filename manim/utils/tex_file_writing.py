@@ -8,18 +8,20 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import os
 import re
 import unicodedata
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from manim.utils.tex import TexTemplate
+from manim.utils.tex import TexTemplate, _texcode_for_environment
 
 from .. import config, logger
 
-__all__ = ["tex_to_svg_file"]
+__all__ = ["tex_to_svg_file", "tex_to_svg_files"]
 
 
 def tex_hash(expression):
@@ -71,6 +73,154 @@ def tex_to_svg_file(
     return svg_file
 
 
+def tex_to_svg_files(
+    expressions: Iterable[str],
+    environment: str | None = None,
+    tex_template: TexTemplate | None = None,
+) -> list[Path]:
+    r"""Takes several tex expressions and returns the svg versions of the compiled tex.
+
+    The expressions which are not cached yet are typeset together, as the pages
+    of a single document, and the pages are then converted to svg files in
+    parallel. This is much faster than typesetting each expression on its own,
+    as the TeX compiler is only started once. The resulting files are the same
+    as the ones written by :func:`tex_to_svg_file`, hence calling this function
+    beforehand (e.g. in :meth:`.Scene.setup`) warms the cache of the
+    :class:`~.MathTex` and :class:`~.Tex` mobjects created later on.
+
+    Batching requires a template typesetting each document with
+    ``\documentclass[preview]{standalone}`` and no custom body; other templates,
+    or a batch which fails to compile, fall back to one document per expression.
+
+    Parameters
+    ----------
+    expressions
+        Strings containing the TeX expressions to be rendered.
+    environment
+        The string containing the environment in which the expressions should be typeset, e.g. ``align*``
+    tex_template
+        Template class used to typesetting. If not set, use default template set via `config["tex_template"]`
+
+    Returns
+    -------
+    list[:class:`Path`]
+        Paths to the generated SVG files, in the order of ``expressions``.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    expressions = list(expressions)
+    svg_files = [
+        generate_tex_file(expression, environment, tex_template).with_suffix(".svg")
+        for expression in expressions
+    ]
+    pending = {
+        svg_file: expression
+        for expression, svg_file in zip(expressions, svg_files)
+        if not svg_file.exists()
+    }
+    if len(pending) > 1 and _get_batch_documentclass(tex_template) is not None:
+        _compile_tex_batch(pending, environment, tex_template)
+    for svg_file, expression in pending.items():
+        if not svg_file.exists():
+            tex_to_svg_file(expression, environment, tex_template)
+    return svg_files
+
+
+def _get_batch_documentclass(tex_template: TexTemplate) -> str | None:
+    r"""Returns the ``\documentclass`` command of a document typesetting each
+    ``standalone`` environment on its own page, or ``None`` if the template
+    cannot be used for batches.
+    """
+    if tex_template._body:
+        return None
+    match = re.fullmatch(
+        r"\\documentclass\[([^\]]*)\]\{standalone\}",
+        tex_template.documentclass.strip(),
+    )
+    if match is None:
+        return None
+    options = [option.strip() for option in match[1].split(",")]
+    if "preview" not in options or any(o.startswith("multi") for o in options):
+        return None
+    return r"\documentclass[" + ",".join([*options, "multi"]) + "]{standalone}"
+
+
+def _compile_tex_batch(
+    pending: dict[Path, str],
+    environment: str | None,
+    tex_template: TexTemplate,
+) -> None:
+    """Typesets the pending expressions as the pages of one document and
+    converts each page to the svg file it is mapped to.
+
+    Errors are not reported: the expressions whose svg file is still missing
+    afterwards are compiled on their own, which reports the errors of the
+    faulty expressions only.
+    """
+    pages = []
+    for expression in pending.values():
+        if environment is not None:
+            begin, end = _texcode_for_environment(environment)
+            expression = "\n".join([begin, expression, end])
+        pages.append(
+            "\n".join(
+                filter(
+                    None,
+                    [
+                        r"\begin{standalone}",
+                        tex_template.post_doc_commands,
+                        expression,
+                        r"\end{standalone}",
+                    ],
+                )
+            )
+        )
+    output = "\n".join(
+        filter(
+            None,
+            [
+                _get_batch_documentclass(tex_template),
+                tex_template.preamble,
+                r"\begin{document}",
+                *pages,
+                r"\end{document}",
+            ],
+        )
+    )
+
+    tex_dir = config.get_dir("tex_dir")
+    tex_file = tex_dir / (tex_hash(output) + ".tex")
+    tex_file.write_text(output, encoding="utf-8")
+    logger.info(
+        "Typesetting %(count)s expressions at once in %(path)s",
+        {"count": len(pages), "path": f"{tex_file}"},
+    )
+    dvi_file = tex_file.with_suffix(tex_template.output_format)
+    command = tex_compilation_command(
+        tex_template.tex_compiler,
+        tex_template.output_format,
+        tex_file,
+        tex_dir,
+    )
+    if dvi_file.exists() or os.system(command) == 0:
+
+        def convert_page(page: int, svg_file: Path) -> None:
+            # a page which failed is typeset again on its own afterwards
+            with contextlib.suppress(ValueError):
+                convert_to_svg(
+                    dvi_file, tex_template.output_format, page, svg_file=svg_file
+                )
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            # consume the results to wait for all conversions
+            list(executor.map(convert_page, range(1, len(pages) + 1), pending))
+    else:
+        logger.debug("Typesetting the expressions at once failed")
+    if not config["no_latex_cleanup"]:
+        tex_file.unlink()
+        delete_nonsvg_files()
+
+
 def generate_tex_file(
     expression: str,
     environment: str | None = None,
@@ -218,7 +368,9 @@ def compile_tex(tex_file: Path, tex_compiler: str, output_format: str) -> Path:
     return result
 
 
-def convert_to_svg(dvi_file: Path, extension: str, page: int = 1):
+def convert_to_svg(
+    dvi_file: Path, extension: str, page: int = 1, svg_file: Path | None = None
+):
     """Converts a .dvi, .xdv, or .pdf file into an svg using dvisvgm.
 
     Parameters
@@ -229,13 +381,16 @@ def convert_to_svg(dvi_file: Path, extension: str, page: int = 1):
         String containing the file extension and thus indicating the file type, e.g. ``.dvi`` or ``.pdf``
     page
         Page to be converted if input file is multi-page.
+    svg_file
+        Path of the SVG file to be generated. Defaults to the path of the input
+        file with an ``.svg`` suffix.
 
     Returns
     -------
     :class:`Path`
         Path to generated SVG file.
     """
-    result = dvi_file.with_suffix(".svg")
+    result = dvi_file.with_suffix(".svg") if svg_file is None else svg_file
     if not result.exists():
         commands = [
             "dvisvgm",
@@ -90,3 +90,30 @@ def test_shift_family():
 
     for m in family:
         np.testing.assert_allclose(positions_before[m] + RIGHT, positions_after[m])
+
+
+def test_family_is_updated_when_submobjects_change():
+    """Check that the cached family follows changes of the submobjects of any
+    family member.
+    """
+    mob, child, gchild = Mobject(), Mobject(), Mobject()
+    other, another = Mobject(), Mobject()
+    mob.add(child)
+    assert mob.get_family() == [mob, child]
+    assert mob.get_family() is mob.get_family()
+
+    child.add(gchild)
+    assert mob.get_family() == [mob, child, gchild]
+    child.submobjects.append(other)
+    assert mob.get_family() == [mob, child, gchild, other]
+    child.submobjects[0] = another
+    assert mob.get_family() == [mob, child, another, other]
+    child.remove(another, other)
+    assert mob.get_family() == [mob, child]
+    mob.submobjects = [other]
+    assert mob.get_family() == [mob, other]
+
+    mob_copy = mob.copy()
+    mob_copy.submobjects.clear()
+    assert mob_copy.get_family() == [mob_copy]
+    assert mob.get_family() == [mob, other]
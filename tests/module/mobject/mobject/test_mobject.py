@@ -3,7 +3,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from manim import DL, UR, Circle, Mobject, Rectangle, Square, VGroup
+from manim import DL, LEFT, RIGHT, UR, Circle, Mobject, Rectangle, Square, VGroup
 
 
 def test_mobject_add():
@@ -168,3 +168,46 @@ def test_mobject_dimensions_has_points_and_children():
     assert inner_rect.width == 2
     assert inner_rect.height == 1
     assert inner_rect.depth == 0
+
+
+def test_mobject_dimensions_follow_changes_of_points():
+    square = Square(side_length=2)
+    inner_group = VGroup(square)
+    outer_group = VGroup(inner_group, Square(side_length=2).shift(3 * LEFT))
+    assert outer_group.width == pytest.approx(5)
+    np.testing.assert_allclose(outer_group.get_right(), [1, 0, 0])
+
+    # Reading the points keeps the cached bounding boxes.
+    assert len(square.points) > 0
+    assert outer_group._bounding_boxes is not None
+
+    # The points cannot be changed in place, which would not reset them.
+    with pytest.raises(ValueError):
+        square.points[:, 0] += 1
+    square.points = square.points + RIGHT
+    assert outer_group._bounding_boxes is None
+    assert outer_group.width == pytest.approx(6)
+    np.testing.assert_allclose(outer_group.get_right(), [2, 0, 0])
+
+    square.points = square.points * 2
+    assert outer_group.height == pytest.approx(4)
+    np.testing.assert_allclose(inner_group.get_top(), [2, 2, 0])
+
+    square.shift(RIGHT)
+    np.testing.assert_allclose(inner_group.get_top(), [3, 2, 0])
+
+    inner_group.add(Square(side_length=2).shift(5 * RIGHT))
+    np.testing.assert_allclose(outer_group.get_right(), [6, 0, 0])
+
+
+def test_mobject_get_merged_array_is_in_pre_order():
+    child = Mobject()
+    child.points = np.array([[1.0, 0, 0]])
+    grandchild = Mobject()
+    grandchild.points = np.array([[2.0, 0, 0]])
+    sibling = Mobject()
+    sibling.points = np.array([[3.0, 0, 0]])
+    child.add(grandchild)
+    mob = Mobject().add(child, sibling)
+
+    np.testing.assert_array_equal(mob.get_all_points()[:, 0], [1, 2, 3])
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from manim import *
+from manim.mobject.svg import svg_mobject
 from tests.helpers.path_utils import get_svg_resource
 
 
@@ -202,3 +205,37 @@ def test_close_command_closes_last_move_not_the_starting_one():
         ),
         decimal=5,
     )
+
+
+def test_svg_geometry_is_cached_on_disk(tmp_path, config):
+    config.media_dir = tmp_path
+    svg_mobject.SVG_HASH_TO_MOB_MAP.clear()
+    svg = SVGMobject(get_svg_resource("heart.svg"))
+    assert list((tmp_path / "svg_cache").glob("*.npz"))
+
+    svg_mobject.SVG_HASH_TO_MOB_MAP.clear()
+    with patch("manim.mobject.svg.svg_mobject.se.SVG.parse") as parse:
+        cached_svg = SVGMobject(get_svg_resource("heart.svg"))
+        parse.assert_not_called()
+    assert len(cached_svg.submobjects) == len(svg.submobjects)
+    for mob, cached_mob in zip(svg.submobjects, cached_svg.submobjects):
+        assert type(cached_mob) is type(mob)
+        np.testing.assert_array_equal(mob.points, cached_mob.points)
+        for attr in ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]:
+            np.testing.assert_array_equal(getattr(mob, attr), getattr(cached_mob, attr))
+        assert mob.stroke_width == cached_mob.stroke_width
+        assert mob.background_stroke_width == cached_mob.background_stroke_width
+        np.testing.assert_array_equal(mob.sheen_direction, cached_mob.sheen_direction)
+
+
+def test_svg_hash_to_mob_map_is_bounded(config, monkeypatch):
+    config.svg_cache_dir = ""
+    monkeypatch.setattr(svg_mobject, "MAX_SVG_HASH_TO_MOB_MAP_SIZE", 2)
+    svg_mobject.SVG_HASH_TO_MOB_MAP.clear()
+    for name in ["heart.svg", "dash.svg", "heart.svg", "cubic_and_lineto.svg"]:
+        SVGMobject(get_svg_resource(name))
+    assert len(svg_mobject.SVG_HASH_TO_MOB_MAP) == 2
+    # the heart was used more recently than the dash, hence it is kept
+    with patch("manim.mobject.svg.svg_mobject.se.SVG.parse") as parse:
+        SVGMobject(get_svg_resource("heart.svg"))
+        parse.assert_not_called()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim import BLUE, RED, MeshSurface, Surface, ThreeDCamera
+
+
+def func(u, v):
+    return np.array([u, v, np.sin(u) * v])
+
+
+def vectorized_func(u, v):
+    return np.stack([u, v, np.sin(u) * v], axis=1)
+
+
+def test_mesh_surface_matches_surface():
+    """Check that the faces of a mesh have the corners of the faces of a Surface."""
+    kwargs = {"u_range": [0, 2], "v_range": [-1, 1], "resolution": (4, 3)}
+    surface = Surface(func, **kwargs)
+    mesh = MeshSurface(func, **kwargs)
+    vectorized_mesh = MeshSurface(vectorized_func, vectorized=True, **kwargs)
+
+    np.testing.assert_allclose(mesh.points, vectorized_mesh.points)
+    assert mesh.get_num_faces() == len(surface) == 12
+    for face, corners in zip(surface, mesh.get_face_corners()):
+        np.testing.assert_allclose(face.get_anchors()[::2], corners, atol=1e-12)
+
+
+def test_mesh_surface_checkerboard():
+    mesh = MeshSurface(vectorized_func, resolution=4, vectorized=True)
+    mesh.set_fill_by_checkerboard(RED, BLUE, opacity=0.5)
+    colors = mesh.fill_rgbas.reshape((4, 4, 4))
+    np.testing.assert_allclose(colors[0, 0], colors[1, 1])
+    np.testing.assert_allclose(colors[0, 1], colors[1, 0])
+    assert not np.allclose(colors[0, 0], colors[0, 1])
+    np.testing.assert_allclose(mesh.fill_rgbas[:, 3], 0.5)
+
+
+def test_mesh_surface_is_rendered():
+    camera = ThreeDCamera(phi=1, theta=1)
+    mesh = MeshSurface(vectorized_func, u_range=[-2, 2], vectorized=True)
+    camera.capture_mobject(mesh)
+    assert camera.pixel_array[..., :3].any()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import numpy as np
+
+from manim import LEFT, UR, Circle, StreamLines, VectorField
+
+
+def func(pos):
+    return np.sin(pos[0]) * UR + np.cos(pos[1]) * LEFT + pos / 5
+
+
+def vectorized_func(points):
+    return np.sin(points[:, [0]]) * UR + np.cos(points[:, [1]]) * LEFT + points / 5
+
+
+def test_vectorized_stream_lines():
+    """Test that a vectorized function gives the same stream lines."""
+    kwargs = {"x_range": [-3, 3, 0.5], "y_range": [-2, 2, 0.5], "color": "#FFFFFF"}
+    lines = StreamLines(func, **kwargs)
+    vectorized_lines = StreamLines(vectorized_func, vectorized=True, **kwargs)
+
+    assert len(lines.stream_lines) == len(vectorized_lines.stream_lines)
+    for line, vectorized_line in zip(lines.stream_lines, vectorized_lines.stream_lines):
+        np.testing.assert_allclose(line.points, vectorized_line.points)
+
+
+def test_vectorized_nudge():
+    """Test that nudging along a vectorized function gives the same result."""
+    circle = Circle()
+    vectorized_circle = circle.copy()
+    VectorField(func).nudge(circle, 0.5, substeps=3, pointwise=True)
+    VectorField(vectorized_func, vectorized=True).nudge(
+        vectorized_circle, 0.5, substeps=3, pointwise=True
+    )
+    np.testing.assert_allclose(circle.points, vectorized_circle.points)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from manim import RED, DecimalNumber, Integer
+import numpy as np
+import pytest
+
+from manim import LEFT, RED, DecimalNumber, Integer
 
 
 def test_font_size():
@@ -47,3 +50,29 @@ def test_color_when_number_of_digits_changes():
     assert all(
         submob.stroke_color.to_hex() == RED.to_hex() for submob in mob.submobjects
     )
+
+
+def test_set_value_reuses_submobjects():
+    """Test that set_value updates the glyphs in place when the number of
+    glyphs does not change, with the same result as creating a new number.
+    """
+    num = DecimalNumber(1.5, unit="m").scale(0.5).shift(LEFT)
+    submobjects = list(num.submobjects)
+    num.set_value(3.75)
+    num.set_value(7.25)
+    assert num.submobjects == submobjects
+
+    expected = DecimalNumber(7.25, unit="m").scale(0.5)
+    expected.move_to(num.get_left(), LEFT)
+    for mob, expected_mob in zip(
+        num.family_members_with_points(), expected.family_members_with_points()
+    ):
+        np.testing.assert_allclose(mob.points, expected_mob.points, atol=1e-6)
+    for mob, expected_mob in zip(num.get_family(), expected.get_family()):
+        assert type(mob) is type(expected_mob)
+        assert getattr(mob, "tex_string", None) == getattr(
+            expected_mob, "tex_string", None
+        )
+    assert [mob.font_size for mob in num.submobjects] == pytest.approx(
+        [mob.font_size for mob in expected.submobjects]
+    )
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
-from manim import MathTex, SingleStringMathTex, Tex, TexTemplate, tempconfig
+from manim import (
+    MathTex,
+    SingleStringMathTex,
+    Tex,
+    TexTemplate,
+    prefetch_tex,
+    tempconfig,
+)
+from manim.mobject.svg import svg_mobject
+from manim.utils import tex_file_writing
 
 
 def test_MathTex(config):
@@ -112,6 +122,41 @@ def test_multi_part_tex_with_empty_parts():
         np.testing.assert_allclose(one_part_glyph.points, multi_part_glyph.points)
 
 
+def test_prefetch_tex(config):
+    """Test that prefetching typesets all parts of a mobject at once."""
+    with patch(
+        "manim.utils.tex_file_writing.compile_tex",
+        wraps=tex_file_writing.compile_tex,
+    ) as compile_tex:
+        prefetch_tex("{{ a }} + {{ b }}", [r"\sqrt{2}", "x"])
+        # the batch document is not compiled by compile_tex
+        compile_tex.assert_not_called()
+        MathTex("{{ a }} + {{ b }}")
+        MathTex(r"\sqrt{2}", "x")
+        compile_tex.assert_not_called()
+
+
+def test_prefetch_tex_glyphs_match_unbatched_tex(tmp_path, config):
+    """Test that the batch document typesets the same glyphs as a document
+    compiled for a single mobject.
+    """
+    tex_strings = [r"\sqrt{2}", "x", r"\frac{a}{b}"]
+    config.media_dir = tmp_path / "unbatched"
+    svg_mobject.SVG_HASH_TO_MOB_MAP.clear()
+    unbatched = MathTex(*tex_strings)
+
+    config.media_dir = tmp_path / "batched"
+    svg_mobject.SVG_HASH_TO_MOB_MAP.clear()
+    prefetch_tex(tex_strings, "y")
+    batched = MathTex(*tex_strings)
+
+    unbatched_glyphs = unbatched.family_members_with_points()
+    batched_glyphs = batched.family_members_with_points()
+    assert len(batched_glyphs) == len(unbatched_glyphs)
+    for unbatched_glyph, batched_glyph in zip(unbatched_glyphs, batched_glyphs):
+        np.testing.assert_allclose(batched_glyph.points, unbatched_glyph.points)
+
+
 def test_tex_size():
     """Check that the size of a :class:`Tex` string is not changed."""
     text = Tex("what").center()
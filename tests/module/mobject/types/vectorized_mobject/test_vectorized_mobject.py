@@ -380,6 +380,22 @@ def test_trim_dummy():
     assert tuple(map(path_length, o2.get_subpaths())) == (2, 2)
 
 
+def test_align_points_reuses_alignment():
+    """Tests that aligning the same shapes again gives the same points,
+    without sharing them between the mobjects.
+    """
+    square, circle = Square(), Circle()
+    square.align_points(circle)
+    expected_square, expected_circle = square.points, circle.points
+
+    square2, circle2 = Square(), Circle()
+    square2.align_points(circle2)
+    np.testing.assert_array_equal(square2.points, expected_square)
+    np.testing.assert_array_equal(circle2.points, expected_circle)
+
+    assert not np.shares_memory(square2.points, square.points)
+
+
 def test_bounded_become():
     """Tests that align_points generates a bounded number of points.
     https://github.com/ManimCommunity/manim/issues/1959
@@ -449,3 +465,30 @@ def test_proportion_from_point():
     abc.scale(0.8)
     props = [abc.proportion_from_point(p) for p in abc.get_vertices()]
     np.testing.assert_allclose(props, [0, 1 / 3, 2 / 3])
+
+
+def test_vmobject_points_from_proportions():
+    obj = VMobject()
+    obj.set_points_as_corners(
+        [
+            np.array([0, 0, 0]),
+            np.array([4, 0, 0]),
+            np.array([4, 2, 0]),
+        ],
+    )
+
+    np.testing.assert_allclose(
+        obj.points_from_proportions([0, 0.5, 5 / 6, 1]),
+        np.array([[0, 0, 0], [3, 0, 0], [4, 1, 0], [4, 2, 0]]),
+        atol=1e-10,
+    )
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        obj.points_from_proportions([0.5, -1])
+
+    # The arc length table follows in-place changes of the points.
+    assert obj.get_arc_length() == pytest.approx(6)
+    obj.points *= 2
+    assert obj.get_arc_length() == pytest.approx(12)
+    np.testing.assert_allclose(
+        obj.point_from_proportion(0.5), np.array([6, 0, 0]), atol=1e-10
+    )
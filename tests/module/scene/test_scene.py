@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import datetime
 
+import numpy as np
 import pytest
 
-from manim import Circle, FadeIn, Group, Mobject, Scene, Square
+from manim import Animation, Circle, FadeIn, Group, Mobject, Scene, Square
 from manim.animation.animation import Wait
 
 
@@ -101,3 +102,80 @@ def test_replace(dry_run):
     scene.replace(second, beta)
     assert_names(scene.mobjects, ["alpha", "group", "fourth"])
     assert_names(scene.mobjects[1], ["beta", "third"])
+
+
+def test_get_top_level_and_moving_mobjects(dry_run):
+    scene = Scene()
+    square, circle, other = Square(), Circle(), Square()
+    group = Group(square, circle)
+    scene.add(group, other)
+    scene.mobjects.append(circle)
+    assert scene.get_top_level_mobjects() == [group, other]
+    scene.mobjects.remove(circle)
+
+    assert scene.get_moving_mobjects(FadeIn(other)) == [other]
+    square.add_updater(lambda m: m)
+    # The updater of the square makes its whole group move.
+    assert scene.get_moving_mobjects() == scene.get_mobject_family_members()
+
+
+def test_scene_bookkeeping_scales_linearly(dry_run):
+    class ComparedMobject(Mobject):
+        comparisons = 0
+
+        def __eq__(self, other):
+            ComparedMobject.comparisons += 1
+            return self is other
+
+        __hash__ = Mobject.__hash__
+
+    num_mobjects = 2_000
+    mobjects = [ComparedMobject() for _ in range(num_mobjects)]
+    for mob in mobjects:
+        mob.points = np.zeros((1, 3))
+    group = Group(*mobjects[::2])
+    scene = Scene()
+    scene.add(group, *mobjects[1::2])
+    animation = Animation(mobjects[-1])
+    ComparedMobject.comparisons = 0
+
+    assert scene.get_top_level_mobjects() == [group, *mobjects[1::2]]
+    moving, static = scene.get_moving_and_static_mobjects([animation])
+    assert moving == [mobjects[-1]]
+    assert static == mobjects[::2] + mobjects[1:-1:2]
+    # Looking mobjects up in lists would compare them with each other about
+    # num_mobjects**2 times.
+    assert ComparedMobject.comparisons < num_mobjects
+
+
+@pytest.mark.parametrize("flat_updater_schedule", [False, True])
+def test_update_mobjects(dry_run, flat_updater_schedule):
+    scene = Scene(flat_updater_schedule=flat_updater_schedule)
+    calls = []
+    square, circle = Square(), Circle()
+    square.add_updater(lambda m, dt: calls.append((m, dt)))
+    circle.add_updater(lambda m: calls.append((m, None)))
+    scene.add(Group(square, Group(circle)))
+    scene.update_mobjects(0.5)
+    assert calls == [(square, 0.5), (circle, None)]
+
+    calls.clear()
+    circle.suspend_updating()
+    scene.update_mobjects(0.5)
+    assert calls == [(square, 0.5)]
+
+
+@pytest.mark.parametrize("flat_updater_schedule", [False, True])
+def test_update_mobjects_after_submobjects_are_replaced(
+    dry_run, flat_updater_schedule
+):
+    scene = Scene(flat_updater_schedule=flat_updater_schedule)
+    calls = []
+    old, new = Square(), Circle()
+    old.add_updater(lambda m: calls.append(m))
+    new.add_updater(lambda m: calls.append(m))
+    group = Group(old)
+    group.add_updater(lambda m: m.remove(old).add(new))
+    scene.add(group)
+    scene.update_mobjects(0.5)
+    assert calls == [new]
@@ -8,6 +8,7 @@ from _subdivision_matrices import SUBDIVISION_MATRICES
 from manim.typing import ManimFloat
 from manim.utils.bezier import (
     _get_subdivision_matrix,
+    bezier_remap,
     get_quadratic_approximation_of_cubic,
     get_smooth_cubic_bezier_handle_points,
     partial_bezier_points,
@@ -100,6 +101,25 @@ def test_subdivide_bezier() -> None:
             )
 
 
+def test_bezier_remap() -> None:
+    """Test that :func:`bezier_remap` subdivides each curve like
+    :func:`subdivide_bezier`, both in the memoized cases and the fallback
+    algorithm.
+    """
+    for n_points in (2, 4, 5):
+        bezier_tuples = np.array(
+            [QUARTIC_BEZIER[:n_points] + [i, 0, 0] for i in range(4)]
+        )
+        # The curves are split into 3, 2, 3 and 2 parts.
+        expected = np.concatenate(
+            [
+                subdivide_bezier(curve, n_divisions)
+                for curve, n_divisions in zip(bezier_tuples, (3, 2, 3, 2))
+            ]
+        ).reshape(10, n_points, 3)
+        nt.assert_allclose(bezier_remap(bezier_tuples, 10), expected)
+
+
 def test_get_smooth_cubic_bezier_handle_points() -> None:
     """Test that :func:`.get_smooth_cubic_bezier_handle_points` returns the
     correct handles, both for open and closed Bézier splines.
@@ -6,7 +6,7 @@ from zlib import crc32
 import pytest
 
 import manim.utils.hashing as hashing
-from manim import Square
+from manim import Circle, Square, VGroup
 
 ALREADY_PROCESSED_PLACEHOLDER = hashing._Memoizer.ALREADY_PROCESSED_PLACEHOLDER
 
@@ -159,3 +159,32 @@ def test_hash_consistency():
     assert_two_objects_produce_same_hash(Square(), Square())
     s = Square()
     assert_two_objects_produce_same_hash(s, s.copy())
+
+
+def structural_hash(obj):
+    return hashing._StructuralHasher().hash(obj)
+
+
+def test_structural_hash_consistency():
+    s = Square()
+    assert structural_hash(Square()) == structural_hash(s)
+    assert structural_hash(s) == structural_hash(s.copy())
+
+
+def test_structural_hash_detects_in_place_changes():
+    s = Square()
+    original_hash = structural_hash(s)
+    points = s.points.copy()
+    points[0, 0] += 1
+    s.points = points
+    assert structural_hash(s) != original_hash
+
+
+def test_structural_hash_of_shared_submobjects():
+    submobject = Square()
+    group = VGroup(submobject, Circle())
+    hasher = hashing._StructuralHasher()
+    group_hash = hasher.hash(group)
+    # the hash of the submobject is memoized and reused
+    assert hasher.hash([submobject, group]) == structural_hash([submobject, group])
+    assert group_hash == structural_hash(group)
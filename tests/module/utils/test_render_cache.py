@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from manim.utils.render_cache import RenderCache
+
+
+def make_file(path: Path, size: int) -> Path:
+    path.write_bytes(b"0" * size)
+    return path
+
+
+def test_render_cache_hit_and_miss(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    cache.store("hash.mp4", make_file(tmp_path / "hash.mp4", 10))
+
+    assert cache.fetch("hash.mp4", tmp_path / "fetched.mp4")
+    assert (tmp_path / "fetched.mp4").read_bytes() == b"0" * 10
+    assert not cache.fetch("other.mp4", tmp_path / "other.mp4")
+    assert not (tmp_path / "other.mp4").exists()
+    assert cache.get_stats() == {"hits": 1, "misses": 1, "entries": 1, "size": 10}
+
+
+def test_render_cache_is_shared(tmp_path):
+    RenderCache(tmp_path / "cache").store(
+        "hash.mp4", make_file(tmp_path / "hash.mp4", 10)
+    )
+    assert RenderCache(tmp_path / "cache").fetch("hash.mp4", tmp_path / "out.mp4")
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(tmp_path / "cache", max_size=25)
+    for name in ["a.mp4", "b.mp4", "c.mp4"]:
+        cache.store(name, make_file(tmp_path / name, 10))
+        time.sleep(0.01)
+    assert cache.fetch("a.mp4", tmp_path / "fetched.mp4")
+
+    assert cache.evict() == 1
+    assert cache.get_size() == 20
+    assert not (tmp_path / "cache" / "b.mp4").exists()
+    assert not cache.fetch("b.mp4", tmp_path / "fetched.mp4")
+    assert cache.fetch("a.mp4", tmp_path / "fetched.mp4")
+    assert cache.fetch("c.mp4", tmp_path / "fetched.mp4")
+
+
+def test_render_cache_key_depends_on_quality(config):
+    key = RenderCache.get_key("hash")
+    config.pixel_height //= 2
+    assert RenderCache.get_key("hash") != key
+
+
+def test_render_cache_without_size_limit(config, tmp_path):
+    config.render_cache_dir = str(tmp_path / "cache")
+    config.max_render_cache_size = -1
+    cache = RenderCache.from_config()
+    cache.store("hash.mp4", make_file(tmp_path / "hash.mp4", 10))
+
+    assert cache.evict() == 0
+    assert cache.fetch("hash.mp4", tmp_path / "fetched.mp4")
@@ -1,6 +1,21 @@
 from __future__ import annotations
 
-from manim import MovingCamera, Square
+import numpy as np
+
+from manim import (
+    BLUE,
+    RED,
+    RIGHT,
+    UP,
+    Camera,
+    ImageMobjectFromCamera,
+    MappingCamera,
+    MovingCamera,
+    MultiCamera,
+    Square,
+    ThreeDCamera,
+    VGroup,
+)
 
 
 def test_movingcamera_auto_zoom():
@@ -9,3 +24,135 @@ def test_movingcamera_auto_zoom():
     margin = 0.5
     camera.auto_zoom([square], margin=margin, animate=False)
     assert camera.frame.height == square.height + margin
+
+
+def test_camera_reuses_path_of_unchanged_vmobject():
+    square = Square()
+    camera = Camera()
+    camera.capture_mobject(square)
+    path = camera.vmobject_to_cairo_path[square][2]
+
+    camera.reset()
+    camera.capture_mobject(square)
+    assert camera.vmobject_to_cairo_path[square][2] is path
+
+    square.shift(RIGHT)
+    camera.reset()
+    camera.capture_mobject(square)
+    assert camera.vmobject_to_cairo_path[square][2] is not path
+
+
+def test_camera_reuses_path_of_moved_vmobject():
+    square = Square().rotate(0.3)
+    camera = Camera()
+    camera.fit_cairo_paths_to_moved_points = True
+    camera.capture_mobject(square)
+    path = camera.vmobject_to_cairo_path[square][2]
+
+    square.shift(RIGHT).scale(0.5)
+    camera.reset()
+    camera.capture_mobject(square)
+    assert camera.vmobject_to_cairo_path[square][2] is path
+
+    fresh_camera = Camera()
+    fresh_camera.capture_mobject(square)
+    np.testing.assert_allclose(
+        camera.pixel_array.astype(int), fresh_camera.pixel_array.astype(int), atol=1
+    )
+
+
+def test_camera_splats_pixels_with_alpha_compositing():
+    camera = Camera()
+    pixel_array = np.zeros((2, 2, 4), dtype="uint8")
+    pixel_array[..., 3] = 255
+    rgbas = np.array([[1, 0, 0, 0.5], [0, 0, 1, 0.5], [0, 1, 0, 1]])
+    camera.splat_pixels(pixel_array, [(np.array([0, 0, 3]), rgbas)])
+
+    np.testing.assert_array_equal(pixel_array[0, 0], [63, 0, 127, 255])
+    np.testing.assert_array_equal(pixel_array[0, 1], [0, 0, 0, 255])
+    np.testing.assert_array_equal(pixel_array[1, 1], [0, 255, 0, 255])
+
+
+def test_camera_culls_mobjects_outside_frame():
+    visible, hidden = Square(), Square().shift(20 * RIGHT)
+    hidden_group = VGroup(Square(), Square()).shift(20 * UP)
+    group = VGroup(visible, hidden, hidden_group)
+
+    camera = Camera()
+    assert camera.get_mobjects_to_display([group]) == [visible]
+    # Mobjects sticking into the frame are kept.
+    hidden.move_to([camera.frame_width / 2 + 0.9, 0, 0])
+    assert camera.get_mobjects_to_display([group]) == [visible, hidden]
+
+    assert len(ThreeDCamera().get_mobjects_to_display([group])) == 4
+
+
+def test_movingcamera_reuses_cairo_context():
+    square = Square()
+    camera = MovingCamera()
+    ctx = camera.get_cairo_context(camera.pixel_array)
+
+    camera.frame.shift(RIGHT).scale(0.5)
+    assert camera.get_cairo_context(camera.pixel_array) is ctx
+    camera.capture_mobject(square)
+
+    fresh_camera = MovingCamera()
+    fresh_camera.frame.shift(RIGHT).scale(0.5)
+    fresh_camera.capture_mobject(square)
+    np.testing.assert_array_equal(camera.pixel_array, fresh_camera.pixel_array)
+
+
+def test_mappingcamera_maps_points_without_copying():
+    square = Square()
+    points = square.points.copy()
+
+    camera = MappingCamera(mapping_func=lambda p: p + RIGHT)
+    camera.capture_mobject(square)
+    vectorized_camera = MappingCamera(
+        mapping_func=lambda points: points + RIGHT, vectorized=True
+    )
+    vectorized_camera.capture_mobject(square)
+
+    np.testing.assert_array_equal(square.points, points)
+    np.testing.assert_array_equal(camera.pixel_array, vectorized_camera.pixel_array)
+    # The right edge of the mapped square is at x = 2, in the middle row.
+    row = camera.pixel_array[camera.pixel_height // 2]
+    column = int((2 / camera.frame_width + 0.5) * camera.pixel_width)
+    assert row[column - 2 : column + 3, :3].any()
+    assert not row[column + 20, :3].any()
+
+
+def test_multicamera_shares_display_list_with_sub_cameras():
+    square = Square()
+    sub_camera = MovingCamera()
+    display = ImageMobjectFromCamera(sub_camera).scale_to_fit_height(2)
+    camera = MultiCamera(image_mobjects_from_cameras=[display])
+
+    camera.capture_mobjects([square, display])
+    sub_pixel_array = sub_camera.pixel_array
+    assert sub_pixel_array[..., :3].any()
+    camera.reset()
+    assert not sub_pixel_array[..., :3].any()
+
+    # The pixel arrays are kept while the size of the display is unchanged.
+    camera.capture_mobjects([square, display])
+    assert sub_camera.pixel_array is sub_pixel_array
+    assert sub_camera.vmobject_to_cairo_path is camera.vmobject_to_cairo_path
+
+
+def test_camera_reuses_gradient_of_unchanged_vmobject():
+    square = Square().set_fill([RED, BLUE], opacity=0.5).set_stroke([BLUE, RED])
+    camera = Camera()
+    camera.capture_mobject(square)
+    sources = dict(camera.vmobject_to_cairo_sources[square])
+    assert len(sources) == 2
+
+    camera.reset()
+    camera.capture_mobject(square)
+    assert camera.vmobject_to_cairo_sources[square] == sources
+
+    square.shift(RIGHT)
+    camera.reset()
+    camera.capture_mobject(square)
+    for key, (_, pattern) in camera.vmobject_to_cairo_sources[square].items():
+        assert pattern is not sources[key][1]
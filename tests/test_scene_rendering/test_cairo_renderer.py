@@ -84,3 +84,121 @@ def test_hash_logic_is_called_when_caching_is_enabled(using_temp_config):
         scene = SquareToCircle()
         scene.render()
         mocked.assert_called_once()
+
+
+def test_hash_does_not_depend_on_previous_play_being_cached(using_temp_config):
+    class TwoPlays(Scene):
+        def construct(self):
+            dot = Dot()
+            self.add(dot)
+            self.play(dot.animate.shift(RIGHT))
+            self.play(dot.animate.shift(UP))
+
+    rendered_scene = TwoPlays()
+    rendered_scene.render()
+    cached_scene = TwoPlays()
+    cached_scene.render()
+
+    # The first play of the second scene is skipped as cached, so its last
+    # frame is drawn at a different time than when it was rendered.
+    assert cached_scene.renderer.animations_hashes == (
+        rendered_scene.renderer.animations_hashes
+    )
+
+
+def render_and_record_frames(scene):
+    frames = []
+    write_frame = scene.renderer.file_writer.write_frame
+
+    def record_frame(frame, num_frames=1):
+        # the frame may be overwritten by the renderer afterwards
+        frames.append(frame.copy())
+        write_frame(frame, num_frames)
+
+    scene.renderer.file_writer.write_frame = record_frame
+    scene.render()
+    return frames
+
+
+def test_render_in_parallel_matches_serial_render(using_temp_config, disabling_caching):
+    config.frame_processes = 1
+    serial_frames = render_and_record_frames(SquareToCircle())
+    config.frame_processes = 3
+    scene = SquareToCircle()
+    # at most two frames per chunk
+    scene.renderer.max_frame_chunk_bytes = 2 * scene.renderer.camera.pixel_array.nbytes
+    scene.renderer.render_in_parallel = Mock(wraps=scene.renderer.render_in_parallel)
+    parallel_frames = render_and_record_frames(scene)
+
+    scene.renderer.render_in_parallel.assert_called_once()
+    assert scene.renderer.frame_pool is None
+    assert len(parallel_frames) == config["frame_rate"]
+    for serial_frame, parallel_frame in zip(serial_frames, parallel_frames):
+        np.testing.assert_array_equal(serial_frame, parallel_frame)
+
+
+def test_render_in_parallel_not_used_with_frame_dependent_animations(
+    using_temp_config, disabling_caching
+):
+    class SceneWithUpdateFromAlphaFunc(Scene):
+        def construct(self):
+            square = Square()
+            # each frame moves the square from where the previous one left it
+            self.play(
+                UpdateFromAlphaFunc(square, lambda m, alpha: m.shift(alpha * RIGHT))
+            )
+
+    config.frame_processes = 1
+    serial_frames = render_and_record_frames(SceneWithUpdateFromAlphaFunc())
+    config.frame_processes = 3
+    scene = SceneWithUpdateFromAlphaFunc()
+    scene.renderer.render_in_parallel = Mock(wraps=scene.renderer.render_in_parallel)
+    parallel_frames = render_and_record_frames(scene)
+
+    scene.renderer.render_in_parallel.assert_not_called()
+    assert len(parallel_frames) == len(serial_frames)
+    for serial_frame, parallel_frame in zip(serial_frames, parallel_frames):
+        assert serial_frame.tobytes() == parallel_frame.tobytes()
+
+
+def test_render_in_parallel_not_used_with_updaters(
+    using_temp_config, disabling_caching
+):
+    config.frame_processes = 2
+
+    class SceneWithUpdater(Scene):
+        def construct(self):
+            square = Square().add_updater(lambda m, dt: m.rotate(dt))
+            self.add(square)
+            self.play(FadeIn(Circle()))
+            assert not self.renderer.can_render_in_parallel(self)
+
+    scene = SceneWithUpdater()
+    scene.renderer.render_in_parallel = Mock()
+    scene.render()
+    scene.renderer.render_in_parallel.assert_not_called()
+
+
+def test_damaged_region_redraw_matches_full_redraw(
+    using_temp_config, disabling_caching
+):
+    class MovingDot(Scene):
+        def construct(self):
+            self.add(Square(side_length=6, fill_opacity=1, color=BLUE))
+            dot = Dot(LEFT * 3, stroke_width=20)
+            self.add(dot)
+            self.play(dot.animate.shift(RIGHT * 6).scale(2))
+
+    scene = MovingDot()
+    scene.renderer.camera.track_damaged_regions = False
+    full_frames = render_and_record_frames(scene)
+    scene = MovingDot()
+    scene.renderer.camera.redraw_damaged_region = Mock(
+        wraps=scene.renderer.camera.redraw_damaged_region
+    )
+    damaged_region_frames = render_and_record_frames(scene)
+
+    scene.renderer.camera.redraw_damaged_region.assert_called()
+    assert len(damaged_region_frames) == len(full_frames)
+    for full_frame, damaged_region_frame in zip(full_frames, damaged_region_frames):
+        np.testing.assert_array_equal(full_frame, damaged_region_frame)
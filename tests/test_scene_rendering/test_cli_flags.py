@@ -249,6 +249,31 @@ def test_a_flag(tmp_path, manim_cfg_file, infallible_scenes_path):
     ), "running manim with -a flag did not render the second scene"
 
 
+@pytest.mark.slow
+def test_a_flag_with_jobs(tmp_path, manim_cfg_file, infallible_scenes_path):
+    command = [
+        sys.executable,
+        "-m",
+        "manim",
+        "-ql",
+        "--media_dir",
+        str(tmp_path),
+        "-a",
+        "--jobs",
+        "3",
+        str(infallible_scenes_path),
+    ]
+    _, err, exit_code = capture(command)
+    assert exit_code == 0, err
+
+    video_dir = tmp_path / "videos" / "infallible_scenes" / "480p15"
+    assert (video_dir / "Wait1.mp4").is_file()
+    assert (video_dir / "Wait3.mp4").is_file()
+    assert (
+        tmp_path / "images" / "infallible_scenes" / f"Wait2_ManimCE_v{__version__}.png"
+    ).is_file()
+
+
 @pytest.mark.slow
 def test_custom_folders(tmp_path, manim_cfg_file, simple_scenes_path):
     scene_name = "SquareToCircle"
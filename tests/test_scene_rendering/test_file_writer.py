@@ -1,11 +1,13 @@
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import av
 import numpy as np
 import pytest
 
 from manim import DR, Circle, Create, Scene, Star, tempconfig
+from manim.scene.scene_file_writer import SceneFileWriter
 from manim.utils.commands import capture, get_video_metadata
 
 
@@ -175,3 +177,58 @@ def test_unicode_partial_movie(tmpdir, simple_scenes_path):
 
     _, err, exit_code = capture(command)
     assert exit_code == 0, err
+
+
+def test_frame_buffers_are_bounded_and_reused(tmp_path):
+    with tempconfig({"media_dir": tmp_path, "quality": "low_quality"}):
+        file_writer = Scene().renderer.file_writer
+        frame = np.zeros((480, 854, 4), dtype=np.uint8)
+        frame_buffers = [
+            file_writer.get_frame_buffer(frame)
+            for _ in range(file_writer.frame_buffer_count)
+        ]
+        assert file_writer.frame_buffers.empty()
+
+        file_writer.frame_buffers.put(frame_buffers[0])
+        assert file_writer.get_frame_buffer(frame) is frame_buffers[0]
+
+        # buffers of the wrong size are replaced
+        file_writer.frame_buffers.put(frame_buffers[1])
+        small_frame = np.zeros((10, 10, 4), dtype=np.uint8)
+        assert file_writer.get_frame_buffer(small_frame).shape == small_frame.shape
+
+
+def test_encoder_exception_is_raised_by_main_thread(tmp_path):
+    config = {"media_dir": tmp_path, "quality": "low_quality", "disable_caching": True}
+    with tempconfig(config), patch.object(
+        SceneFileWriter,
+        "encode_and_write_frame",
+        side_effect=RuntimeError("encoder failed"),
+    ):
+        scene = StarScene()
+        with pytest.raises(RuntimeError, match="encoder failed"):
+            scene.render()
+        # the writer thread does not keep the process alive
+        assert not scene.renderer.file_writer.writer_thread.is_alive()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("disable_caching", [False, True])
+def test_stream_to_movie(tmp_path, disable_caching):
+    output_filename = f"streamed_{'uncached' if disable_caching else 'cached'}"
+    with tempconfig(
+        {
+            "media_dir": tmp_path,
+            "quality": "low_quality",
+            "stream_to_movie": True,
+            "disable_caching": disable_caching,
+            "output_file": output_filename,
+        }
+    ):
+        StarScene().render()
+
+    video_path = tmp_path / "videos" / "480p15" / f"{output_filename}.mp4"
+    metadata = get_video_metadata(video_path)
+    assert metadata["nb_frames"] == "30"
+    assert metadata["duration"] == "2.000000"
+    assert not video_path.with_name(f"{output_filename}_streamed.mp4").exists()